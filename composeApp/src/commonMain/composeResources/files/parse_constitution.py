@@ -15,10 +15,40 @@ It also handles special sections:
 - Schedules (6 special sections with varying formats)
 """
 
+import gzip
 import json
+import lzma
 import re
 import os
-from typing import Dict, List, Any, Optional, Tuple
+import sys
+import importlib
+from contextlib import contextmanager
+from itertools import accumulate
+from bisect import bisect_right
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
+
+# The profiler and batch runner are shared with parser/parse_constitution.py
+PARSER_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), *[os.pardir] * 5, "parser"))
+
+
+def import_shared(name: str):
+    """
+    Import a module shared with parser/parse_constitution.py, or return None
+    when this script runs outside the repository. Only --profile and
+    --batch need one, so a plain parse works standalone.
+    """
+    if PARSER_DIR not in sys.path:
+        sys.path.insert(0, PARSER_DIR)
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+@contextmanager
+def profile_stage(name: str, category: str):
+    """Mark a parse stage. Does nothing unless --profile swaps in parse_profile.profile_stage."""
+    yield
 
 
 # ============================================================================
@@ -176,10 +206,193 @@ ARTICLE_TITLES = {
 }
 
 
+PREAMBLE_START_PATTERN = re.compile(r'We,\s+the\s+people\s+of\s+Kenya', re.IGNORECASE)
+PREAMBLE_END_PATTERN = re.compile(r'CHAPTER\s+ONE', re.IGNORECASE)
+CHAPTER_PATTERN = re.compile(
+    r'CHAPTER\s+(ONE|TWO|THREE|FOUR|FIVE|SIX|SEVEN|EIGHT|NINE|TEN|ELEVEN|TWELVE|THIRTEEN|FOURTEEN|FIFTEEN|SIXTEEN|SEVENTEEN|EIGHTEEN)[—\-–]([^\n]+)',
+    re.IGNORECASE
+)
+CHAPTERS_END_PATTERN = re.compile(r'SCHEDULES?\s+FIRST\s+SCHEDULE', re.IGNORECASE)
+SCHEDULE_HEADER_PATTERN = re.compile(
+    r'(FIRST|SECOND|THIRD|FOURTH|FIFTH|SIXTH) SCHEDULE\s+\(Article', re.IGNORECASE
+)
+SCHEDULES_END_PATTERN = re.compile(r'SUBSIDIARY LEGISLATION', re.IGNORECASE)
+PART_PATTERN = re.compile(r'PART\s+(\d+)[—\-–]([^\n]+)', re.IGNORECASE)
+
+# Article and Sixth Schedule section titles: a capitalised line ending in its
+# only period. This matches exactly what ^([A-Z][^.]+(?:\s+[a-z][^.]*)*)\.$
+# did, since [^.] already covers the optional word group, but without the
+# nested quantifier that backtracked exponentially on long lines with no
+# trailing period.
+TITLE_LINE_PATTERN = re.compile(r'([A-Z][^.]+)\.$')
+# Fifth Schedule "Description (Article 12(3))" line, anchored on its tail so
+# a long line costs one scan for "(Article" instead of one per character
+LEGISLATION_ARTICLE_PATTERN = re.compile(r'\(Article\s*(\d+(?:\s*\([^)]+\))?)\)\s*$', re.IGNORECASE)
+# Whitespace between a schedule heading and "(Article" that includes a tab or
+# line break; the lookahead finds the break so the run is scanned only once
+SCHEDULE_BREAK_PATTERN = r'(?=[^\S\t\n\r]*[\t\n\r])\s*\(Article'
+SCHEDULE_ORDINALS = ['FIRST', 'SECOND', 'THIRD', 'FOURTH', 'FIFTH', 'SIXTH']
+
+
+# ============================================================================
+# Heading Detection
+# ============================================================================
+
+def keyword_trie(words: List[str]) -> Dict:
+    """
+    Build a character trie. The '' key holds the index of the word ending at
+    a node and the None key the smallest word index at or below it.
+    """
+    trie = {}
+    for index, word in enumerate(words):
+        node = trie
+        node.setdefault(None, index)
+        for char in word:
+            node = node.setdefault(char, {})
+            node.setdefault(None, index)
+        node.setdefault('', index)
+    return trie
+
+
+def trie_pattern(trie: Dict, space: str = r'\s+') -> str:
+    """
+    Compile a keyword trie into a regex. Matching at any position costs at
+    most one keyword length, however many keywords there are.
+    """
+    branches = [
+        (space if char == ' ' else re.escape(char)) + trie_pattern(child, space)
+        for char, child in sorted((k, v) for k, v in trie.items() if k)
+    ]
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    # Prefer the longest keyword, falling back to the shorter one
+    return '(?:' + body + ')?' if '' in trie else body
+
+
+# Heading detection scans the lowercased text once for the anchor words every
+# heading contains, then reads the chapter word, part number or schedule
+# ordinal at each anchor with a trie-compiled pattern
+HEADING_ANCHOR_PATTERN = re.compile(r'chapter|part|schedule')
+HEADING_ANCHOR_PATTERN_IGNORECASE = re.compile(r'chapter|part|schedule', re.IGNORECASE)
+CHAPTER_HEADING_PATTERN = re.compile(
+    r'CHAPTER\s+(' + trie_pattern(keyword_trie(list(CHAPTER_WORD_TO_NUM))) + r')', re.IGNORECASE
+)
+PART_HEADING_PATTERN = re.compile(r'PART\s+(\d+)', re.IGNORECASE)
+
+ARTICLE_TITLE_KEYS = list(ARTICLE_TITLES)
+ARTICLE_TITLE_TRIE = keyword_trie(ARTICLE_TITLE_KEYS)
+
+
+def word_before(content: str, pos: int, words: List[str]) -> Optional[Tuple[int, str]]:
+    """
+    Return (start, word) for the first of words that ends right before the
+    whitespace preceding pos.
+    """
+    end = pos
+    while end > 0 and content[end - 1].isspace():
+        end -= 1
+    if end == pos:
+        return None
+    for word in words:
+        start = end - len(word)
+        if start >= 0 and content[start:end].upper() == word:
+            return start, word
+    return None
+
+
+def find_headings(content: str) -> List[Tuple[int, int, str, str]]:
+    """
+    Find every heading candidate in one pass over the document.
+
+    Returns (start, end, kind, key) tuples in document order. kind is
+    "chapter", "part", "schedules" (SCHEDULES FIRST SCHEDULE) or "schedule";
+    key is the chapter word, part number, SCHEDULES/SCHEDULE or the schedule
+    ordinal. Candidates only mark where a heading may start; callers confirm
+    them with the full pattern.
+    """
+    lowered = content.lower()
+    if len(lowered) == len(content):
+        anchors = HEADING_ANCHOR_PATTERN.finditer(lowered)
+    else:
+        # Lowercasing changed the length, so offsets would not line up
+        anchors = HEADING_ANCHOR_PATTERN_IGNORECASE.finditer(content)
+
+    headings = []
+    for anchor in anchors:
+        start = anchor.start()
+        word = anchor.group(0).lower()
+        if word == 'chapter':
+            match = CHAPTER_HEADING_PATTERN.match(content, start)
+            if match:
+                headings.append((start, match.end(), "chapter", match.group(1).upper()))
+        elif word == 'part':
+            match = PART_HEADING_PATTERN.match(content, start)
+            if match:
+                headings.append((start, match.end(), "part", match.group(1)))
+        else:
+            found = word_before(content, start, SCHEDULE_ORDINALS)
+            if not found:
+                continue
+            ordinal_start, ordinal = found
+            if ordinal == 'FIRST':
+                opening = word_before(content, ordinal_start, ['SCHEDULES', 'SCHEDULE'])
+                if opening:
+                    headings.append((opening[0], anchor.end(), "schedules", opening[1]))
+            headings.append((ordinal_start, anchor.end(), "schedule", ordinal))
+    return headings
+
+
+def confirm_headings(pattern: re.Pattern, content: str, offsets) -> List[re.Match]:
+    """
+    Confirm heading candidates with the full heading pattern, returning the
+    non-overlapping matches pattern.finditer would find.
+    """
+    matches = []
+    last_end = 0
+    for offset in offsets:
+        if offset < last_end:
+            continue
+        match = pattern.match(content, offset)
+        if match:
+            matches.append(match)
+            last_end = match.end()
+    return matches
+
+
+def match_article_title(normalized: str) -> Optional[int]:
+    """
+    Find the first ARTICLE_TITLES entry that is a prefix of the title or
+    that the title is a prefix of, walking the title trie once.
+    """
+    best = None
+    node = ARTICLE_TITLE_TRIE
+    for char in normalized:
+        if '' in node:
+            best = node[''] if best is None else min(best, node[''])
+        node = node.get(char)
+        if node is None:
+            break
+    else:
+        # Every known title at or below this node starts with the title
+        best = node[None] if best is None else min(best, node[None])
+    return None if best is None else ARTICLE_TITLES[ARTICLE_TITLE_KEYS[best]]
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
+def open_text(file_path: str):
+    """Open a text file for reading, decompressing .gz and .xz inputs."""
+    lower = file_path.lower()
+    if lower.endswith('.gz'):
+        return gzip.open(file_path, 'rt', encoding='utf-8')
+    if lower.endswith('.xz'):
+        return lzma.open(file_path, 'rt', encoding='utf-8')
+    return open(file_path, 'r', encoding='utf-8')
+
+
 def clean_line(line: str) -> str:
     """Clean a line by stripping and removing page markers."""
     line = line.strip()
@@ -203,9 +416,9 @@ def get_article_number(title: str, last_num: int) -> int:
     if normalized in ARTICLE_TITLES:
         return ARTICLE_TITLES[normalized]
     # Try partial match
-    for known, num in ARTICLE_TITLES.items():
-        if normalized.startswith(known) or known.startswith(normalized):
-            return num
+    num = match_article_title(normalized)
+    if num is not None:
+        return num
     return last_num + 1
 
 
@@ -385,6 +598,21 @@ def parse_clauses(lines: List[str]) -> List[Dict]:
     return clauses
 
 
+def article_title_line(line: str) -> Optional[str]:
+    """The article title a line starts, or None if it is not a title line."""
+    line = clean_line(line)
+    if not line:
+        return None
+    # Skip part headers
+    if line.upper().startswith('PART '):
+        return None
+    # Check for article title (capitalized, ends with period)
+    match = TITLE_LINE_PATTERN.match(line)
+    if match and len(match.group(1)) < 100:
+        return match.group(1)
+    return None
+
+
 def parse_articles(content: str, chapter_num: int) -> List[Dict]:
     """Parse articles from chapter content."""
     articles = []
@@ -393,18 +621,9 @@ def parse_articles(content: str, chapter_num: int) -> List[Dict]:
     # Find article boundaries by looking for capitalized titles ending with period
     article_starts = []
     for i, line in enumerate(lines):
-        line = clean_line(line)
-        if not line:
-            continue
-        # Skip part headers
-        if line.upper().startswith('PART '):
-            continue
-        # Check for article title (capitalized, ends with period)
-        match = re.match(r'^([A-Z][^.]+(?:\s+[a-z][^.]*)*)\.$', line)
-        if match:
-            title = match.group(1)
-            if len(title) < 100:
-                article_starts.append((i, title))
+        title = article_title_line(line)
+        if title:
+            article_starts.append((i, title))
 
     # Parse each article
     last_num = 0
@@ -415,7 +634,8 @@ def parse_articles(content: str, chapter_num: int) -> List[Dict]:
         num = get_article_number(title, last_num)
         last_num = num
 
-        clauses = parse_clauses(article_lines)
+        with profile_stage(f"Article {num}", "article"):
+            clauses = parse_clauses(article_lines)
 
         articles.append({
             "number": num,
@@ -426,92 +646,86 @@ def parse_articles(content: str, chapter_num: int) -> List[Dict]:
     return articles
 
 
-def parse_preamble(content: str) -> str:
-    """Extract preamble text."""
-    # Find preamble after table of contents
-    match = re.search(r'We,\s+the\s+people\s+of\s+Kenya', content, re.IGNORECASE)
-    if not match:
+def parse_preamble(content: str, outline: Optional[Dict] = None) -> str:
+    """
+    Extract preamble text. outline is build_outline(content); without it
+    the preamble is looked up directly.
+    """
+    bounds = outline["preamble"] if outline is not None else preamble_bounds(content)
+    if not bounds:
         return ""
+    return build_preamble(content[bounds[0]:bounds[1]])
+
+
+def preamble_bounds(content: str) -> Optional[Tuple[int, int]]:
+    """
+    Start and end of the preamble: from "We, the people of Kenya" (after
+    the table of contents) to CHAPTER ONE, or 2000 characters if there is
+    no CHAPTER ONE. None when there is no preamble.
+    """
+    match = PREAMBLE_START_PATTERN.search(content)
+    if not match:
+        return None
 
     start = match.start()
     # Find end (CHAPTER ONE)
-    end_match = re.search(r'CHAPTER\s+ONE', content[start:], re.IGNORECASE)
-    if end_match:
-        end = start + end_match.start()
-    else:
-        end = start + 2000
+    end_match = PREAMBLE_END_PATTERN.search(content, start)
+    end = end_match.start() if end_match else start + 2000
+    return start, end
+
 
-    preamble_text = content[start:end]
-    # Clean up
+def build_preamble(preamble_text: str) -> str:
+    """Join the cleaned lines of the preamble text."""
     lines = [clean_line(l) for l in preamble_text.split('\n')]
     lines = [l for l in lines if l]
     return ' '.join(lines)
 
 
-def parse_chapters(content: str) -> List[Dict]:
-    """Parse all chapters."""
+def parse_chapters(content: str, outline: Optional[Dict] = None) -> List[Dict]:
+    """Parse all chapters. outline is build_outline(content), computed when not given."""
     chapters = []
+    if outline is None:
+        outline = build_outline(content)
 
-    # Find preamble location to skip table of contents
-    preamble_match = re.search(r'We,\s+the\s+people\s+of\s+Kenya', content, re.IGNORECASE)
-    if preamble_match:
-        start_pos = preamble_match.start()
-    else:
-        start_pos = 0
-
-    # Find chapter boundaries
-    chapter_pattern = r'CHAPTER\s+(ONE|TWO|THREE|FOUR|FIVE|SIX|SEVEN|EIGHT|NINE|TEN|ELEVEN|TWELVE|THIRTEEN|FOURTEEN|FIFTEEN|SIXTEEN|SEVENTEEN|EIGHTEEN)[—\-–]([^\n]+)'
-
-    matches = list(re.finditer(chapter_pattern, content[start_pos:], re.IGNORECASE))
-
-    # Find where schedules start
-    schedules_match = re.search(r'SCHEDULES?\s+FIRST\s+SCHEDULE', content[start_pos:], re.IGNORECASE)
-    schedules_pos = schedules_match.start() if schedules_match else len(content) - start_pos
-
-    seen = set()
-    for idx, match in enumerate(matches):
-        if match.start() > schedules_pos:
-            break
-
-        chapter_word = match.group(1).upper()
-        chapter_num = CHAPTER_WORD_TO_NUM.get(chapter_word)
-        if not chapter_num or chapter_num in seen:
-            continue
-        seen.add(chapter_num)
-
-        chapter_title = match.group(2).strip()
-
-        # Get chapter content
-        ch_start = match.end()
-        if idx + 1 < len(matches) and matches[idx + 1].start() < schedules_pos:
-            ch_end = matches[idx + 1].start()
-        else:
-            ch_end = schedules_pos
+    for span in outline["chapters"]:
+        chapter_content = content[span["bodyStart"]:span["end"]]
+        chapter_parts = [offset - span["bodyStart"] for offset in span["parts"]]
+        with profile_stage(f"Chapter {span['word']}", "chapter"):
+            chapters.append(build_chapter(span["number"], span["title"], chapter_content, chapter_parts))
 
-        chapter_content = content[start_pos + ch_start:start_pos + ch_end]
+    # Sort by chapter number
+    chapters.sort(key=lambda x: x["number"])
 
-        # Find parts
-        parts = []
-        for part_match in re.finditer(r'PART\s+(\d+)[—\-–]([^\n]+)', chapter_content, re.IGNORECASE):
-            parts.append({
-                "number": int(part_match.group(1)),
-                "title": part_match.group(2).strip()
-            })
+    return chapters
 
-        # Parse articles
-        articles = parse_articles(chapter_content, chapter_num)
 
-        chapters.append({
-            "number": chapter_num,
-            "title": chapter_title,
-            "parts": parts,
-            "articles": articles
+def build_chapter(chapter_num: int, chapter_title: str, chapter_content: str,
+                  part_offsets: Optional[List[int]] = None) -> Dict:
+    """
+    Build a chapter with its parts and articles from the chapter content.
+    part_offsets are the PART heading candidates from find_headings,
+    relative to chapter_content; they are looked up when not given.
+    """
+    if part_offsets is None:
+        part_offsets = [h[0] for h in find_headings(chapter_content) if h[2] == "part"]
+
+    # Find parts
+    parts = []
+    for part_match in confirm_headings(PART_PATTERN, chapter_content, part_offsets):
+        parts.append({
+            "number": int(part_match.group(1)),
+            "title": part_match.group(2).strip()
         })
 
-    # Sort by chapter number
-    chapters.sort(key=lambda x: x["number"])
+    # Parse articles
+    articles = parse_articles(chapter_content, chapter_num)
 
-    return chapters
+    return {
+        "number": chapter_num,
+        "title": chapter_title,
+        "parts": parts,
+        "articles": articles
+    }
 
 
 # ============================================================================
@@ -669,15 +883,15 @@ def parse_schedule_5(content: str) -> Dict:
         # Skip the schedule header itself
         if 'FIFTH SCHEDULE' in line.upper():
             continue
-        match = re.match(r'^(.+?)\s*\(Article\s*(\d+(?:\s*\([^)]+\))?)\)\s*$', line, re.IGNORECASE)
+        match = match_legislation_line(line)
         if match:
             # Save previous pending item if exists
             if pending_item:
                 legislation.append(pending_item)
 
             pending_item = {
-                "description": match.group(1).strip(),
-                "article": match.group(2).strip(),
+                "description": match[0],
+                "article": match[1],
                 "timeSpecification": "",
                 "chapter": current_chapter
             }
@@ -697,6 +911,19 @@ def parse_schedule_5(content: str) -> Dict:
     return {"legislation": legislation}
 
 
+def match_legislation_line(line: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a Fifth Schedule line into (description, article reference), or
+    return None. Takes the first "(Article ...)" after the first character
+    that closes the line, which is what the lazy description pattern used
+    here before picked, with both parts stripped.
+    """
+    match = LEGISLATION_ARTICLE_PATTERN.search(line, 1)
+    if not match:
+        return None
+    return line[:match.start()].strip(), match.group(1).strip()
+
+
 def parse_schedule_6(content: str) -> Dict:
     """Parse Sixth Schedule: Transitional Provisions."""
     sections = []
@@ -728,7 +955,7 @@ def parse_schedule_6(content: str) -> Dict:
             continue
 
         # Section header
-        match = re.match(r'^([A-Z][^.]+(?:\s+[a-z][^.]*)*)\.$', line)
+        match = TITLE_LINE_PATTERN.match(line)
         if match and len(match.group(1)) < 60:
             if current_section:
                 sections.append({
@@ -755,63 +982,183 @@ def parse_schedule_6(content: str) -> Dict:
     return {"sections": sections}
 
 
-def parse_schedules(content: str) -> List[Dict]:
-    """Parse all schedules."""
+SCHEDULE_INFO = [
+    ("FIRST SCHEDULE", 1, "COUNTIES", "Article 6(1)", parse_schedule_1),
+    ("SECOND SCHEDULE", 2, "NATIONAL SYMBOLS", "Article 9(2)", parse_schedule_2),
+    ("THIRD SCHEDULE", 3, "NATIONAL OATHS AND AFFIRMATIONS", "Articles 74, 141(3), 148(5), 152(4)", parse_schedule_3),
+    ("FOURTH SCHEDULE", 4, "DISTRIBUTION OF FUNCTIONS", "Articles 185(2), 186(1), 187(2)", parse_schedule_4),
+    ("FIFTH SCHEDULE", 5, "LEGISLATION TO BE ENACTED BY PARLIAMENT", "Article 261(1)", parse_schedule_5),
+    ("SIXTH SCHEDULE", 6, "TRANSITIONAL AND CONSEQUENTIAL PROVISIONS", "Article 262", parse_schedule_6),
+]
+
+
+def parse_schedules(content: str, outline: Optional[Dict] = None) -> List[Dict]:
+    """Parse all schedules. outline is build_outline(content), computed when not given."""
     schedules = []
+    if outline is None:
+        outline = build_outline(content)
 
-    schedule_info = [
-        ("FIRST SCHEDULE", 1, "COUNTIES", "Article 6(1)", parse_schedule_1),
-        ("SECOND SCHEDULE", 2, "NATIONAL SYMBOLS", "Article 9(2)", parse_schedule_2),
-        ("THIRD SCHEDULE", 3, "NATIONAL OATHS AND AFFIRMATIONS", "Articles 74, 141(3), 148(5), 152(4)", parse_schedule_3),
-        ("FOURTH SCHEDULE", 4, "DISTRIBUTION OF FUNCTIONS", "Articles 185(2), 186(1), 187(2)", parse_schedule_4),
-        ("FIFTH SCHEDULE", 5, "LEGISLATION TO BE ENACTED BY PARLIAMENT", "Article 261(1)", parse_schedule_5),
-        ("SIXTH SCHEDULE", 6, "TRANSITIONAL AND CONSEQUENTIAL PROVISIONS", "Article 262", parse_schedule_6),
-    ]
+    for span in outline["schedules"]:
+        num = span["number"]
+        with profile_stage(f"Schedule {num}", "schedule"):
+            schedules.append(build_schedule(num, content[span["start"]:span["end"]]))
+
+    return schedules
+
+
+SCHEDULE_NUMBERS = {info[0].split()[0]: info[1] for info in SCHEDULE_INFO}
+
+
+def build_schedule(num: int, schedule_content: str) -> Dict:
+    """Build a schedule entry with the parser registered in SCHEDULE_INFO."""
+    _, _, title, ref, parser = SCHEDULE_INFO[num - 1]
+    return {
+        "number": num,
+        "title": title,
+        "reference": ref,
+        "content": parser(schedule_content)
+    }
+
+
+# ============================================================================
+# Document Outline
+# ============================================================================
+
+def build_outline(content: str) -> Dict[str, Any]:
+    """
+    Find every landmark the parse stages need in one pass over the
+    document, so no stage scans the whole text again:
+
+        lineStarts      offset of every line, for line_number
+        preamble        (start, end) of the preamble, or None
+        chapters        number, word, title, start, bodyStart, end and PART
+                        heading candidates of every chapter, first copy only
+        schedules       number, start and end of every schedule found
+        firstArticle    offset of the first article title line, or None
+
+    All offsets index into content. It doubles as a table of contents.
+    """
+    headings = find_headings(content)
+    preamble = preamble_bounds(content)
+
+    # Skip the table of contents before the preamble
+    start_pos = preamble[0] if preamble else 0
+
+    # Find chapter boundaries
+    matches = confirm_headings(
+        CHAPTER_PATTERN, content, (h[0] for h in headings if h[2] == "chapter" and h[0] >= start_pos)
+    )
+
+    # Find where schedules start
+    schedules_pos = next(
+        (h[0] for h in headings if h[2] == "schedules" and h[0] >= start_pos), len(content)
+    )
+    part_offsets = [h[0] for h in headings if h[2] == "part" and h[0] >= start_pos]
+
+    chapters = []
+    seen = set()
+    for idx, match in enumerate(matches):
+        if match.start() > schedules_pos:
+            break
 
+        chapter_word = match.group(1).upper()
+        chapter_num = CHAPTER_WORD_TO_NUM.get(chapter_word)
+        if not chapter_num or chapter_num in seen:
+            continue
+        seen.add(chapter_num)
+
+        ch_start = match.end()
+        if idx + 1 < len(matches) and matches[idx + 1].start() < schedules_pos:
+            ch_end = matches[idx + 1].start()
+        else:
+            ch_end = schedules_pos
+
+        chapters.append({
+            "number": chapter_num,
+            "word": chapter_word,
+            "title": match.group(2).strip(),
+            "start": match.start(),
+            "bodyStart": ch_start,
+            "end": ch_end,
+            "parts": [offset for offset in part_offsets if ch_start <= offset < ch_end]
+        })
+
+    return {
+        "lineStarts": line_starts(content),
+        "preamble": preamble,
+        "chapters": chapters,
+        "schedules": outline_schedules(content, headings),
+        "firstArticle": first_article_offset(content, chapters),
+    }
+
+
+def outline_schedules(content: str, headings: List) -> List[Dict]:
+    """Schedule spans in document order, from the find_headings candidates."""
     # First, find where the main SCHEDULES section starts (after last article, before FIRST SCHEDULE)
-    schedules_section_match = re.search(r'SCHEDULES\s+FIRST\s+SCHEDULE', content, re.IGNORECASE)
-    if schedules_section_match:
-        schedules_start = schedules_section_match.start()
-    else:
+    schedules_start = next(
+        (h[0] for h in headings if h[2] == "schedules" and h[3] == "SCHEDULES"), None
+    )
+    if schedules_start is None:
         # Fallback: find FIRST SCHEDULE after the main content
         schedules_start = len(content) // 2  # Assume schedules are in second half
 
-    # Find schedule positions - only search after schedules_start
-    search_content = content[schedules_start:]
+    # Candidate schedule headings - only search after schedules_start
+    candidates = {}
+    for start, _, kind, ordinal in headings:
+        if kind == "schedule" and start >= schedules_start:
+            candidates.setdefault(ordinal, []).append(start)
+
     positions = []
-    for pattern, num, title, ref, parser in schedule_info:
+    for pattern, num, _, _, _ in SCHEDULE_INFO:
+        offsets = candidates.get(pattern.split()[0], [])
         # Look for schedule header patterns - may have tab or whitespace before (Article
-        header_pattern = rf'{pattern}\s*[\t\n\r]+\s*\(Article'
-        match = re.search(header_pattern, search_content, re.IGNORECASE)
+        header_pattern = re.compile(pattern + SCHEDULE_BREAK_PATTERN, re.IGNORECASE)
+        match = next(filter(None, (header_pattern.match(content, o) for o in offsets)), None)
         if not match:
             # Some schedules have (Article on same line after tab
-            header_pattern = rf'{pattern}\s+\(Article'
-            match = re.search(header_pattern, search_content, re.IGNORECASE)
+            header_pattern = re.compile(rf'{pattern}\s+\(Article', re.IGNORECASE)
+            match = next(filter(None, (header_pattern.match(content, o) for o in offsets)), None)
         if match:
-            positions.append((schedules_start + match.start(), num, title, ref, parser))
+            positions.append((match.start(), num))
 
     positions.sort(key=lambda x: x[0])
 
-    # Extract content for each schedule
-    for i, (start, num, title, ref, parser) in enumerate(positions):
+    schedules = []
+    for i, (start, num) in enumerate(positions):
         if i + 1 < len(positions):
             end = positions[i + 1][0]
         else:
             # End at SUBSIDIARY LEGISLATION or end of content
-            sub_match = re.search(r'SUBSIDIARY LEGISLATION', content[start:], re.IGNORECASE)
-            end = start + sub_match.start() if sub_match else len(content)
+            sub_match = SCHEDULES_END_PATTERN.search(content, start)
+            end = sub_match.start() if sub_match else len(content)
+        schedules.append({"number": num, "start": start, "end": end})
+    return schedules
 
-        schedule_content = content[start:end]
-        parsed = parser(schedule_content)
 
-        schedules.append({
-            "number": num,
-            "title": title,
-            "reference": ref,
-            "content": parsed
-        })
+def line_starts(content: str) -> List[int]:
+    """Offset of the first character of every line."""
+    starts = [0]
+    starts.extend(accumulate(len(line) + 1 for line in content.split('\n')[:-1]))
+    return starts
 
-    return schedules
+
+def line_number(outline: Dict, offset: int) -> int:
+    """The 1-based line of the document that offset falls on."""
+    return bisect_right(outline["lineStarts"], offset)
+
+
+def first_article_offset(content: str, chapters: List[Dict]) -> Optional[int]:
+    """Offset of the first article title line of the first chapter that has one."""
+    for chapter in sorted(chapters, key=lambda ch: ch["bodyStart"]):
+        pos = chapter["bodyStart"]
+        while pos < chapter["end"]:
+            end = content.find('\n', pos, chapter["end"])
+            if end < 0:
+                end = chapter["end"]
+            if article_title_line(content[pos:end]):
+                return pos
+            pos = end + 1
+    return None
 
 
 # ============================================================================
@@ -820,18 +1167,198 @@ def parse_schedules(content: str) -> List[Dict]:
 
 def parse_constitution(file_path: str) -> Dict[str, Any]:
     """Parse the constitution from a text file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
+    with open_text(file_path) as f:
         content = f.read()
 
+    with profile_stage("Outline", "outline"):
+        outline = build_outline(content)
+    with profile_stage("Preamble", "preamble"):
+        preamble = parse_preamble(content, outline)
     result = {
-        "preamble": parse_preamble(content),
-        "chapters": parse_chapters(content),
-        "schedules": parse_schedules(content)
+        "preamble": preamble,
+        "chapters": parse_chapters(content, outline),
+        "schedules": parse_schedules(content, outline)
     }
 
     return result
 
 
+def iter_constitution(lines: Iterable[str]) -> Iterator[Tuple[str, Any]]:
+    """
+    Stream the constitution line by line.
+
+    Yields ("preamble", text), ("chapter", chapter) and ("schedule", schedule)
+    pairs in document order as soon as each section is complete. Only the
+    section being read is buffered, so memory stays bounded by the largest
+    chapter or schedule. Each line is searched together with the next line
+    that has text in it (blank lines in between stay with the first), so
+    that headings split over two lines (e.g. "FIRST SCHEDULE" followed by
+    "(Article 6 (1))") are still found.
+    """
+    state = {
+        "phase": "front",        # front -> chapters -> schedules
+        "carry": 0,              # chars of the next line already consumed
+        "preamble": None,        # preamble chunks while collecting
+        "chapter": None,         # (number, title) of the chapter being read
+        "chapter_buffer": [],
+        "schedule": None,        # number of the schedule being read
+        "schedule_buffer": [],
+        "schedule_size": 0,
+        "schedule_cut": None,    # offset of SUBSIDIARY LEGISLATION in the schedule
+    }
+    seen_chapters = set()
+    seen_schedules = set()
+    finished = []
+
+    def flush_chapter():
+        if state["chapter"] is not None:
+            number, title = state["chapter"]
+            finished.append(("chapter", build_chapter(number, title, ''.join(state["chapter_buffer"]))))
+        state["chapter"] = None
+        state["chapter_buffer"] = []
+
+    def flush_schedule(last: bool):
+        if state["schedule"] is not None:
+            text = ''.join(state["schedule_buffer"])
+            if last and state["schedule_cut"] is not None:
+                text = text[:state["schedule_cut"]]
+            finished.append(("schedule", build_schedule(state["schedule"], text)))
+        state["schedule"] = None
+        state["schedule_buffer"] = []
+        state["schedule_size"] = 0
+        state["schedule_cut"] = None
+
+    def append_schedule(chunk: str):
+        if state["schedule_cut"] is None:
+            end_match = SCHEDULES_END_PATTERN.search(chunk)
+            if end_match:
+                state["schedule_cut"] = state["schedule_size"] + end_match.start()
+        elif len(seen_schedules) == len(SCHEDULE_INFO):
+            # No further schedule can follow, so nothing after the cut is needed
+            return
+        state["schedule_buffer"].append(chunk)
+        state["schedule_size"] += len(chunk)
+
+    def feed_chapters(window: str, start: int, limit: int) -> int:
+        pos = start
+        for match in CHAPTER_PATTERN.finditer(window, start):
+            if match.start() >= limit:
+                break
+            if state["chapter"] is not None:
+                state["chapter_buffer"].append(window[pos:match.start()])
+            flush_chapter()
+            chapter_num = CHAPTER_WORD_TO_NUM.get(match.group(1).upper())
+            if chapter_num and chapter_num not in seen_chapters:
+                seen_chapters.add(chapter_num)
+                state["chapter"] = (chapter_num, match.group(2).strip())
+            pos = match.end()
+        if state["chapter"] is not None and pos < limit:
+            state["chapter_buffer"].append(window[pos:limit])
+        return pos
+
+    def feed_schedules(window: str, start: int, limit: int) -> int:
+        pos = start
+        for match in SCHEDULE_HEADER_PATTERN.finditer(window, start):
+            if match.start() >= limit:
+                break
+            num = SCHEDULE_NUMBERS[match.group(1).upper()]
+            if num in seen_schedules:
+                continue
+            seen_schedules.add(num)
+            if state["schedule"] is not None:
+                append_schedule(window[pos:match.start()])
+            flush_schedule(last=False)
+            state["schedule"] = num
+            pos = match.start()
+        if state["schedule"] is not None:
+            append_schedule(window[pos:limit])
+        return limit
+
+    def feed(window: str, limit: int):
+        start = state["carry"]
+        if state["phase"] == "front":
+            match = PREAMBLE_START_PATTERN.search(window, start)
+            if not match or match.start() >= limit:
+                state["carry"] = 0
+                return
+            state["phase"] = "chapters"
+            state["preamble"] = []
+            front_lines.clear()
+            start = match.start()
+
+        if state["preamble"] is not None:
+            end_match = PREAMBLE_END_PATTERN.search(window, start)
+            if end_match and end_match.start() < limit:
+                state["preamble"].append(window[start:end_match.start()])
+                finished.append(("preamble", build_preamble(''.join(state["preamble"]))))
+                state["preamble"] = None
+            else:
+                state["preamble"].append(window[start:limit])
+
+        if state["phase"] == "chapters":
+            end_match = CHAPTERS_END_PATTERN.search(window, start)
+            if end_match and end_match.start() < limit:
+                feed_chapters(window, start, end_match.start())
+                flush_chapter()
+                state["phase"] = "schedules"
+                start = end_match.start()
+            else:
+                pos = feed_chapters(window, start, limit)
+                # A heading that runs into the next line consumes part of it
+                state["carry"] = max(0, pos - limit)
+                return
+
+        feed_schedules(window, start, limit)
+        state["carry"] = 0
+
+    def run(source: Iterable[str]) -> Iterator[Tuple[str, Any]]:
+        held = None
+        for line in source:
+            if state["phase"] == "front":
+                front_lines.append(line)
+            if held is not None and not line.strip():
+                held += line
+                continue
+            if held is not None:
+                feed(held + line, len(held))
+                yield from finished
+                finished.clear()
+            held = line
+        if held is not None:
+            feed(held, len(held))
+
+    # Lines before the preamble are kept until it is found: without a
+    # preamble the chapters are read from the start of the document.
+    front_lines = []
+    yield from run(lines)
+    if state["phase"] == "front":
+        state["phase"] = "chapters"
+        state["carry"] = 0
+        yield from run(front_lines)
+        yield "preamble", ""
+
+    flush_chapter()
+    flush_schedule(last=True)
+    if state["preamble"] is not None:
+        finished.append(("preamble", build_preamble(''.join(state["preamble"])[:2000])))
+    yield from finished
+
+
+def parse_constitution_stream(file_path: str) -> Dict[str, Any]:
+    """Parse the constitution from a text file without loading it into memory."""
+    result = {"preamble": "", "chapters": [], "schedules": []}
+    with open_text(file_path) as f:
+        for kind, node in iter_constitution(f):
+            if kind == "preamble":
+                result["preamble"] = node
+            else:
+                result[kind + "s"].append(node)
+
+    # Sort by chapter number
+    result["chapters"].sort(key=lambda x: x["number"])
+    return result
+
+
 def validate_result(result: Dict) -> List[str]:
     """Validate parsing results."""
     issues = []
@@ -854,17 +1381,43 @@ def validate_result(result: Dict) -> List[str]:
     return issues
 
 
+# ============================================================================
+# Batch Mode
+# ============================================================================
+
+def main_batch(args) -> int:
+    """Run --batch through parser/parse_batch.py with this parser's parse and validate functions."""
+    batch = import_shared("parse_batch")
+    if batch is None:
+        print(f"Error: --batch needs parse_batch.py from {PARSER_DIR}")
+        return 1
+    parse = parse_constitution_stream if args.stream else parse_constitution
+    return batch.main_batch(args, parse, validate_result)
+
+
 def main():
     """Main entry point."""
     import argparse
+    global profile_stage
 
     parser = argparse.ArgumentParser(description="Parse Constitution of Kenya 2010")
     parser.add_argument('input_file', nargs='?', help="Input text file")
     parser.add_argument('-o', '--output', help="Output JSON file")
     parser.add_argument('-v', '--verbose', action='store_true', help="Verbose output")
+    parser.add_argument('--stream', action='store_true',
+                        help="Read the input line by line instead of loading it into memory")
+    parser.add_argument('--profile', action='store_true',
+                        help="Time each stage and write a Chrome trace and a text summary next to the output")
+    parser.add_argument('--batch', metavar='SOURCE',
+                        help="Parse every text file in a directory or listed in a manifest")
+    parser.add_argument('-j', '--workers', type=int,
+                        help="Worker processes for --batch (default: one per CPU)")
 
     args = parser.parse_args()
 
+    if args.batch:
+        return main_batch(args)
+
     # Find input file
     script_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -884,7 +1437,25 @@ def main():
 
     print(f"Parsing: {input_file}")
 
-    result = parse_constitution(input_file)
+    if args.profile and args.stream:
+        print("Error: --profile works with the default in-memory parse only")
+        return 1
+
+    profiler = import_shared("parse_profile") if args.profile else None
+    if args.profile and profiler is None:
+        print(f"Error: --profile needs parse_profile.py from {PARSER_DIR}")
+        return 1
+
+    if args.stream:
+        result = parse_constitution_stream(input_file)
+    elif args.profile:
+        profile_stage = profiler.profile_stage
+        profiler.start_profile()
+        with profile_stage("parse_constitution", "parse"):
+            result = parse_constitution(input_file)
+        profile_events = profiler.stop_profile()
+    else:
+        result = parse_constitution(input_file)
 
     # Summary
     chapters = result.get("chapters", [])
@@ -911,6 +1482,9 @@ def main():
         json.dump(result, f, indent=2, ensure_ascii=False)
 
     print(f"\nOutput: {output_file}")
+
+    if args.profile:
+        profiler.print_profile(profile_events, output_file)
     return 0
 
 
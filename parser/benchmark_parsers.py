@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for both constitution parsers.
+
+Times parse_preamble, parse_chapters, parse_schedules and the full
+parse_constitution (including reading the file) of parser/parse_constitution.py
+and of the app's composeResources parse_constitution.py, on the input text
+and on copies scaled by repeating the body of every chapter, so the
+article count grows with the scale while the chapter and schedule layout
+stays valid. Reports seconds, MB/s and articles/s, stores the results as a
+JSON baseline and compares a run against a stored baseline, flagging every
+stage that got slower by more than the threshold.
+
+Usage:
+    python benchmark_parsers.py [input_file | --synthetic SEED] [--scales 1,10,100] [--repeat N]
+                                [--save BASELINE] [--baseline BASELINE [--threshold 0.1]]
+                                [--report REPORT]
+"""
+
+import re
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import importlib.util
+from pathlib import Path
+
+
+BENCHMARK_VERSION = 1
+# Changes smaller than this are timer noise, whatever their ratio
+NOISE_FLOOR_SECONDS = 0.002
+
+# Lines that start a chapter, or end the last one (the preamble follows the
+# table of contents' last chapter line, and must not be repeated with it)
+SECTION_START_PATTERN = re.compile(r'^(?:CHAPTER\s+[A-Z]+\s*[-–—]|PREAMBLE\b|SCHEDULES\b|FIRST\s+SCHEDULE\b)', re.MULTILINE)
+
+
+def project_paths() -> dict:
+    """Locations of both parser scripts and the default input text."""
+    project_root = Path(__file__).parent.parent
+    files_dir = project_root / "composeApp" / "src" / "commonMain" / "composeResources" / "files"
+    return {
+        "parser": project_root / "parser" / "parse_constitution.py",
+        "app": files_dir / "parse_constitution.py",
+        "input": files_dir / "The_Constitution_of_Kenya_2010.txt",
+    }
+
+
+def load_engine(name: str, path: Path):
+    """Import a parser script under its own module name (both are parse_constitution.py)."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# ============================================================================
+# Scaled Inputs
+# ============================================================================
+
+def scale_text(text: str, factor: int) -> str:
+    """
+    Repeat the body of every chapter factor times, keeping its heading
+    once. Articles are parsed per chapter, so the output grows to factor
+    times the articles while headings, parts and schedules stay in place.
+    """
+    if factor == 1:
+        return text
+    starts = [m.start() for m in SECTION_START_PATTERN.finditer(text)]
+    if not starts:
+        return text * factor
+
+    pieces = [text[:starts[0]]]
+    for start, end in zip(starts, starts[1:] + [len(text)]):
+        section = text[start:end]
+        if section.startswith('CHAPTER'):
+            body = section.find('\n') + 1
+            pieces.append(section[:body] + section[body:] * factor)
+        else:
+            pieces.append(section)
+    return ''.join(pieces)
+
+
+def count_articles(chapters: list) -> int:
+    """Articles across chapters, whether listed directly or inside parts."""
+    total = 0
+    for chapter in chapters:
+        total += len(chapter.get('articles', []))
+        for part in chapter.get('parts', []):
+            total += len(part.get('articles', []))
+    return total
+
+
+# ============================================================================
+# Timing
+# ============================================================================
+
+def best_run(func, repeat: int) -> tuple:
+    """Best wall time of func over repeat runs, in seconds, with the last result."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def stage_calls(engine_name: str, engine, text: str, path: Path) -> dict:
+    """
+    The four stages of one engine as zero-argument callables. The full
+    stage reads the file too: the app parser only takes a path.
+    """
+    if engine_name == "parser":
+        full = lambda: engine.parse_constitution(engine.read_constitution_text(path))
+    else:
+        full = lambda: engine.parse_constitution(str(path))
+    return {
+        'parse_preamble': lambda: engine.parse_preamble(text),
+        'parse_chapters': lambda: engine.parse_chapters(text),
+        'parse_schedules': lambda: engine.parse_schedules(text),
+        'parse_constitution': full,
+    }
+
+
+def stage_articles(stage: str, result) -> int:
+    """Articles produced by a stage, for articles/s (0 where it produces none)."""
+    if stage == 'parse_chapters':
+        return count_articles(result)
+    if stage == 'parse_constitution':
+        return count_articles(result.get('chapters', []))
+    return 0
+
+
+def run_suite(text: str, engines: dict, scales: list, repeat: int) -> list:
+    """Time every stage of every engine at every scale. Returns result rows."""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in scales:
+            scaled = scale_text(text, scale)
+            path = Path(tmp) / f"scaled_{scale}.txt"
+            path.write_text(scaled, encoding='utf-8')
+            size = len(scaled.encode('utf-8'))
+            # Large inputs are timed once: they are slow and less noisy
+            runs = repeat if scale < 100 else 1
+            for engine_name, engine in engines.items():
+                for stage, call in stage_calls(engine_name, engine, scaled, path).items():
+                    seconds, result = best_run(call, runs)
+                    articles = stage_articles(stage, result)
+                    results.append({
+                        "engine": engine_name,
+                        "stage": stage,
+                        "scale": scale,
+                        "bytes": size,
+                        "seconds": round(seconds, 6),
+                        "mbPerSec": round(size / seconds / 1e6, 3) if seconds else None,
+                        "articles": articles,
+                        "articlesPerSec": round(articles / seconds, 1) if seconds and articles else None,
+                    })
+                    rate = f"{results[-1]['articlesPerSec']:>12,.0f} art/s" if results[-1]['articlesPerSec'] else ""
+                    print(f"  {engine_name:<8}{stage:<20}{scale:>6}x{seconds * 1000:>12.1f} ms"
+                          f"{results[-1]['mbPerSec'] or 0:>10.2f} MB/s{rate}")
+    return results
+
+
+# ============================================================================
+# Baselines
+# ============================================================================
+
+def save_baseline(results: list, input_name: str, output_path: Path):
+    """Store a run, with enough context to tell whether a comparison is fair."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    baseline = {
+        "version": BENCHMARK_VERSION,
+        "created": time.strftime('%Y-%m-%dT%H:%M:%S'),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "input": input_name,
+        "results": results,
+    }
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2)
+
+
+def load_baseline(baseline_path: Path) -> dict:
+    """Load a baseline written by save_baseline."""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get("version") != BENCHMARK_VERSION:
+        raise ValueError(f"Unsupported benchmark baseline version {baseline.get('version')}")
+    return baseline
+
+
+def compare_results(baseline: dict, results: list, threshold: float) -> list:
+    """
+    Match a run against a baseline by engine, stage and scale. Each row
+    carries the old and new seconds, their ratio, and a status: "regression"
+    when new time exceeds old by more than threshold, "improvement" when it
+    is under by more than threshold, "ok" otherwise, "new" if unmatched.
+    Differences under NOISE_FLOOR_SECONDS are always "ok".
+    """
+    old = {(r["engine"], r["stage"], r["scale"]): r for r in baseline["results"]}
+    rows = []
+    for result in results:
+        key = (result["engine"], result["stage"], result["scale"])
+        before = old.get(key)
+        row = {
+            "engine": result["engine"],
+            "stage": result["stage"],
+            "scale": result["scale"],
+            "seconds": result["seconds"],
+            "baselineSeconds": before["seconds"] if before else None,
+            "ratio": None,
+            "status": "new",
+        }
+        if before and before["seconds"]:
+            ratio = result["seconds"] / before["seconds"]
+            row["ratio"] = round(ratio, 3)
+            if abs(result["seconds"] - before["seconds"]) < NOISE_FLOOR_SECONDS:
+                row["status"] = "ok"
+            elif ratio > 1 + threshold:
+                row["status"] = "regression"
+            elif ratio < 1 - threshold:
+                row["status"] = "improvement"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+
+def print_comparison(rows: list, baseline: dict, threshold: float):
+    """Print the comparison report, regressions first."""
+    print()
+    print("=" * 60)
+    print(f"Comparison against baseline from {baseline.get('created', '?')} (threshold {threshold:.0%})")
+    print("=" * 60)
+    order = {"regression": 0, "improvement": 1, "new": 2, "ok": 3}
+    for row in sorted(rows, key=lambda r: (order[r["status"]], r["engine"], r["stage"], r["scale"])):
+        before = f"{row['baselineSeconds'] * 1000:>10.1f}" if row["baselineSeconds"] is not None else f"{'-':>10}"
+        ratio = f"{row['ratio']:>7.2f}x" if row["ratio"] is not None else f"{'-':>8}"
+        print(f"  {row['status'].upper():<12}{row['engine']:<8}{row['stage']:<20}{row['scale']:>6}x"
+              f"{before} ->{row['seconds'] * 1000:>10.1f} ms{ratio}")
+    if baseline.get("platform") != platform.platform() or baseline.get("python") != platform.python_version():
+        print()
+        print(f"Note: baseline was recorded on {baseline.get('platform')}, Python {baseline.get('python')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark both constitution parsers")
+    parser.add_argument('input_file', nargs='?', help="Constitution text file")
+    parser.add_argument('--synthetic', type=int, metavar='SEED',
+                        help="Benchmark a generated corpus (see generate_corpus.py) instead of a text file")
+    parser.add_argument('--scales', default='1,10,100',
+                        help="Comma-separated scale factors (default: 1,10,100; add 1000 for a long run)")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per stage below 100x, best one counts")
+    parser.add_argument('--engines', default='parser,app',
+                        help="Which parsers to time: parser (parser/), app (composeResources), or both")
+    parser.add_argument('--save', metavar='BASELINE', help="Store this run as a JSON baseline")
+    parser.add_argument('--baseline', metavar='BASELINE', help="Compare this run against a stored baseline")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Slowdown (as a fraction) that counts as a regression")
+    parser.add_argument('--report', metavar='REPORT', help="Write the comparison as JSON")
+    args = parser.parse_args()
+
+    paths = project_paths()
+    input_path = Path(args.input_file) if args.input_file else paths["input"]
+    input_name = f"synthetic seed {args.synthetic}" if args.synthetic is not None else input_path.name
+    scales = [int(s) for s in args.scales.split(',') if s.strip()]
+    engine_names = [e.strip() for e in args.engines.split(',') if e.strip()]
+
+    print("=" * 60)
+    print("Constitution Parser Benchmark")
+    print("=" * 60)
+    print(f"Input:  {input_name if args.synthetic is not None else input_path}")
+    print(f"Scales: {', '.join(f'{s}x' for s in scales)}")
+    print()
+
+    if args.synthetic is None and not input_path.exists():
+        print(f"ERROR: Input file not found at {input_path}")
+        return 1
+    unknown = [e for e in engine_names if e not in ('parser', 'app')]
+    if unknown:
+        print(f"ERROR: Unknown engine: {', '.join(unknown)}")
+        return 1
+
+    # Both parser scripts import sibling modules (parse_profile, ...) from parser/
+    sys.path.insert(0, str(paths["parser"].parent))
+    engines = {name: load_engine(f"{name}_parse_constitution", paths[name]) for name in engine_names}
+    if args.synthetic is not None:
+        from generate_corpus import generate_corpus
+        text = generate_corpus(seed=args.synthetic)
+    else:
+        reader = engines.get("parser") or load_engine("parser_parse_constitution", paths["parser"])
+        text = reader.read_constitution_text(input_path)
+
+    results = run_suite(text, engines, scales, args.repeat)
+
+    if args.save:
+        save_baseline(results, input_name, Path(args.save))
+        print()
+        print(f"Baseline saved to: {args.save}")
+
+    if args.baseline:
+        baseline = load_baseline(Path(args.baseline))
+        rows = compare_results(baseline, results, args.threshold)
+        print_comparison(rows, baseline, args.threshold)
+        if args.report:
+            with open(args.report, 'w', encoding='utf-8') as f:
+                json.dump({"baseline": args.baseline, "threshold": args.threshold, "rows": rows}, f, indent=2)
+            print(f"Report saved to: {args.report}")
+        regressions = sum(1 for row in rows if row["status"] == "regression")
+        print()
+        print(f"{regressions} regression(s)")
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Fuzz benchmark for the app parser's line-heuristic regexes.
+
+The composeResources parse_constitution.py detects article titles, Sixth
+Schedule section titles, Fifth Schedule "(Article N)" lines and schedule
+headings with regexes that used to backtrack badly on long OCR lines. This
+script checks the rewritten patterns two ways:
+
+  equivalence  random short lines, where the old patterns still finish,
+               must give the same result with the old and the new pattern
+  runtime      adversarial lines from 1K to 64K characters, fed through
+               parse_articles, parse_schedule_5, parse_schedule_6 and
+               parse_schedules, must take time proportional to their length
+
+Exits with status 1 if either check fails.
+
+Usage:
+    python benchmark_patterns.py [--seed N] [--lines N] [--max-size CHARS]
+"""
+
+import re
+import time
+import random
+import argparse
+
+from benchmark_parsers import project_paths, load_engine
+
+
+# The patterns as they were before the rewrite
+LEGACY_TITLE_PATTERN = re.compile(r'^([A-Z][^.]+(?:\s+[a-z][^.]*)*)\.$')
+LEGACY_LEGISLATION_PATTERN = re.compile(r'^(.+?)\s*\(Article\s*(\d+(?:\s*\([^)]+\))?)\)\s*$', re.IGNORECASE)
+LEGACY_SCHEDULE_BREAK = r'\s*[\t\n\r]+\s*\(Article'
+
+FUZZ_PIECES = ['A', 'Z', 'a', 'z', ' ', '  ', '.', '\t', '\r', '(', ')', '1', '12', '(Article', '(ARTICLE ',
+               '(Article 5)', '(Article 6 (1))', '(3)', ' x', 'Title', ' of the']
+
+# Allowed growth of time per character from the smallest to the largest input
+MAX_GROWTH = 4.0
+
+
+# ============================================================================
+# Equivalence
+# ============================================================================
+
+def fuzz_line(rng: random.Random) -> str:
+    """A random short line built from pieces that exercise all three patterns."""
+    return ''.join(rng.choice(FUZZ_PIECES) for _ in range(rng.randint(1, 8)))
+
+
+def check_equivalence(engine, seed: int, count: int) -> list:
+    """Compare old and new patterns on count random lines. Returns the mismatches."""
+    rng = random.Random(seed)
+    new_break = re.compile('FIRST SCHEDULE' + engine.SCHEDULE_BREAK_PATTERN, re.IGNORECASE)
+    old_break = re.compile('FIRST SCHEDULE' + LEGACY_SCHEDULE_BREAK, re.IGNORECASE)
+
+    mismatches = []
+    for _ in range(count):
+        line = fuzz_line(rng)
+
+        old = LEGACY_TITLE_PATTERN.match(line)
+        new = engine.TITLE_LINE_PATTERN.match(line)
+        if (old and old.group(1)) != (new and new.group(1)):
+            mismatches.append(("title", line))
+
+        old = LEGACY_LEGISLATION_PATTERN.match(line)
+        old = (old.group(1).strip(), old.group(2).strip()) if old else None
+        if old != engine.match_legislation_line(line):
+            mismatches.append(("legislation", line))
+
+        heading = 'FIRST SCHEDULE' + line
+        if bool(old_break.match(heading)) != bool(new_break.match(heading)):
+            mismatches.append(("schedule heading", line))
+    return mismatches
+
+
+# ============================================================================
+# Runtime
+# ============================================================================
+
+def adversarial_cases(engine) -> dict:
+    """
+    Each case builds a document around a line of about n characters that
+    makes the old pattern backtrack, and runs the parser function that
+    reads it.
+    """
+    def title_line(n: int) -> str:
+        # Many short words and no trailing period
+        return "A" + " a" * (n // 2)
+
+    return {
+        "article title": (
+            lambda n: title_line(n) + "\n",
+            lambda text: engine.parse_articles(text, 1),
+        ),
+        "sixth schedule title": (
+            lambda n: "SIXTH SCHEDULE\n" + title_line(n) + "\n",
+            engine.parse_schedule_6,
+        ),
+        "fifth schedule line": (
+            # A long whitespace run that never reaches "(Article"
+            lambda n: "FIFTH SCHEDULE\nx" + " " * n + "(Articl\n",
+            engine.parse_schedule_5,
+        ),
+        "schedule heading": (
+            # A long space run after a heading, with no tab or line break
+            lambda n: "SCHEDULES\nFIRST SCHEDULE" + " " * n + "x\n",
+            engine.parse_schedules,
+        ),
+    }
+
+
+def time_call(func, text: str, repeat: int = 3) -> float:
+    """Best wall time of func(text) over repeat runs, in seconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def check_runtime(engine, max_size: int) -> list:
+    """
+    Time every adversarial case at doubling sizes. Returns rows of (case,
+    [(size, seconds)], growth), where growth is the time per character at
+    the largest size over the time per character at the smallest.
+    """
+    sizes = []
+    size = 1024
+    while size <= max_size:
+        sizes.append(size)
+        size *= 2
+
+    rows = []
+    for name, (build, parse) in adversarial_cases(engine).items():
+        timings = [(n, time_call(parse, build(n))) for n in sizes]
+        first_size, first_time = timings[0]
+        last_size, last_time = timings[-1]
+        growth = (last_time / last_size) / (first_time / first_size) if first_time else 0.0
+        rows.append((name, timings, growth))
+    return rows
+
+
+def legacy_blowup(max_words: int = 20) -> list:
+    """The old title pattern on the adversarial line, while it still finishes quickly."""
+    timings = []
+    for words in range(10, max_words + 1, 2):
+        line = "A" + " a" * words
+        start = time.perf_counter()
+        LEGACY_TITLE_PATTERN.match(line)
+        timings.append((len(line), time.perf_counter() - start))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fuzz and time the app parser's line regexes")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed for the equivalence check")
+    parser.add_argument('--lines', type=int, default=20000, help="Random lines for the equivalence check")
+    parser.add_argument('--max-size', type=int, default=65536, help="Largest adversarial line, in characters")
+    args = parser.parse_args()
+
+    engine = load_engine("app_parse_constitution", project_paths()["app"])
+
+    print("=" * 60)
+    print("Line Pattern Fuzz Benchmark")
+    print("=" * 60)
+
+    mismatches = check_equivalence(engine, args.seed, args.lines)
+    print(f"Equivalence: {args.lines:,} random lines, {len(mismatches)} mismatches")
+    for kind, line in mismatches[:10]:
+        print(f"  {kind}: {line!r}")
+    print()
+
+    print("Old title pattern (for reference):")
+    for length, seconds in legacy_blowup():
+        print(f"  {length:>8,} chars{seconds * 1000:>12.2f} ms")
+    print()
+
+    rows = check_runtime(engine, args.max_size)
+    slow = []
+    for name, timings, growth in rows:
+        print(f"{name}:")
+        for size, seconds in timings:
+            print(f"  {size:>8,} chars{seconds * 1000:>12.2f} ms")
+        print(f"  growth in time per char: {growth:.2f}x")
+        if growth > MAX_GROWTH:
+            slow.append(name)
+    print()
+
+    if mismatches or slow:
+        if slow:
+            print(f"FAILED: superlinear runtime in {', '.join(slow)}")
+        if mismatches:
+            print("FAILED: rewritten patterns disagree with the old ones")
+        return 1
+    print(f"OK: all cases linear (growth under {MAX_GROWTH:.0f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
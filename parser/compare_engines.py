@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Differential harness for the two constitution parsers.
+
+Runs parser/parse_constitution.py ("parser") and the app's composeResources
+parse_constitution.py ("app") on the same inputs, times them and measures
+their peak memory, then maps both outputs onto one common tree so they can
+be compared article by article:
+
+    chapters    number -> title and part titles
+    articles    number -> chapter, part, title and clauses, where a clause
+                is a number (None for an unnumbered text-only body), its
+                text and its sub-clauses, and a sub-clause is a label, its
+                text and its mini-clauses (label and text)
+    schedules   number -> title, reference and the items of the schedule
+
+Text is compared with whitespace collapsed. The engines differ in schema
+only in ways the common tree hides: integer versus string clause numbers,
+"isTextOnly" versus an empty clause number, "numeral" versus "label" on
+mini-clauses, empty lists versus missing keys, and the chapters the parser
+engine reads from the table of contents. The app engine lists articles
+under their chapter only, so part membership is compared only where both
+engines record it.
+
+Usage:
+    python compare_engines.py [input_file ...] [--synthetic SEED ...] [--repeat N]
+                              [--report REPORT] [--verbose]
+"""
+
+import re
+import sys
+import json
+import tempfile
+import argparse
+import tracemalloc
+from pathlib import Path
+
+from benchmark_parsers import project_paths, load_engine, stage_calls, best_run
+
+
+ENGINE_NAMES = ('parser', 'app')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Items of each schedule worth comparing, for each engine: names, titles or
+# numbers as strings. The Second Schedule has nothing in common to compare.
+SCHEDULE_ITEMS = {
+    1: (lambda s: [i.get("name", "") for i in s.get("items", [])],
+        lambda s: [i.get("name", "") for i in s.get("content", {}).get("counties", [])]),
+    3: (lambda s: [o.get("title", "") for o in s.get("oaths", [])],
+        lambda s: [o.get("title", "") for o in s.get("content", {}).get("oaths", [])]),
+    4: (lambda s: [f.get("text", "") for p in s.get("parts", []) for f in p.get("functions", [])],
+        lambda s: [f.get("function", "") for key in ("nationalGovernment", "countyGovernments")
+                   for f in s.get("content", {}).get(key, [])]),
+    5: (lambda s: [r.get("description", "") for r in s.get("rows", [])],
+        lambda s: [r.get("description", "") for r in s.get("content", {}).get("legislation", [])]),
+    6: (lambda s: [str(x.get("number", "")) for p in s.get("parts", []) for x in p.get("sections", [])],
+        lambda s: [str(x.get("number", "")) for x in s.get("content", {}).get("sections", [])]),
+}
+
+
+# ============================================================================
+# Common Tree
+# ============================================================================
+
+def clean(text) -> str:
+    """Text with runs of whitespace collapsed, for comparison."""
+    return WHITESPACE_PATTERN.sub(' ', str(text or '')).strip()
+
+
+def number_key(number) -> tuple:
+    """Sort key that puts integer numbers in numeric order before anything else."""
+    return (0, number, '') if isinstance(number, int) else (1, 0, str(number))
+
+
+def normalize_preamble(preamble) -> str:
+    """The preamble as one string: the parser engine splits it into paragraphs."""
+    if isinstance(preamble, dict):
+        preamble = ' '.join(preamble.get("paragraphs", []))
+    return clean(preamble)
+
+
+def normalize_clause(clause: dict) -> dict:
+    """A clause of either engine in the common shape."""
+    number = clause.get("number")
+    if clause.get("isTextOnly") or number in ("", None):
+        number = None
+    else:
+        number = int(number)
+    return {
+        "number": number,
+        "text": clean(clause.get("text")),
+        "subClauses": [
+            {
+                "label": sub.get("label", ""),
+                "text": clean(sub.get("text")),
+                "miniClauses": [
+                    {"label": mini.get("numeral", mini.get("label", "")), "text": clean(mini.get("text"))}
+                    for mini in sub.get("miniClauses", [])
+                ]
+            }
+            for sub in clause.get("subClauses", [])
+        ]
+    }
+
+
+def normalize_output(result: dict, engine_name: str) -> dict:
+    """
+    Map one engine's parse_constitution output onto the common tree. A
+    chapter number seen more than once keeps the copy with articles; an
+    article number seen more than once keeps its first copy and is counted
+    in "duplicates".
+    """
+    chapters = {}
+    articles = {}
+    duplicates = []
+    for chapter in result.get("chapters", []):
+        groups = [(None, chapter.get("articles", []))]
+        groups += [(part.get("number"), part.get("articles", [])) for part in chapter.get("parts", [])]
+        has_articles = any(group for _, group in groups)
+        number = chapter.get("number")
+        if number in chapters and (chapters[number]["hasArticles"] or not has_articles):
+            continue
+        chapters[number] = {
+            "title": clean(chapter.get("title")),
+            "parts": [clean(part.get("title")) for part in chapter.get("parts", [])],
+            "hasArticles": has_articles
+        }
+        for part_number, group in groups:
+            for article in group:
+                if article.get("number") in articles:
+                    duplicates.append(article.get("number"))
+                    continue
+                articles[article.get("number")] = {
+                    "chapter": number,
+                    "part": part_number,
+                    "title": clean(article.get("title")),
+                    "clauses": [normalize_clause(c) for c in article.get("clauses", [])]
+                }
+
+    items = 0 if engine_name == "parser" else 1
+    schedules = {}
+    for schedule in result.get("schedules", []):
+        extract = SCHEDULE_ITEMS.get(schedule.get("number"))
+        schedules[schedule.get("number")] = {
+            "title": clean(schedule.get("title")),
+            # "Article 6 (1)" and "Article 6(1)" cite the same clause
+            "reference": clean(schedule.get("reference")).replace(' (', '('),
+            "items": [clean(item) for item in extract[items](schedule)] if extract else None
+        }
+
+    return {
+        "preamble": normalize_preamble(result.get("preamble")),
+        "chapters": chapters,
+        "articles": articles,
+        "schedules": schedules,
+        "duplicates": duplicates
+    }
+
+
+# ============================================================================
+# Differences
+# ============================================================================
+
+def diff_lists(path: str, left: list, right: list, diffs: list):
+    """Record a count difference, then every position where the lists differ."""
+    if len(left) != len(right):
+        diffs.append((f"{path}.count", len(left), len(right)))
+    for i, (a, b) in enumerate(zip(left, right)):
+        if a != b:
+            diffs.append((f"{path}[{i}]", a, b))
+
+
+def align_clauses(left: list, right: list) -> list:
+    """
+    Pair up the clauses of two articles: by number when every clause on
+    both sides has a distinct one, so a clause missing on one side does not
+    shift the rest, otherwise by position. Returns (key, left, right)
+    triples with None for a clause on one side only.
+    """
+    numbers = [[c["number"] for c in clauses] for clauses in (left, right)]
+    if all(None not in n and len(set(n)) == len(n) for n in numbers):
+        by_number = [{c["number"]: c for c in clauses} for clauses in (left, right)]
+        keys = sorted(set(by_number[0]) | set(by_number[1]))
+        return [(key, by_number[0].get(key), by_number[1].get(key)) for key in keys]
+    pairs = []
+    for i in range(max(len(left), len(right))):
+        pairs.append((f"#{i}", left[i] if i < len(left) else None, right[i] if i < len(right) else None))
+    return pairs
+
+
+def diff_clauses(left: list, right: list) -> list:
+    """Field-level differences between two clause lists in the common shape."""
+    diffs = []
+    if len(left) != len(right):
+        diffs.append(("clauses.count", len(left), len(right)))
+    for key, a, b in align_clauses(left, right):
+        path = f"clauses[{key}]"
+        if a is None or b is None:
+            diffs.append((path, a is not None, b is not None))
+            continue
+        for field in ("number", "text"):
+            if a[field] != b[field]:
+                diffs.append((f"{path}.{field}", a[field], b[field]))
+        subs_a, subs_b = a["subClauses"], b["subClauses"]
+        diff_lists(f"{path}.subClauses.labels", [s["label"] for s in subs_a], [s["label"] for s in subs_b], diffs)
+        for sa, sb in zip(subs_a, subs_b):
+            sub_path = f"{path}.subClauses[{sa['label']}]"
+            if sa["text"] != sb["text"]:
+                diffs.append((f"{sub_path}.text", sa["text"], sb["text"]))
+            diff_lists(f"{sub_path}.miniClauses",
+                       [(m["label"], m["text"]) for m in sa["miniClauses"]],
+                       [(m["label"], m["text"]) for m in sb["miniClauses"]], diffs)
+    return diffs
+
+
+def compare_trees(left: dict, right: dict) -> dict:
+    """
+    Structural differences between two common trees. Each difference is a
+    (field, left value, right value) tuple; articles missing from one side
+    are listed separately from articles present in both that differ.
+    """
+    report = {"preamble": left["preamble"] == right["preamble"], "chapters": {}, "articles": {},
+              "onlyLeft": sorted(set(left["articles"]) - set(right["articles"]), key=number_key),
+              "onlyRight": sorted(set(right["articles"]) - set(left["articles"]), key=number_key),
+              "schedules": {}}
+
+    for number in sorted(set(left["chapters"]) | set(right["chapters"]), key=number_key):
+        a, b = left["chapters"].get(number), right["chapters"].get(number)
+        if a is None or b is None:
+            report["chapters"][number] = [("chapter", a is not None, b is not None)]
+            continue
+        diffs = [("title", a["title"], b["title"])] if a["title"] != b["title"] else []
+        diff_lists("parts", a["parts"], b["parts"], diffs)
+        if diffs:
+            report["chapters"][number] = diffs
+
+    for number in sorted(set(left["articles"]) & set(right["articles"]), key=number_key):
+        a, b = left["articles"][number], right["articles"][number]
+        diffs = [(field, a[field], b[field]) for field in ("chapter", "title") if a[field] != b[field]]
+        if a["part"] is not None and b["part"] is not None and a["part"] != b["part"]:
+            diffs.append(("part", a["part"], b["part"]))
+        diffs += diff_clauses(a["clauses"], b["clauses"])
+        if diffs:
+            report["articles"][number] = diffs
+
+    for number in sorted(set(left["schedules"]) | set(right["schedules"]), key=number_key):
+        a, b = left["schedules"].get(number), right["schedules"].get(number)
+        if a is None or b is None:
+            report["schedules"][number] = [("schedule", a is not None, b is not None)]
+            continue
+        diffs = [(field, a[field], b[field]) for field in ("title", "reference") if a[field] != b[field]]
+        if a["items"] is not None and b["items"] is not None:
+            diff_lists("items", a["items"], b["items"], diffs)
+        if diffs:
+            report["schedules"][number] = diffs
+    return report
+
+
+def field_kind(field: str) -> str:
+    """The kind of a difference, for the summary: "clauses[3].subClauses[b].text" -> "subClauses.text"."""
+    return re.sub(r'\[[^\]]*\]', '', field).replace('clauses.subClauses', 'subClauses')
+
+
+def summarize(report: dict) -> dict:
+    """Difference counts by kind across all articles."""
+    kinds = {}
+    for diffs in report["articles"].values():
+        for field, _, _ in diffs:
+            kind = field_kind(field)
+            kinds[kind] = kinds.get(kind, 0) + 1
+    return dict(sorted(kinds.items(), key=lambda kv: -kv[1]))
+
+
+# ============================================================================
+# Running
+# ============================================================================
+
+def measure_engine(engine_name: str, engine, text: str, path: Path, repeat: int) -> tuple:
+    """
+    Time one engine's full parse (reading the file included) and measure
+    its peak traced memory in a separate run. Returns (seconds, peak
+    bytes, result).
+    """
+    parse = stage_calls(engine_name, engine, text, path)['parse_constitution']
+    seconds, result = best_run(parse, repeat)
+    tracemalloc.start()
+    parse()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak, result
+
+
+def compare_input(name: str, text: str, engines: dict, repeat: int) -> dict:
+    """Run both engines on one text and compare them. Returns the report for the input."""
+    runs = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "input.txt"
+        path.write_text(text, encoding='utf-8')
+        for engine_name, engine in engines.items():
+            seconds, peak, result = measure_engine(engine_name, engine, text, path, repeat)
+            runs[engine_name] = {"seconds": seconds, "peakBytes": peak,
+                                 "tree": normalize_output(result, engine_name)}
+
+    left, right = runs["parser"]["tree"], runs["app"]["tree"]
+    report = compare_trees(left, right)
+    return {
+        "input": name,
+        "bytes": len(text.encode('utf-8')),
+        "engines": {
+            engine_name: {
+                "seconds": round(run["seconds"], 6),
+                "peakBytes": run["peakBytes"],
+                "chapters": sum(1 for c in run["tree"]["chapters"].values() if c["hasArticles"]),
+                "articles": len(run["tree"]["articles"]),
+                "schedules": len(run["tree"]["schedules"]),
+                "duplicateArticles": run["tree"]["duplicates"],
+            }
+            for engine_name, run in runs.items()
+        },
+        "summary": summarize(report),
+        **report
+    }
+
+
+def field_list(diffs: list, limit: int = 4) -> str:
+    """The fields of a difference list, shortened to limit of them."""
+    fields = ', '.join(field for field, _, _ in diffs[:limit])
+    return fields + (f", +{len(diffs) - limit} more" if len(diffs) > limit else "")
+
+
+def number_list(numbers: list, limit: int = 20) -> str:
+    """A list of article numbers, shortened to limit of them."""
+    shown = ', '.join(str(n) for n in numbers[:limit])
+    return shown + (f", ... ({len(numbers)} in all)" if len(numbers) > limit else "")
+
+
+def print_report(report: dict, verbose: bool):
+    """Print the comparison of one input."""
+    print(f"Input: {report['input']} ({report['bytes']:,} bytes)")
+    print(f"  {'engine':<8}{'ms':>10}{'peak MB':>10}{'chapters':>10}{'articles':>10}{'schedules':>11}")
+    for engine_name, stats in report["engines"].items():
+        print(f"  {engine_name:<8}{stats['seconds'] * 1000:>10.1f}{stats['peakBytes'] / 1e6:>10.2f}"
+              f"{stats['chapters']:>10}{stats['articles']:>10}{stats['schedules']:>11}")
+        if stats["duplicateArticles"]:
+            print(f"    duplicate articles ignored: {number_list(stats['duplicateArticles'])}")
+    print()
+    print(f"  Preamble: {'same' if report['preamble'] else 'DIFFERS'}")
+    if report["onlyLeft"]:
+        print(f"  Articles only in parser: {number_list(report['onlyLeft'])}")
+    if report["onlyRight"]:
+        print(f"  Articles only in app: {number_list(report['onlyRight'])}")
+    for label, key in (("Chapter", "chapters"), ("Schedule", "schedules")):
+        for number, diffs in report[key].items():
+            print(f"  {label} {number}: {field_list(diffs)}")
+
+    print(f"  Articles differing: {len(report['articles'])}")
+    for kind, count in report["summary"].items():
+        print(f"    {kind:<40}{count:>6}")
+    for number, diffs in report["articles"].items():
+        print(f"  Article {number}: {field_list(diffs)}")
+        if verbose:
+            for field, a, b in diffs:
+                print(f"    {field}")
+                print(f"      parser: {str(a)[:200]}")
+                print(f"      app:    {str(b)[:200]}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run both constitution parsers and compare speed and output")
+    parser.add_argument('input_files', nargs='*', help="Constitution text files")
+    parser.add_argument('--synthetic', type=int, action='append', default=[], metavar='SEED',
+                        help="Also compare on a generated corpus (see generate_corpus.py); repeatable")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per engine, best one counts")
+    parser.add_argument('--report', metavar='REPORT', help="Write every difference as JSON")
+    parser.add_argument('-v', '--verbose', action='store_true', help="Print both values of every difference")
+    args = parser.parse_args()
+
+    paths = project_paths()
+    input_paths = [Path(p) for p in args.input_files]
+    if not input_paths and not args.synthetic:
+        input_paths = [paths["input"]]
+
+    print("=" * 60)
+    print("Parser Engine Comparison")
+    print("=" * 60)
+
+    missing = [p for p in input_paths if not p.exists()]
+    if missing:
+        print(f"ERROR: Input file not found at {missing[0]}")
+        return 1
+
+    # Both parser scripts import sibling modules (parse_profile, ...) from parser/
+    sys.path.insert(0, str(paths["parser"].parent))
+    engines = {name: load_engine(f"{name}_parse_constitution", paths[name]) for name in ENGINE_NAMES}
+
+    inputs = [(str(p), engines["parser"].read_constitution_text(p)) for p in input_paths]
+    if args.synthetic:
+        from generate_corpus import generate_corpus
+        inputs += [(f"synthetic seed {seed}", generate_corpus(seed=seed)) for seed in args.synthetic]
+
+    reports = []
+    for name, text in inputs:
+        reports.append(compare_input(name, text, engines, args.repeat))
+        print_report(reports[-1], args.verbose)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, indent=2, ensure_ascii=False)
+        print(f"Report saved to: {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Compact binary bundle for the parsed constitution.
+
+Encodes any JSON value (the app's constitution_of_kenya.json, or the output
+of parse_constitution.py) into a bundle with a shared string table, a table
+of object shapes (key lists) and a node table of objects and arrays, with
+every number written as a varint. The layout is documented in
+docs/bundle_format.md.
+
+Usage:
+    python constitution_bundle.py [input_json] [-o OUTPUT] [--benchmark]
+"""
+
+import gzip
+import json
+import lzma
+import struct
+import time
+import argparse
+from collections import Counter
+from pathlib import Path
+
+
+BUNDLE_MAGIC = b'KTB1'
+BUNDLE_VERSION = 1
+
+# Value types, stored in the low 3 bits of a value varint
+TYPE_CONSTANT = 0   # payload: CONSTANTS index
+TYPE_INT = 1        # payload: n
+TYPE_NEGATIVE = 2   # payload: -n - 1
+TYPE_STRING = 3     # payload: string table index
+TYPE_ARRAY = 4      # payload: node table index
+TYPE_OBJECT = 5     # payload: node table index
+TYPE_FLOAT = 6      # payload 0, followed by 8 bytes of little-endian double
+
+CONSTANTS = [None, False, True]
+CONSTANT_EMPTY_ARRAY = 3
+CONSTANT_EMPTY_OBJECT = 4
+
+
+# ============================================================================
+# Varints
+# ============================================================================
+
+def write_varint(out: bytearray, n: int):
+    """Append n as an unsigned LEB128 varint."""
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    """Read an unsigned LEB128 varint at pos. Returns (value, next_pos)."""
+    byte = data[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    result = byte & 0x7F
+    shift = 7
+    pos += 1
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+# ============================================================================
+# Encoding
+# ============================================================================
+
+def count_strings(value, counts: Counter):
+    """Count every string and object key in value."""
+    if isinstance(value, str):
+        counts[value] += 1
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            counts[key] += 1
+            count_strings(item, counts)
+    elif isinstance(value, list):
+        for item in value:
+            count_strings(item, counts)
+
+
+def encode_bundle(value) -> bytes:
+    """
+    Encode a JSON value as a bundle.
+
+    Strings are numbered by descending frequency so the most common ones
+    get one-byte references. Objects and arrays are written in post-order,
+    children before parents, so a reader can build every node from nodes
+    it has already decoded; the root is the last value in the file.
+    """
+    counts = Counter()
+    count_strings(value, counts)
+    strings = [s for s, _ in counts.most_common()]
+    string_ids = {s: i for i, s in enumerate(strings)}
+
+    shapes = []
+    shape_ids = {}
+    nodes = []
+
+    def encode_value(item, out: bytearray):
+        if item is None or item is False or item is True:
+            write_varint(out, CONSTANTS.index(item) << 3 | TYPE_CONSTANT)
+        elif isinstance(item, int):
+            if item >= 0:
+                write_varint(out, item << 3 | TYPE_INT)
+            else:
+                write_varint(out, (-item - 1) << 3 | TYPE_NEGATIVE)
+        elif isinstance(item, float):
+            write_varint(out, TYPE_FLOAT)
+            out += struct.pack('<d', item)
+        elif isinstance(item, str):
+            write_varint(out, string_ids[item] << 3 | TYPE_STRING)
+        elif isinstance(item, list):
+            if not item:
+                write_varint(out, CONSTANT_EMPTY_ARRAY << 3 | TYPE_CONSTANT)
+                return
+            record = bytearray()
+            write_varint(record, len(item) << 1)
+            for child in item:
+                encode_value(child, record)
+            nodes.append(record)
+            write_varint(out, (len(nodes) - 1) << 3 | TYPE_ARRAY)
+        elif isinstance(item, dict):
+            if not item:
+                write_varint(out, CONSTANT_EMPTY_OBJECT << 3 | TYPE_CONSTANT)
+                return
+            keys = tuple(item)
+            shape = shape_ids.get(keys)
+            if shape is None:
+                shape = shape_ids[keys] = len(shapes)
+                shapes.append(keys)
+            record = bytearray()
+            write_varint(record, shape << 1 | 1)
+            for child in item.values():
+                encode_value(child, record)
+            nodes.append(record)
+            write_varint(out, (len(nodes) - 1) << 3 | TYPE_OBJECT)
+        else:
+            raise TypeError(f"Cannot bundle {type(item).__name__} value")
+
+    root = bytearray()
+    encode_value(value, root)
+
+    out = bytearray(BUNDLE_MAGIC)
+    write_varint(out, BUNDLE_VERSION)
+
+    write_varint(out, len(strings))
+    for s in strings:
+        encoded = s.encode('utf-8')
+        write_varint(out, len(encoded))
+        out += encoded
+
+    write_varint(out, len(shapes))
+    for keys in shapes:
+        write_varint(out, len(keys))
+        for key in keys:
+            write_varint(out, string_ids[key])
+
+    write_varint(out, len(nodes))
+    for record in nodes:
+        out += record
+
+    out += root
+    return bytes(out)
+
+
+def write_bundle(value, output_path: Path):
+    """Encode value and write the bundle to output_path."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'wb') as f:
+        f.write(encode_bundle(value))
+
+
+# ============================================================================
+# Decoding
+# ============================================================================
+
+def decode_bundle(data: bytes):
+    """Decode a bundle back into the JSON value it was encoded from."""
+    if data[:4] != BUNDLE_MAGIC:
+        raise ValueError("Not a constitution bundle")
+    version, pos = read_varint(data, 4)
+    if version != BUNDLE_VERSION:
+        raise ValueError(f"Unsupported bundle version {version}")
+
+    count, pos = read_varint(data, pos)
+    strings = []
+    for _ in range(count):
+        length, pos = read_varint(data, pos)
+        strings.append(data[pos:pos + length].decode('utf-8'))
+        pos += length
+
+    count, pos = read_varint(data, pos)
+    shapes = []
+    for _ in range(count):
+        length, pos = read_varint(data, pos)
+        keys = []
+        for _ in range(length):
+            key, pos = read_varint(data, pos)
+            keys.append(strings[key])
+        shapes.append(keys)
+
+    nodes = []
+
+    def read_value(pos: int):
+        tagged, pos = read_varint(data, pos)
+        kind = tagged & 7
+        payload = tagged >> 3
+        if kind == TYPE_STRING:
+            return strings[payload], pos
+        if kind == TYPE_INT:
+            return payload, pos
+        if kind == TYPE_ARRAY or kind == TYPE_OBJECT:
+            return nodes[payload], pos
+        if kind == TYPE_CONSTANT:
+            if payload == CONSTANT_EMPTY_ARRAY:
+                return [], pos
+            if payload == CONSTANT_EMPTY_OBJECT:
+                return {}, pos
+            return CONSTANTS[payload], pos
+        if kind == TYPE_NEGATIVE:
+            return -payload - 1, pos
+        if kind == TYPE_FLOAT:
+            return struct.unpack_from('<d', data, pos)[0], pos + 8
+        raise ValueError(f"Unknown value type {kind} at byte {pos}")
+
+    count, pos = read_varint(data, pos)
+    for _ in range(count):
+        header, pos = read_varint(data, pos)
+        if header & 1:
+            node = {}
+            for key in shapes[header >> 1]:
+                node[key], pos = read_value(pos)
+        else:
+            node = []
+            for _ in range(header >> 1):
+                item, pos = read_value(pos)
+                node.append(item)
+        nodes.append(node)
+
+    root, pos = read_value(pos)
+    if pos != len(data):
+        raise ValueError(f"{len(data) - pos} trailing bytes after the root value")
+    return root
+
+
+def read_bundle(input_path: Path):
+    """Read and decode a bundle file."""
+    with open(input_path, 'rb') as f:
+        return decode_bundle(f.read())
+
+
+# ============================================================================
+# Benchmark
+# ============================================================================
+
+def best_time(func, repeat: int = 5) -> float:
+    """Best wall time of func over repeat runs, in milliseconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def run_benchmark(json_text: str):
+    """Compare size and decode time of the JSON against the bundle."""
+    value = json.loads(json_text)
+    indented = json_text.encode('utf-8')
+    compact = json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    bundle = encode_bundle(value)
+    if decode_bundle(bundle) != value:
+        raise ValueError("Bundle does not round-trip")
+
+    print("=" * 60)
+    print("Bundle Benchmark")
+    print("=" * 60)
+    print(f"{'format':<16}{'raw':>12}{'gzip':>12}{'xz':>12}{'decode ms':>12}")
+    rows = [
+        ("json (indent)", indented, lambda: json.loads(indented)),
+        ("json (compact)", compact, lambda: json.loads(compact)),
+        ("bundle", bundle, lambda: decode_bundle(bundle)),
+    ]
+    for name, data, decode in rows:
+        print(f"{name:<16}{len(data):>12,}{len(gzip.compress(data, 9)):>12,}"
+              f"{len(lzma.compress(data)):>12,}{best_time(decode):>12.2f}")
+    print()
+    print("Decode times are CPython: json.loads is C, decode_bundle is pure Python.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Encode parsed constitution JSON as a binary bundle")
+    parser.add_argument('input_json', nargs='?', help="Parsed constitution JSON file")
+    parser.add_argument('-o', '--output', help="Output bundle file")
+    parser.add_argument('--benchmark', action='store_true',
+                        help="Compare bundle size and decode time against the JSON")
+    args = parser.parse_args()
+
+    files_dir = Path(__file__).parent.parent / "composeApp" / "src" / "commonMain" / "composeResources" / "files"
+    input_path = Path(args.input_json) if args.input_json else files_dir / "constitution_of_kenya.json"
+    output_path = Path(args.output) if args.output else input_path.with_suffix('.bundle')
+
+    if not input_path.exists():
+        print(f"ERROR: Input file not found at {input_path}")
+        return 1
+
+    with open(input_path, 'r', encoding='utf-8') as f:
+        json_text = f.read()
+
+    if args.benchmark:
+        run_benchmark(json_text)
+        return 0
+
+    write_bundle(json.loads(json_text), output_path)
+    print(f"Bundle saved to: {output_path}")
+    print(f"Bundle size: {output_path.stat().st_size:,} bytes (JSON: {input_path.stat().st_size:,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
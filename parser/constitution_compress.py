@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Compressed variants of the parsed constitution JSON.
+
+Writes gzip, xz and zstd copies of a parsed constitution JSON file. The
+zstd variant uses a dictionary trained on the articles and schedules of
+the document itself, so the repeated keys ("number", "text", "subClauses",
+...) and clause labels are already known to the decoder; the dictionary is
+written next to it as a .zdict file. The benchmark compares size, compress
+time and decompress-plus-json.loads time of every variant against the
+plain indent=2 JSON.
+
+zstd needs the optional zstandard package (pip install zstandard); without
+it only gzip and xz are available.
+
+Usage:
+    python constitution_compress.py [input_json] [-f FORMATS] [--benchmark]
+"""
+
+import gzip
+import json
+import lzma
+import time
+import argparse
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+COMPRESSION_FORMATS = ('gzip', 'xz', 'zstd')
+COMPRESSION_SUFFIXES = {'gzip': '.gz', 'xz': '.xz', 'zstd': '.zst'}
+ZSTD_LEVEL = 19
+ZSTD_DICT_SIZE = 16 * 1024
+
+
+# ============================================================================
+# Dictionary Training
+# ============================================================================
+
+def dictionary_samples(constitution: dict) -> list:
+    """
+    Training samples for the zstd dictionary: every article, part heading
+    and schedule, serialized the way the compressed JSON is (indent=2), so
+    the dictionary learns the key layout as well as the vocabulary.
+    """
+    samples = []
+    for chapter in constitution.get('chapters', []):
+        for article in chapter.get('articles', []):
+            samples.append(json.dumps(article, indent=2, ensure_ascii=False).encode('utf-8'))
+        for part in chapter.get('parts', []):
+            for article in part.get('articles', []):
+                samples.append(json.dumps(article, indent=2, ensure_ascii=False).encode('utf-8'))
+            heading = {k: v for k, v in part.items() if k != 'articles'}
+            samples.append(json.dumps(heading, indent=2, ensure_ascii=False).encode('utf-8'))
+    for schedule in constitution.get('schedules', []):
+        samples.append(json.dumps(schedule, indent=2, ensure_ascii=False).encode('utf-8'))
+    return samples
+
+
+def train_zstd_dictionary(constitution: dict, dict_size: int = ZSTD_DICT_SIZE):
+    """Train a zstd dictionary on the document's own articles and schedules."""
+    return zstandard.train_dictionary(dict_size, dictionary_samples(constitution))
+
+
+# ============================================================================
+# Compression
+# ============================================================================
+
+def available_formats() -> tuple:
+    """The formats this interpreter can write: zstd only with zstandard installed."""
+    return COMPRESSION_FORMATS if zstandard else tuple(f for f in COMPRESSION_FORMATS if f != 'zstd')
+
+
+def compress_bytes(data: bytes, fmt: str, dictionary=None) -> bytes:
+    """Compress data with one of COMPRESSION_FORMATS at its highest practical level."""
+    if fmt == 'gzip':
+        return gzip.compress(data, 9, mtime=0)
+    if fmt == 'xz':
+        return lzma.compress(data, preset=9)
+    if fmt == 'zstd':
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=dictionary).compress(data)
+    raise ValueError(f"Unknown compression format {fmt}")
+
+
+def decompress_bytes(data: bytes, fmt: str, dictionary=None) -> bytes:
+    """Undo compress_bytes."""
+    if fmt == 'gzip':
+        return gzip.decompress(data)
+    if fmt == 'xz':
+        return lzma.decompress(data)
+    if fmt == 'zstd':
+        return zstandard.ZstdDecompressor(dict_data=dictionary).decompress(data)
+    raise ValueError(f"Unknown compression format {fmt}")
+
+
+def write_compressed_variants(json_path: Path, formats=COMPRESSION_FORMATS) -> list:
+    """
+    Write json_path compressed in each format next to it, e.g.
+    constitution.json.gz. zstd also writes the dictionary it was trained
+    with as constitution.json.zdict. Returns the paths written.
+    """
+    for fmt in formats:
+        if fmt not in COMPRESSION_FORMATS:
+            raise ValueError(f"Unknown compression format {fmt}")
+        if fmt == 'zstd' and zstandard is None:
+            raise RuntimeError("zstd output needs the zstandard package (pip install zstandard)")
+
+    data = json_path.read_bytes()
+    written = []
+    for fmt in formats:
+        dictionary = None
+        if fmt == 'zstd':
+            dictionary = train_zstd_dictionary(json.loads(data))
+            dict_path = json_path.with_name(json_path.name + '.zdict')
+            dict_path.write_bytes(dictionary.as_bytes())
+            written.append(dict_path)
+        path = json_path.with_name(json_path.name + COMPRESSION_SUFFIXES[fmt])
+        path.write_bytes(compress_bytes(data, fmt, dictionary))
+        written.append(path)
+    return written
+
+
+def load_compressed(path: Path):
+    """Load a compressed variant written by write_compressed_variants."""
+    for fmt, suffix in COMPRESSION_SUFFIXES.items():
+        if path.name.endswith(suffix):
+            break
+    else:
+        raise ValueError(f"Unknown compressed file type: {path.name}")
+    dictionary = None
+    if fmt == 'zstd':
+        dict_path = path.with_name(path.name[:-len(suffix)] + '.zdict')
+        if dict_path.exists():
+            dictionary = zstandard.ZstdCompressionDict(dict_path.read_bytes())
+    return json.loads(decompress_bytes(path.read_bytes(), fmt, dictionary))
+
+
+# ============================================================================
+# Benchmark
+# ============================================================================
+
+def best_time(func, repeat: int = 5) -> float:
+    """Best wall time of func over repeat runs, in milliseconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def dictionary_size(dictionary) -> int:
+    """Bytes of a zstd dictionary as shipped in the .zdict file, 0 without one."""
+    return len(dictionary.as_bytes()) if dictionary is not None else 0
+
+
+def benchmark_variants(data: bytes) -> list:
+    """
+    Measure every variant of data. Returns rows of (name, size, compress
+    ms, load ms), where load is decompress plus json.loads. The size of a
+    dictionary variant includes the dictionary, which the reader has to
+    download as well.
+    """
+    constitution = json.loads(data)
+    variants = [("json (indent)", None, None)]
+    variants += [(fmt, fmt, None) for fmt in ('gzip', 'xz')]
+    if zstandard:
+        variants.append(("zstd", 'zstd', None))
+        dictionary = train_zstd_dictionary(constitution)
+        dictionary.precompute_compress(level=ZSTD_LEVEL)
+        variants.append(("zstd + dict", 'zstd', dictionary))
+
+    rows = []
+    for name, fmt, dictionary in variants:
+        if fmt is None:
+            rows.append((name, len(data), 0.0, best_time(lambda: json.loads(data))))
+            continue
+        packed = compress_bytes(data, fmt, dictionary)
+        if decompress_bytes(packed, fmt, dictionary) != data:
+            raise ValueError(f"{name} does not round-trip")
+        rows.append((
+            name,
+            len(packed) + dictionary_size(dictionary),
+            best_time(lambda: compress_bytes(data, fmt, dictionary), repeat=1 if fmt == 'xz' else 3),
+            best_time(lambda: json.loads(decompress_bytes(packed, fmt, dictionary))),
+        ))
+    return rows
+
+
+def benchmark_shards(constitution: dict) -> list:
+    """
+    The same measurements for per-chapter and per-schedule shards (see
+    constitution_shards.py), each compressed on its own. Small payloads are
+    where a shared dictionary pays off. Sizes and times are totals over all
+    shards, plus the dictionary once for the dictionary variant.
+    """
+    shards = [json.dumps(node, indent=2, ensure_ascii=False).encode('utf-8')
+              for node in constitution.get('chapters', []) + constitution.get('schedules', [])]
+    variants = [("json (indent)", None, None), ("gzip", 'gzip', None)]
+    if zstandard:
+        variants.append(("zstd", 'zstd', None))
+        dictionary = train_zstd_dictionary(constitution)
+        dictionary.precompute_compress(level=ZSTD_LEVEL)
+        variants.append(("zstd + dict", 'zstd', dictionary))
+
+    rows = []
+    for name, fmt, dictionary in variants:
+        if fmt is None:
+            rows.append((name, sum(map(len, shards)), 0.0,
+                         best_time(lambda: [json.loads(shard) for shard in shards])))
+            continue
+        packed = [compress_bytes(shard, fmt, dictionary) for shard in shards]
+        rows.append((
+            name,
+            sum(map(len, packed)) + dictionary_size(dictionary),
+            best_time(lambda: [compress_bytes(shard, fmt, dictionary) for shard in shards], repeat=1),
+            best_time(lambda: [json.loads(decompress_bytes(p, fmt, dictionary)) for p in packed]),
+        ))
+    return rows
+
+
+def print_rows(rows: list, total: int):
+    """Print benchmark rows as a table, with ratios against total bytes."""
+    print(f"{'variant':<16}{'bytes':>12}{'ratio':>8}{'compress ms':>13}{'load ms':>11}")
+    for name, size, compress_ms, load_ms in rows:
+        print(f"{name:<16}{size:>12,}{size / total:>8.3f}{compress_ms:>13.1f}{load_ms:>11.2f}")
+
+
+def run_benchmark(data: bytes):
+    """Print the size / compress / load matrix for every available variant."""
+    rows = benchmark_variants(data)
+    shard_rows = benchmark_shards(json.loads(data))
+
+    print("=" * 60)
+    print("Compression Benchmark")
+    print("=" * 60)
+    print("Whole file:")
+    print_rows(rows, len(data))
+    print()
+    print("One file per chapter and schedule (totals):")
+    print_rows(shard_rows, shard_rows[0][1])
+    print()
+    print("load = decompress + json.loads.")
+    if zstandard:
+        print("zstd + dict sizes include the dictionary, which ships as a separate .zdict file.")
+        print("It is trained on this same document, so that row is a best case for it.")
+    else:
+        print("zstd rows need the zstandard package.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write compressed variants of parsed constitution JSON")
+    parser.add_argument('input_json', nargs='?', help="Parsed constitution JSON file")
+    parser.add_argument('-f', '--formats', default=','.join(available_formats()),
+                        help="Comma-separated formats to write (gzip, xz, zstd)")
+    parser.add_argument('--benchmark', action='store_true',
+                        help="Compare size, compress time and load time of every variant")
+    args = parser.parse_args()
+
+    files_dir = Path(__file__).parent.parent / "composeApp" / "src" / "commonMain" / "composeResources" / "files"
+    input_path = Path(args.input_json) if args.input_json else files_dir / "constitution_of_kenya.json"
+
+    if not input_path.exists():
+        print(f"ERROR: Input file not found at {input_path}")
+        return 1
+
+    if args.benchmark:
+        run_benchmark(input_path.read_bytes())
+        return 0
+
+    try:
+        written = write_compressed_variants(input_path, [f.strip() for f in args.formats.split(',') if f.strip()])
+    except (ValueError, RuntimeError) as e:
+        print(f"ERROR: {e}")
+        return 1
+    for path in written:
+        print(f"Saved: {path} ({path.stat().st_size:,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
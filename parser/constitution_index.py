@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Indexed lookups over the parsed constitution.
+
+ConstitutionIndex walks a parsed constitution JSON once, in either the
+app's constitution_of_kenya.json layout or parse_constitution.py's, and
+keeps dicts from article numbers, chapter numbers and clause paths to the
+nodes, so every lookup is a hash probe whatever the size of the document:
+
+    index.article(27)                 the article
+    index.chapter_for_article(27)     the chapter it is in
+    index.part_for_article(27)        its part (parser layout only)
+    index.node("27(4)(b)")            a clause, sub-clause or mini-clause
+    index.resolve("Articles 185(2), 186(1) and 187(2)")
+
+Clause paths use the citation form of constitution_search.py: article
+number, then each clause number, sub-clause letter and mini-clause numeral
+in brackets.
+
+Usage:
+    python constitution_index.py [-i INPUT_JSON] CITATION [CITATION ...]
+"""
+
+import re
+import json
+import argparse
+from pathlib import Path
+from typing import Optional
+
+from constitution_search import CHILD_KEYS, chapter_articles, node_label
+
+
+# One reference in a citation: an article number and its bracketed labels
+REFERENCE_PATTERN = re.compile(r'(\d+)((?:\s*\(\s*[0-9A-Za-z]+\s*\))*)')
+LABEL_PATTERN = re.compile(r'\(\s*([0-9A-Za-z]+)\s*\)')
+
+
+def clause_path(article: int, labels: list) -> str:
+    """The citation form of a node: clause_path(27, ['4', 'b']) -> "27(4)(b)"."""
+    return str(article) + ''.join(f"({label})" for label in labels)
+
+
+def parse_reference(reference: str) -> Optional[tuple[int, list]]:
+    """Split "27 (4)(b)" into (27, ['4', 'b']). None if it does not start with an article number."""
+    match = REFERENCE_PATTERN.match(reference.strip())
+    if not match:
+        return None
+    return int(match.group(1)), [label.lower() for label in LABEL_PATTERN.findall(match.group(2))]
+
+
+class ConstitutionIndex:
+    """Hash indexes from article, chapter, part and clause path to the nodes of a parsed constitution."""
+
+    def __init__(self, constitution: dict):
+        self.constitution = constitution
+        self.chapters = {}
+        self.articles = {}
+        self.article_chapters = {}
+        self.article_parts = {}
+        self.chapter_articles = {}
+        self.nodes = {}
+
+        for chapter in constitution.get('chapters', []):
+            articles = chapter_articles(chapter)
+            number = chapter.get('number')
+            # parse_constitution.py also reports the table of contents as empty chapters
+            if number not in self.chapters or not self.chapter_articles[number]:
+                self.chapters[number] = chapter
+                self.chapter_articles[number] = []
+            if not articles:
+                continue
+
+            parts = {id(article): part for part in chapter.get('parts', []) for article in part.get('articles', [])}
+            for article in articles:
+                article_number = article.get('number')
+                if article_number in self.articles:
+                    continue
+                self.articles[article_number] = article
+                self.article_chapters[article_number] = self.chapters[number]
+                self.article_parts[article_number] = parts.get(id(article))
+                self.chapter_articles[number].append(article)
+                self.index_nodes(article)
+
+    def index_nodes(self, article: dict):
+        """Add the article and every clause, sub-clause and mini-clause in it to self.nodes."""
+        self.nodes[str(article['number'])] = article
+        for clause in article.get('clauses', []):
+            # An article without numbered clauses is only its own text
+            if clause.get('isTextOnly') or not node_label(clause):
+                continue
+            self.index_node(clause, [node_label(clause).lower()], article['number'])
+
+    def index_node(self, node: dict, labels: list, article_number: int):
+        """Add node under its path, then its sub-clauses and mini-clauses under theirs."""
+        self.nodes[clause_path(article_number, labels)] = node
+        for key in CHILD_KEYS:
+            for child in node.get(key, []):
+                label = node_label(child)
+                if label:
+                    self.index_node(child, labels + [label.lower()], article_number)
+
+    def article(self, number: int) -> Optional[dict]:
+        """The article with this number."""
+        return self.articles.get(number)
+
+    def chapter(self, number: int) -> Optional[dict]:
+        """The chapter with this number."""
+        return self.chapters.get(number)
+
+    def chapter_for_article(self, number: int) -> Optional[dict]:
+        """The chapter an article belongs to."""
+        return self.article_chapters.get(number)
+
+    def part_for_article(self, number: int) -> Optional[dict]:
+        """The part an article is listed under. The app layout lists articles under chapters only."""
+        return self.article_parts.get(number)
+
+    def articles_in_chapter(self, number: int) -> list:
+        """The articles of a chapter, in document order."""
+        return self.chapter_articles.get(number, [])
+
+    def node(self, path: str) -> Optional[dict]:
+        """The article or clause at a path such as "27", "27(4)" or "27 (4)(b)"."""
+        reference = parse_reference(path)
+        if reference is None:
+            return None
+        return self.nodes.get(clause_path(*reference))
+
+    def resolve(self, citation: str) -> list:
+        """
+        Resolve every reference in a citation string such as "Article 6 (1)"
+        or "Articles 185(2), 186(1) and 187(2)". Returns (path, node) pairs
+        in citation order, with node None for a reference that is not in
+        the document.
+        """
+        resolved = []
+        for match in REFERENCE_PATTERN.finditer(citation):
+            path = clause_path(*parse_reference(match.group(0)))
+            resolved.append((path, self.nodes.get(path)))
+        return resolved
+
+
+def node_summary(node: dict, limit: int = 100) -> str:
+    """A node's title or text, shortened to limit characters."""
+    text = node.get('title') or node.get('text', '')
+    return text if len(text) <= limit else text[:limit - 3] + '...'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Look up articles and clauses of the parsed constitution")
+    parser.add_argument('citations', nargs='+', help='Citations, e.g. "27(4)(b)" or "Articles 185(2) and 186(1)"')
+    parser.add_argument('-i', '--input', help="Parsed constitution JSON file")
+    args = parser.parse_args()
+
+    files_dir = Path(__file__).parent.parent / "composeApp" / "src" / "commonMain" / "composeResources" / "files"
+    input_path = Path(args.input) if args.input else files_dir / "constitution_of_kenya.json"
+    if not input_path.exists():
+        print(f"ERROR: Input file not found at {input_path}")
+        return 1
+
+    with open(input_path, 'r', encoding='utf-8') as f:
+        index = ConstitutionIndex(json.load(f))
+
+    missing = 0
+    for citation in args.citations:
+        print(citation)
+        for path, node in index.resolve(citation):
+            if node is None:
+                missing += 1
+                print(f"  {path}: not found")
+                continue
+            article = parse_reference(path)[0]
+            chapter = index.chapter_for_article(article)
+            print(f"  {path} (Chapter {chapter['number']}): {node_summary(node)}")
+    return 1 if missing else 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Text extraction from the gazetted Constitution PDF.
+
+Extracts the text of a PDF page by page across worker processes, each
+worker opening the file itself and extracting a contiguous run of pages.
+Pages come back in document order as soon as the run holding them is
+done, so the parser can start on the first chapters while later pages are
+still being extracted. The offset where every page starts in the joined
+text is kept, so a position in the text maps back to its page.
+
+parse_constitution.py reads .pdf inputs through this module. Extraction
+needs the optional pypdf package (pip install pypdf).
+
+Usage:
+    python constitution_pdf.py [input_pdf] [-o OUTPUT] [-j WORKERS] [--pages PAGES_JSON]
+"""
+
+import os
+import json
+import argparse
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional
+
+try:
+    import pypdf
+except ImportError:
+    pypdf = None
+
+
+# Page runs handed to each worker, so a slow page does not hold up the rest
+RUNS_PER_WORKER = 4
+
+
+# ============================================================================
+# Extraction
+# ============================================================================
+
+def require_pypdf():
+    """Fail with an install hint when pypdf is missing."""
+    if pypdf is None:
+        raise RuntimeError("PDF input needs the pypdf package (pip install pypdf)")
+
+
+def pdf_page_count(pdf_path: Path) -> int:
+    """Number of pages in pdf_path."""
+    require_pypdf()
+    return len(pypdf.PdfReader(str(pdf_path)).pages)
+
+
+def extract_page_run(pdf_path: str, start: int, stop: int) -> list:
+    """Text of pages start to stop - 1, each ending in a newline. Runs in a worker process."""
+    reader = pypdf.PdfReader(pdf_path)
+    pages = []
+    for index in range(start, stop):
+        text = (reader.pages[index].extract_text() or '').replace('\r\n', '\n').replace('\r', '\n')
+        pages.append(text if text.endswith('\n') else text + '\n')
+    return pages
+
+
+def page_runs(page_count: int, workers: int) -> list:
+    """Split page_count pages into contiguous (start, stop) runs for workers."""
+    size = max(1, -(-page_count // (workers * RUNS_PER_WORKER)))
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+
+def iter_pdf_pages(pdf_path: Path, workers: Optional[int] = None) -> Iterator[str]:
+    """
+    Yield the text of every page of pdf_path in order. With one worker the
+    pages are extracted in this process; otherwise page runs go to a
+    process pool and each page is yielded once its run is done.
+    """
+    page_count = pdf_page_count(pdf_path)
+    workers = workers or os.cpu_count() or 1
+    runs = page_runs(page_count, workers)
+    if workers == 1 or len(runs) <= 1:
+        for start, stop in runs:
+            yield from extract_page_run(str(pdf_path), start, stop)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(extract_page_run, str(pdf_path), start, stop) for start, stop in runs]
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def iter_pdf_lines(pdf_path: Path, workers: Optional[int] = None,
+                   page_starts: Optional[list] = None) -> Iterator[str]:
+    """
+    Yield the text of pdf_path line by line, as reading a text file would,
+    for iter_constitution. If page_starts is a list, the offset in the
+    joined text where each page starts is appended to it as the page is
+    reached.
+    """
+    offset = 0
+    for page in iter_pdf_pages(pdf_path, workers):
+        if page_starts is not None:
+            page_starts.append(offset)
+        offset += len(page)
+        # Pages end in a newline; split on newlines only, as a text file would
+        for line in page.split('\n')[:-1]:
+            yield line + '\n'
+
+
+def read_pdf_text(pdf_path: Path, workers: Optional[int] = None) -> tuple[str, list]:
+    """The text of pdf_path, and the offset where each of its pages starts."""
+    page_starts = []
+    pages = []
+    offset = 0
+    for page in iter_pdf_pages(pdf_path, workers):
+        page_starts.append(offset)
+        offset += len(page)
+        pages.append(page)
+    return ''.join(pages), page_starts
+
+
+def page_number(page_starts: list, offset: int) -> int:
+    """The 1-based page that a text offset falls on."""
+    return bisect_right(page_starts, offset)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract the text of the Constitution PDF")
+    parser.add_argument('input_pdf', nargs='?', help="Constitution PDF file")
+    parser.add_argument('-o', '--output', help="Output text file (default: next to the PDF)")
+    parser.add_argument('-j', '--workers', type=int, help="Worker processes (default: one per CPU)")
+    parser.add_argument('--pages', metavar='PAGES_JSON', help="Also write the offset where each page starts")
+    args = parser.parse_args()
+
+    files_dir = Path(__file__).parent.parent / "composeApp" / "src" / "commonMain" / "composeResources" / "files"
+    input_path = Path(args.input_pdf) if args.input_pdf else files_dir / "The_Constitution_of_Kenya_2010.pdf"
+    output_path = Path(args.output) if args.output else input_path.with_suffix('.txt')
+
+    if not input_path.exists():
+        print(f"ERROR: Input file not found at {input_path}")
+        return 1
+
+    try:
+        text, page_starts = read_pdf_text(input_path, args.workers)
+    except RuntimeError as e:
+        print(f"ERROR: {e}")
+        return 1
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(text, encoding='utf-8')
+    print(f"Text saved to: {output_path} ({len(page_starts)} pages, {len(text):,} characters)")
+    if args.pages:
+        with open(args.pages, 'w', encoding='utf-8') as f:
+            json.dump({"source": input_path.name, "pageStarts": page_starts}, f)
+        print(f"Page offsets saved to: {args.pages}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
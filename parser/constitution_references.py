@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Cross-reference graph for the parsed constitution.
+
+Extracts the references each article, clause, sub-clause and mini-clause
+makes in its text ("Article 24", "Articles 185(2), 186(1) and 187(2)",
+"clause (3)", "paragraph (b) of clause (2)", "Chapter Six", "the First
+Schedule"), plus the "reference" of each schedule, and keeps them as an
+adjacency list from citing node to cited node with a reverse index beside
+it. Relative references resolve against the node they appear in, so
+"clause (3)" in Article 24 cites "24(3)".
+
+Node ids are the citation paths of constitution_index.py ("24", "24(3)",
+"24(3)(b)"), plus "Chapter 6" and "Schedule 1". The reverse index rolls
+every citation up to the enclosing clauses and article, so
+
+    cited_by(graph, "Article 24")
+
+lists every node citing Article 24 or any clause in it with one dict
+lookup. Works on either JSON layout, like constitution_index.py.
+
+Usage:
+    python constitution_references.py [input_json] [-o OUTPUT]
+    python constitution_references.py [input_json | -i GRAPH] -q REFERENCE
+"""
+
+import re
+import json
+import argparse
+from pathlib import Path
+from typing import Iterator, Optional
+
+from constitution_index import (
+    REFERENCE_PATTERN, LABEL_PATTERN, ConstitutionIndex, clause_path, parse_reference
+)
+from constitution_search import CHILD_KEYS, node_label
+
+
+REFERENCE_GRAPH_VERSION = 1
+
+ORDINALS = ("first", "second", "third", "fourth", "fifth", "sixth")
+CHAPTER_WORDS = (
+    "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten",
+    "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen", "eighteen"
+)
+
+# An article number with its bracketed labels, and a list of them
+_ARTICLE = r'\d+(?:\s*\(\s*[0-9A-Za-z]+\s*\))*'
+_LABELS = r'\(\s*[0-9A-Za-z]+\s*\)(?:\s*\(\s*[0-9A-Za-z]+\s*\))*'
+_LIST_SEPARATOR = r'\s*(?:,|\band\b|\bor\b)\s*'
+
+# One reference in running text. Tried left to right, so "clause (1) of
+# Article 24" is read as one reference and not as "clause (1)" and "Article 24".
+TEXT_REFERENCE_PATTERN = re.compile(
+    rf'(?P<kind>(?i:clause|sub-?paragraph|paragraph))s?\s+'
+    rf'(?P<labels>{_LABELS}(?:{_LIST_SEPARATOR}{_LABELS})*)'
+    rf'(?:\s+of\s+(?i:clause)\s+\(\s*(?P<of_clause>\d+)\s*\))?'
+    rf'(?:\s+of\s+Article\s+(?P<of_article>\d+))?'
+    rf'|\bArticles?\s+(?P<articles>{_ARTICLE}(?:{_LIST_SEPARATOR}(?:{_ARTICLE}|{_LABELS}))*)'
+    rf'|\bChapter\s+(?P<chapter>\d+|(?i:{"|".join(CHAPTER_WORDS)}))\b'
+    rf'|\b(?P<schedule>(?i:{"|".join(ORDINALS)}))\s+Schedule\b'
+)
+LIST_SEPARATOR_PATTERN = re.compile(_LIST_SEPARATOR)
+# One item of an article list: an optional article number and its labels
+ITEM_PATTERN = re.compile(r'(\d*)((?:\s*\(\s*[0-9A-Za-z]+\s*\))*)')
+# Labels that sit above a relative reference: clause for "paragraph", clause and sub-clause for "subparagraph"
+RELATIVE_DEPTH = {"clause": 0, "paragraph": 1, "subparagraph": 2}
+
+
+# ============================================================================
+# Extraction
+# ============================================================================
+
+def chapter_id(number: int) -> str:
+    """The node id of a chapter."""
+    return f"Chapter {number}"
+
+
+def schedule_id(number: int) -> str:
+    """The node id of a schedule."""
+    return f"Schedule {number}"
+
+
+def chapter_number(word: str) -> int:
+    """A chapter number written as digits or as a word: "Six" -> 6."""
+    return int(word) if word.isdigit() else CHAPTER_WORDS.index(word.lower()) + 1
+
+
+def label_kind(label: str) -> str:
+    """Whether a label is a clause number, a mini-clause numeral or a sub-clause letter."""
+    if label.isdigit():
+        return "number"
+    return "numeral" if set(label) <= set("ivx") else "letter"
+
+
+def continued_references(references: list) -> list:
+    """
+    Complete the items of a reference list: in "clause (1) (c) and (d)" an
+    item shorter than the one before, starting with the same kind of label
+    as the one it lines up with, keeps that one's leading labels, so
+    [['1', 'c'], ['d']] -> [['1', 'c'], ['1', 'd']]. An item starting with a
+    number is always complete: it names its own clause or article.
+    """
+    completed = []
+    previous = []
+    for reference in references:
+        depth = len(previous) - len(reference)
+        kind = label_kind(reference[0]) if reference else "number"
+        if depth > 0 and kind != "number" and kind == label_kind(previous[depth]):
+            reference = previous[:depth] + reference
+        completed.append(reference)
+        previous = reference
+    return completed
+
+
+def resolve_match(match: re.Match, article: int, labels: list) -> Iterator[str]:
+    """Yield the node ids one TEXT_REFERENCE_PATTERN match cites from the node at article and labels."""
+    if match.group('articles'):
+        # "Article 24 (1) (b) and (c)": the article number is kept as the first label
+        references = []
+        for item in LIST_SEPARATOR_PATTERN.split(match.group('articles')):
+            number, labels = ITEM_PATTERN.match(item).groups()
+            references.append(([number] if number else []) + [label.lower() for label in LABEL_PATTERN.findall(labels)])
+        for reference in continued_references(references):
+            yield clause_path(int(reference[0]), reference[1:])
+    elif match.group('chapter'):
+        yield chapter_id(chapter_number(match.group('chapter')))
+    elif match.group('schedule'):
+        yield schedule_id(ORDINALS.index(match.group('schedule').lower()) + 1)
+    else:
+        kind = match.group('kind').lower().replace('-', '')
+        references = [[label.lower() for label in LABEL_PATTERN.findall(reference)]
+                      for reference in LIST_SEPARATOR_PATTERN.split(match.group('labels'))]
+        # A few clauses say "clause (a)" where they mean a paragraph
+        if kind == "clause" and not references[0][0].isdigit():
+            kind = "paragraph"
+        base = labels[:RELATIVE_DEPTH[kind]]
+        if match.group('of_article'):
+            article, base = int(match.group('of_article')), []
+        if match.group('of_clause'):
+            base = [match.group('of_clause')]
+        for reference in continued_references(references):
+            yield clause_path(article, base + reference)
+
+
+def extract_references(text: str, article: int, labels: list) -> list:
+    """Node ids cited in text, which belongs to the node at article and labels, in order and without repeats."""
+    references = []
+    for match in TEXT_REFERENCE_PATTERN.finditer(text):
+        for reference in resolve_match(match, article, labels):
+            if reference not in references:
+                references.append(reference)
+    return references
+
+
+def iter_texts(index: ConstitutionIndex) -> Iterator[tuple[str, int, list, str]]:
+    """
+    Yield (node_id, article, labels, text) for the title and text of every
+    article and the text of every clause, sub-clause and mini-clause, in
+    document order. An unnumbered clause's text belongs to its article.
+    """
+    def walk(node: dict, article: int, labels: list):
+        yield clause_path(article, labels), article, labels, node.get('text', '')
+        for key in CHILD_KEYS:
+            for child in node.get(key, []):
+                label = node_label(child)
+                if label:
+                    yield from walk(child, article, labels + [label.lower()])
+
+    for number, article in index.articles.items():
+        yield str(number), number, [], article.get('title', '')
+        for clause in article.get('clauses', []):
+            label = node_label(clause)
+            if clause.get('isTextOnly') or not label:
+                yield from walk(clause, number, [])
+            else:
+                yield from walk(clause, number, [label.lower()])
+
+
+# ============================================================================
+# Graph Building
+# ============================================================================
+
+def enclosing_ids(node_id: str) -> list:
+    """A node id and the ids of the clauses and article around it: "24(3)(b)" -> ["24(3)(b)", "24(3)", "24"]."""
+    reference = parse_reference(node_id) if node_id[:1].isdigit() else None
+    if reference is None:
+        return [node_id]
+    article, labels = reference
+    return [clause_path(article, labels[:depth]) for depth in range(len(labels), -1, -1)]
+
+
+def build_reference_graph(constitution: dict) -> dict:
+    """
+    Build the graph: "cites" maps each citing node to the nodes it cites,
+    in document order; "citedBy" maps each cited node, and every clause and
+    article enclosing it, to the nodes citing it. "unresolved" lists cited
+    ids that are not in the document.
+    """
+    index = ConstitutionIndex(constitution)
+    cites = {}
+
+    def add(source: str, targets: list):
+        targets = [target for target in targets if target != source]
+        if targets:
+            existing = cites.setdefault(source, [])
+            existing.extend(target for target in targets if target not in existing)
+
+    for node_id, article, labels, text in iter_texts(index):
+        if text:
+            add(node_id, extract_references(text, article, labels))
+    for schedule in constitution.get('schedules', []):
+        reference = schedule.get('reference') or ''
+        add(schedule_id(schedule.get('number')),
+            [clause_path(*parse_reference(match.group(0))) for match in REFERENCE_PATTERN.finditer(reference)])
+
+    cited_by = {}
+    for source, targets in cites.items():
+        for target in targets:
+            for node_id in enclosing_ids(target):
+                sources = cited_by.setdefault(node_id, [])
+                if source not in sources:
+                    sources.append(source)
+
+    known = set(index.nodes)
+    known.update(chapter_id(number) for number, articles in index.chapter_articles.items() if articles)
+    known.update(schedule_id(schedule.get('number')) for schedule in constitution.get('schedules', []))
+    unresolved = sorted({target for targets in cites.values() for target in targets if target not in known})
+
+    return {
+        "version": REFERENCE_GRAPH_VERSION,
+        "cites": cites,
+        "citedBy": cited_by,
+        "unresolved": unresolved,
+    }
+
+
+def write_reference_graph(graph: dict, output_path: Path):
+    """
+    Write the graph as compact JSON: every node id once in "nodes", and each
+    adjacency list as a row of node numbers, the first being the key.
+    """
+    numbers = {}
+    for source, targets in graph["cites"].items():
+        for node_id in [source] + targets:
+            numbers.setdefault(node_id, len(numbers))
+    for node_id in graph["citedBy"]:
+        numbers.setdefault(node_id, len(numbers))
+
+    stored = {
+        "version": graph["version"],
+        "nodes": list(numbers),
+        "cites": [[numbers[node_id] for node_id in [source] + targets] for source, targets in graph["cites"].items()],
+        "citedBy": [[numbers[node_id] for node_id in [target] + sources]
+                    for target, sources in graph["citedBy"].items()],
+        "unresolved": [numbers[node_id] for node_id in graph["unresolved"]],
+    }
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(stored, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def load_reference_graph(graph_path: Path) -> dict:
+    """Load a graph written by write_reference_graph."""
+    with open(graph_path, 'r', encoding='utf-8') as f:
+        stored = json.load(f)
+    if stored.get("version") != REFERENCE_GRAPH_VERSION:
+        raise ValueError(f"Unsupported reference graph version {stored.get('version')}")
+    nodes = stored["nodes"]
+    return {
+        "version": stored["version"],
+        "cites": {nodes[row[0]]: [nodes[n] for n in row[1:]] for row in stored["cites"]},
+        "citedBy": {nodes[row[0]]: [nodes[n] for n in row[1:]] for row in stored["citedBy"]},
+        "unresolved": [nodes[n] for n in stored["unresolved"]],
+    }
+
+
+# ============================================================================
+# Querying
+# ============================================================================
+
+def reference_id(reference: str) -> Optional[str]:
+    """
+    The node id a reference names: "Article 24", "24(3)", "Chapter Six",
+    "chapter 6", "First Schedule" or "Schedule 1". None if it names none.
+    """
+    reference = reference.strip()
+    match = re.fullmatch(rf'(?i:chapter)\s+(\d+|(?i:{"|".join(CHAPTER_WORDS)}))', reference)
+    if match:
+        return chapter_id(chapter_number(match.group(1)))
+    match = re.fullmatch(r'(?i:schedule)\s+(\d+)', reference)
+    if match:
+        return schedule_id(int(match.group(1)))
+    match = re.fullmatch(rf'(?i:(?:the\s+)?({"|".join(ORDINALS)})\s+schedule)', reference)
+    if match:
+        return schedule_id(ORDINALS.index(match.group(1).lower()) + 1)
+    parsed = parse_reference(re.sub(r'^(?i:articles?|art\.?)\s*', '', reference))
+    return clause_path(*parsed) if parsed else None
+
+
+def cited_by(graph: dict, reference: str) -> list:
+    """The nodes citing reference or anything inside it, e.g. cited_by(graph, "Article 24")."""
+    return graph["citedBy"].get(reference_id(reference), [])
+
+
+def cites(graph: dict, reference: str) -> list:
+    """The nodes that reference itself cites."""
+    return graph["cites"].get(reference_id(reference), [])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the constitution cross-reference graph")
+    parser.add_argument('input_json', nargs='?', help="Parsed constitution JSON file")
+    parser.add_argument('-o', '--output', help="Output graph file")
+    parser.add_argument('-i', '--graph', help="Query this prebuilt graph instead of building one from input_json")
+    parser.add_argument('-q', '--query', help='Show what cites a reference and what it cites, e.g. "Article 24"')
+    args = parser.parse_args()
+
+    files_dir = Path(__file__).parent.parent / "composeApp" / "src" / "commonMain" / "composeResources" / "files"
+    input_path = Path(args.input_json) if args.input_json else files_dir / "constitution_of_kenya.json"
+    output_path = Path(args.output) if args.output else input_path.with_name(input_path.stem + "_references.json")
+
+    if args.graph and args.query:
+        graph = load_reference_graph(Path(args.graph))
+    elif not input_path.exists():
+        print(f"ERROR: Input file not found at {input_path}")
+        return 1
+    else:
+        with open(input_path, 'r', encoding='utf-8') as f:
+            graph = build_reference_graph(json.load(f))
+
+    if args.query:
+        node_id = reference_id(args.query)
+        if node_id is None:
+            print(f"ERROR: Not a reference: {args.query}")
+            return 1
+        citing, cited = cited_by(graph, args.query), cites(graph, args.query)
+        print(f"{node_id} is cited by {len(citing)}: {', '.join(citing) or '-'}")
+        print(f"{node_id} cites {len(cited)}: {', '.join(cited) or '-'}")
+        return 0
+
+    write_reference_graph(graph, output_path)
+    edges = sum(len(targets) for targets in graph["cites"].values())
+    print(f"{len(graph['cites'])} citing nodes, {edges} references, {len(graph['unresolved'])} unresolved")
+    print(f"Graph saved to: {output_path}")
+    print(f"Graph size: {output_path.stat().st_size:,} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
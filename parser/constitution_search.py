@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Ranked full-text search index for the parsed constitution.
+
+Builds an inverted index over every article title and clause (with its
+sub-clauses and mini-clauses) of a parsed constitution JSON, in either the
+app's constitution_of_kenya.json layout or parse_constitution.py's. Postings
+are keyed by stable node ids in citation form, e.g. "19(1)(a)", and carry
+precomputed BM25 weights, so a query only sums the postings of its terms.
+
+Usage:
+    python constitution_search.py [input_json] [-o OUTPUT]
+    python constitution_search.py [input_json | -i INDEX] -q QUERY [-n LIMIT]
+"""
+
+import re
+import json
+import math
+import heapq
+import argparse
+from pathlib import Path
+from typing import Iterator, Optional
+
+
+SEARCH_INDEX_VERSION = 1
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+# Function words that carry no meaning in a legal search
+STOP_WORDS = frozenset("""
+    a an and any are as at be been by for from has have if in into is it its
+    of on or such that the their them there these this those to under upon
+    was were which who whom with
+""".split())
+
+# Words whose ending looks like an inflection but is part of the word
+STEM_EXCEPTIONS = frozenset("""
+    access address always analysis bias basis business class congress crisis
+    process progress status thus various whereas witness
+""".split())
+
+# Suffix rules applied in order, first match wins: (suffix, replacement)
+STEM_RULES = [
+    ('ies', 'y'),
+    ('sses', 'ss'),
+    ('ments', ''),
+    ('ment', ''),
+    ('ings', ''),
+    ('ing', ''),
+    ('edly', ''),
+    ('ed', ''),
+    ('es', 'e'),
+    ('s', ''),
+]
+
+# Child lists and their label keys, outermost first
+CHILD_KEYS = ('subClauses', 'miniClauses', 'subSubClauses')
+LABEL_KEYS = ('label', 'numeral', 'number')
+
+
+# ============================================================================
+# Tokenization
+# ============================================================================
+
+def stem(word: str) -> str:
+    """
+    Strip plural and verb endings so that "rights"/"right" and
+    "appointed"/"appointment"/"appoint" meet. Deliberately light: legal terms of
+    art are kept distinct, and no stem is shorter than three letters.
+    """
+    if len(word) <= 3 or word in STEM_EXCEPTIONS or word.isdigit():
+        return word
+    if word.endswith(('ss', 'us', 'is')):
+        return word
+    for suffix, replacement in STEM_RULES:
+        if word.endswith(suffix):
+            base = word[:-len(suffix)] + replacement
+            if len(base) < 3:
+                return word
+            # "appointed" -> "appoint", "committed" -> "commit"
+            if suffix in ('ed', 'ing', 'ings') and len(base) > 3 and base[-1] == base[-2] and base[-1] not in 'lsz':
+                base = base[:-1]
+            return base
+    return word
+
+
+def tokenize(text: str) -> list:
+    """Lowercase, split into words, drop stop words and stem the rest."""
+    tokens = []
+    for word in TOKEN_PATTERN.findall(text.lower()):
+        if word.endswith("'s"):
+            word = word[:-2]
+        if word not in STOP_WORDS:
+            tokens.append(stem(word))
+    return tokens
+
+
+# ============================================================================
+# Index Building
+# ============================================================================
+
+def chapter_articles(chapter: dict) -> list:
+    """Articles of a chapter, whether listed directly or inside its parts."""
+    articles = list(chapter.get('articles', []))
+    for part in chapter.get('parts', []):
+        articles.extend(part.get('articles', []))
+    return articles
+
+
+def node_label(node: dict) -> str:
+    """The clause number, sub-clause letter or mini-clause numeral of a node."""
+    for key in LABEL_KEYS:
+        if node.get(key) not in (None, ''):
+            return str(node[key])
+    return ''
+
+
+def node_text(node: dict) -> str:
+    """A clause's text followed by the text of everything nested in it."""
+    texts = [node.get('text', '')]
+    for key in CHILD_KEYS:
+        for child in node.get(key, []):
+            texts.append(node_text(child))
+    return ' '.join(t for t in texts if t)
+
+
+def iter_documents(constitution: dict) -> Iterator[tuple[str, int, int, Optional[str], str]]:
+    """
+    Yield (node_id, chapter, article, clause, text) for every article and
+    every numbered clause. Node ids are citations: "19" for an article (its
+    title and any unnumbered text), "19(1)" for a clause, so they survive
+    re-parses and reordering. A citation seen before gets an ordinal suffix,
+    "19(1)-2", so every id is unique.
+    """
+    used = set()
+
+    def unique(node_id: str) -> str:
+        candidate = node_id
+        count = 1
+        while candidate in used:
+            count += 1
+            candidate = f"{node_id}-{count}"
+        used.add(candidate)
+        return candidate
+
+    for chapter in constitution.get('chapters', []):
+        for article in chapter_articles(chapter):
+            article_id = str(article['number'])
+            clauses = []
+            # An article without numbered clauses is only its own text
+            texts = [article.get('title', '')]
+            for clause in article.get('clauses', []):
+                label = '' if clause.get('isTextOnly') else node_label(clause)
+                if label:
+                    clauses.append((label, clause))
+                else:
+                    texts.append(node_text(clause))
+            text = ' '.join(t for t in texts if t)
+            if text:
+                yield unique(article_id), chapter['number'], article['number'], None, text
+            for label, clause in clauses:
+                yield unique(f"{article_id}({label})"), chapter['number'], article['number'], label, node_text(clause)
+
+
+def bm25_idf(total: int, df: int) -> float:
+    """BM25 inverse document frequency, floored so very common terms never count against a match."""
+    return max(math.log((total - df + 0.5) / (df + 0.5) + 1), 0.0)
+
+
+def build_search_index(constitution: dict, k1: float = BM25_K1, b: float = BM25_B) -> dict:
+    """
+    Build the inverted index. Each posting is [doc, weight], where weight is
+    the term's full BM25 contribution to that document's score:
+    idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / average_length)).
+    """
+    docs = []
+    term_counts = []
+    for node_id, chapter, article, clause, text in iter_documents(constitution):
+        counts = {}
+        tokens = tokenize(text)
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        docs.append([node_id, chapter, article, clause, len(tokens)])
+        term_counts.append(counts)
+
+    total = len(docs)
+    average_length = sum(doc[4] for doc in docs) / total if total else 0.0
+
+    document_frequency = {}
+    for counts in term_counts:
+        for term in counts:
+            document_frequency[term] = document_frequency.get(term, 0) + 1
+
+    postings = {term: [] for term in sorted(document_frequency)}
+    for doc, counts in enumerate(term_counts):
+        norm = k1 * (1 - b + b * docs[doc][4] / average_length) if average_length else k1
+        for term, tf in counts.items():
+            df = document_frequency[term]
+            idf = bm25_idf(total, df)
+            postings[term].append([doc, round(idf * tf * (k1 + 1) / (tf + norm), 4)])
+
+    return {
+        "version": SEARCH_INDEX_VERSION,
+        "k1": k1,
+        "b": b,
+        "averageLength": round(average_length, 4),
+        "docs": docs,
+        "postings": postings,
+    }
+
+
+def write_search_index(index: dict, output_path: Path):
+    """Write the index as compact JSON."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def load_search_index(index_path: Path) -> dict:
+    """Load an index written by write_search_index."""
+    with open(index_path, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    if index.get("version") != SEARCH_INDEX_VERSION:
+        raise ValueError(f"Unsupported search index version {index.get('version')}")
+    return index
+
+
+# ============================================================================
+# Querying
+# ============================================================================
+
+def search(index: dict, query: str, limit: int = 10) -> list:
+    """
+    Return up to limit hits for query, best first, as dicts with the node
+    id, chapter, article, clause (None for an article title) and score.
+    Only the postings of the query's terms are read.
+    """
+    scores = {}
+    for term in set(tokenize(query)):
+        for doc, weight in index["postings"].get(term, ()):
+            scores[doc] = scores.get(doc, 0.0) + weight
+
+    best = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+    hits = []
+    for doc, score in best:
+        node_id, chapter, article, clause, _ = index["docs"][doc]
+        hits.append({
+            "id": node_id,
+            "chapter": chapter,
+            "article": article,
+            "clause": clause,
+            "score": round(score, 4),
+        })
+    return hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the constitution search index")
+    parser.add_argument('input_json', nargs='?', help="Parsed constitution JSON file")
+    parser.add_argument('-o', '--output', help="Output index file")
+    parser.add_argument('-i', '--index', help="Query this prebuilt index instead of indexing input_json")
+    parser.add_argument('-q', '--query', help="Search the index instead of writing it")
+    parser.add_argument('-n', '--limit', type=int, default=10, help="Number of hits to show")
+    args = parser.parse_args()
+
+    files_dir = Path(__file__).parent.parent / "composeApp" / "src" / "commonMain" / "composeResources" / "files"
+    input_path = Path(args.input_json) if args.input_json else files_dir / "constitution_of_kenya.json"
+    output_path = Path(args.output) if args.output else input_path.with_name(input_path.stem + "_index.json")
+
+    if args.index and args.query:
+        index = load_search_index(Path(args.index))
+    elif not input_path.exists():
+        print(f"ERROR: Input file not found at {input_path}")
+        return 1
+    else:
+        with open(input_path, 'r', encoding='utf-8') as f:
+            index = build_search_index(json.load(f))
+
+    if args.query:
+        for hit in search(index, args.query, args.limit):
+            print(f"  {hit['score']:8.3f}  Chapter {hit['chapter']}, Article {hit['id']}")
+        return 0
+
+    write_search_index(index, output_path)
+    print(f"Indexed {len(index['docs'])} articles and clauses, {len(index['postings'])} terms")
+    print(f"Index saved to: {output_path}")
+    print(f"Index size: {output_path.stat().st_size:,} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
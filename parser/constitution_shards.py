@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Sharded output for the parsed constitution.
+
+Splits a parsed constitution JSON into a small manifest.json (preamble,
+chapter, part and article titles, plus the size and SHA-256 of every
+shard) and one compact JSON file per chapter and per schedule, so a reader
+can show the table of contents after decoding only the manifest and fetch
+chapters as they are opened.
+
+Layout:
+    manifest.json
+    chapters/chapter_01.json ... chapter_18.json
+    schedules/schedule_1.json ... schedule_6.json
+
+Usage:
+    python constitution_shards.py [input_json] [-o OUTPUT_DIR]
+"""
+
+import json
+import hashlib
+import argparse
+from pathlib import Path
+
+from constitution_search import chapter_articles
+
+
+SHARD_MANIFEST_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+
+def dump_compact(value) -> bytes:
+    """Serialize a shard or manifest as compact UTF-8 JSON."""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def shard_path(kind: str, number: int) -> str:
+    """Relative path of a chapter or schedule shard."""
+    stem = f"{kind}_{number:02d}" if kind == "chapter" else f"{kind}_{number}"
+    return f"{kind}s/{stem}.json"
+
+
+def unique_chapters(chapters: list) -> list:
+    """
+    One chapter per number, in order of first appearance. parse_constitution.py
+    also reports the table of contents as empty chapters, so when a number
+    repeats the copy that has articles is kept.
+    """
+    by_number = {}
+    for chapter in chapters:
+        number = chapter['number']
+        if number not in by_number or not chapter_articles(by_number[number]):
+            by_number[number] = chapter
+    return list(by_number.values())
+
+
+def write_shard(output_dir: Path, relative_path: str, value) -> dict:
+    """Write one shard and return its manifest entry fields."""
+    data = dump_compact(value)
+    path = output_dir / relative_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return {
+        "file": relative_path,
+        "bytes": len(data),
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+
+
+# ============================================================================
+# Writing
+# ============================================================================
+
+def write_shards(constitution: dict, output_dir: Path) -> dict:
+    """
+    Write the manifest and one shard per chapter and schedule into
+    output_dir. Top-level fields other than the chapters and schedules
+    (the preamble, and metadata where present) go into the manifest.
+    A chapter number reported more than once is sharded once (see
+    unique_chapters). Returns the manifest.
+    """
+    chapters = []
+    for chapter in unique_chapters(constitution.get('chapters', [])):
+        entry = {"number": chapter['number'], "title": chapter.get('title', '')}
+        if chapter.get('parts'):
+            entry["parts"] = [{"number": p['number'], "title": p.get('title', '')} for p in chapter['parts']]
+        entry["articles"] = [
+            {"number": a['number'], "title": a.get('title', '')} for a in chapter_articles(chapter)
+        ]
+        entry.update(write_shard(output_dir, shard_path("chapter", chapter['number']), chapter))
+        chapters.append(entry)
+
+    schedules = []
+    for schedule in constitution.get('schedules', []):
+        entry = {"number": schedule['number'], "title": schedule.get('title', '')}
+        entry.update(write_shard(output_dir, shard_path("schedule", schedule['number']), schedule))
+        schedules.append(entry)
+
+    manifest = {
+        "version": SHARD_MANIFEST_VERSION,
+        "front": {k: v for k, v in constitution.items() if k not in ('chapters', 'schedules')},
+        "chapters": chapters,
+        "schedules": schedules,
+    }
+    (output_dir / MANIFEST_NAME).write_bytes(dump_compact(manifest))
+    return manifest
+
+
+# ============================================================================
+# Loading
+# ============================================================================
+
+def load_manifest(shard_dir: Path) -> dict:
+    """Load the manifest: everything needed for the table of contents."""
+    with open(shard_dir / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get("version") != SHARD_MANIFEST_VERSION:
+        raise ValueError(f"Unsupported shard manifest version {manifest.get('version')}")
+    return manifest
+
+
+def load_shard(shard_dir: Path, entry: dict) -> dict:
+    """Read one shard, checking it against its manifest size and hash."""
+    data = (shard_dir / entry["file"]).read_bytes()
+    if len(data) != entry["bytes"] or hashlib.sha256(data).hexdigest() != entry["sha256"]:
+        raise ValueError(f"Shard {entry['file']} does not match the manifest")
+    return json.loads(data)
+
+
+def find_entry(entries: list, number: int, kind: str) -> dict:
+    """The manifest entry with the given number."""
+    for entry in entries:
+        if entry["number"] == number:
+            return entry
+    raise KeyError(f"No {kind} {number} in the manifest")
+
+
+def load_chapter(shard_dir: Path, manifest: dict, number: int) -> dict:
+    """Fetch one chapter on demand."""
+    return load_shard(shard_dir, find_entry(manifest["chapters"], number, "chapter"))
+
+
+def load_schedule(shard_dir: Path, manifest: dict, number: int) -> dict:
+    """Fetch one schedule on demand."""
+    return load_shard(shard_dir, find_entry(manifest["schedules"], number, "schedule"))
+
+
+def load_all_shards(shard_dir: Path) -> dict:
+    """Reassemble the full constitution from the manifest and every shard."""
+    manifest = load_manifest(shard_dir)
+    constitution = dict(manifest["front"])
+    constitution["chapters"] = [load_shard(shard_dir, e) for e in manifest["chapters"]]
+    constitution["schedules"] = [load_shard(shard_dir, e) for e in manifest["schedules"]]
+    return constitution
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split parsed constitution JSON into lazily loaded shards")
+    parser.add_argument('input_json', nargs='?', help="Parsed constitution JSON file")
+    parser.add_argument('-o', '--output', help="Output directory")
+    args = parser.parse_args()
+
+    files_dir = Path(__file__).parent.parent / "composeApp" / "src" / "commonMain" / "composeResources" / "files"
+    input_path = Path(args.input_json) if args.input_json else files_dir / "constitution_of_kenya.json"
+    output_dir = Path(args.output) if args.output else input_path.with_name(input_path.stem + "_shards")
+
+    if not input_path.exists():
+        print(f"ERROR: Input file not found at {input_path}")
+        return 1
+
+    with open(input_path, 'r', encoding='utf-8') as f:
+        constitution = json.load(f)
+
+    manifest = write_shards(constitution, output_dir)
+    shard_bytes = sum(e["bytes"] for e in manifest["chapters"] + manifest["schedules"])
+    print(f"Shards saved to: {output_dir}")
+    print(f"Manifest size: {(output_dir / MANIFEST_NAME).stat().st_size:,} bytes")
+    print(f"Shards: {len(manifest['chapters'])} chapters, {len(manifest['schedules'])} schedules, {shard_bytes:,} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
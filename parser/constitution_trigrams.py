@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Trigram index for substring and phrase search over parsed constitutions.
+
+Indexes the text of every article title and clause (see
+constitution_search.iter_documents) of one or more parsed constitution JSON
+files by its character trigrams. Each trigram maps to a sorted array of
+document numbers, stored delta-encoded. A query is answered by intersecting
+the postings of its trigrams and verifying the few surviving candidates, so
+fragments like "county assem" or "141(3)" never need a scan of every text.
+
+Usage:
+    python constitution_trigrams.py [input_json ...] [-o OUTPUT]
+    python constitution_trigrams.py [input_json ... | -i INDEX] -q QUERY [-n LIMIT]
+"""
+
+import json
+import argparse
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+
+from constitution_search import iter_documents
+
+
+TRIGRAM_INDEX_VERSION = 1
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and collapse whitespace, for both indexed text and queries."""
+    return ' '.join(text.lower().split())
+
+
+def trigrams(text: str) -> set:
+    """Every distinct three-character substring of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+# ============================================================================
+# Index Building
+# ============================================================================
+
+def build_trigram_index(sources: dict) -> dict:
+    """
+    Build the index over several parsed constitutions, given as
+    {source_name: constitution}. Each document's text is prefixed with its
+    citation ("141(3) ...") so clause numbers can be searched too.
+    """
+    docs = []
+    texts = []
+    postings = {}
+    for source, constitution in sources.items():
+        for node_id, chapter, article, clause, text in iter_documents(constitution):
+            doc = len(docs)
+            docs.append([source, node_id, chapter, article, clause])
+            text = normalize_text(f"{node_id} {text}")
+            texts.append(text)
+            for trigram in trigrams(text):
+                postings.setdefault(trigram, []).append(doc)
+
+    return {
+        "version": TRIGRAM_INDEX_VERSION,
+        "docs": docs,
+        "texts": texts,
+        # Documents are numbered in order, so every posting list is sorted
+        "trigrams": {trigram: delta_encode(docs_with) for trigram, docs_with in sorted(postings.items())},
+    }
+
+
+def delta_encode(numbers: list) -> list:
+    """Store a sorted list as its first value and successive differences."""
+    return [b - a for a, b in zip([0] + numbers, numbers)]
+
+
+def delta_decode(deltas: list) -> array:
+    """Rebuild the sorted array from delta_encode's output."""
+    numbers = array('I')
+    total = 0
+    for delta in deltas:
+        total += delta
+        numbers.append(total)
+    return numbers
+
+
+def write_trigram_index(index: dict, output_path: Path):
+    """Write the index as compact JSON, leaving out postings decoded by queries."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    stored = {key: value for key, value in index.items() if not key.startswith('_')}
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(stored, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def load_trigram_index(index_path: Path) -> dict:
+    """Load an index written by write_trigram_index."""
+    with open(index_path, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    if index.get("version") != TRIGRAM_INDEX_VERSION:
+        raise ValueError(f"Unsupported trigram index version {index.get('version')}")
+    return index
+
+
+# ============================================================================
+# Matching
+# ============================================================================
+
+def posting_array(index: dict, trigram: str) -> array:
+    """The sorted document array for a trigram, decoded once and kept."""
+    decoded = index.setdefault("_decoded", {})
+    numbers = decoded.get(trigram)
+    if numbers is None:
+        numbers = decoded[trigram] = delta_decode(index["trigrams"].get(trigram, ()))
+    return numbers
+
+
+def intersect(smaller, larger) -> list:
+    """Intersect two sorted arrays by galloping through the larger one."""
+    result = []
+    pos = 0
+    for number in smaller:
+        pos = bisect_left(larger, number, pos)
+        if pos == len(larger):
+            break
+        if larger[pos] == number:
+            result.append(number)
+    return result
+
+
+def find_substring(index: dict, query: str, limit: int = 0) -> list:
+    """
+    Return the documents whose text contains query, in document order, as
+    dicts with the source, node id, chapter, article, clause and the offset
+    of the first match. limit=0 returns every match.
+    """
+    query = normalize_text(query)
+    if not query:
+        return []
+
+    if len(query) < 3:
+        # Too short for a trigram: every document is a candidate
+        candidates = range(len(index["texts"]))
+    else:
+        postings = sorted((posting_array(index, t) for t in trigrams(query)), key=len)
+        candidates = postings[0]
+        for other in postings[1:]:
+            if not candidates:
+                break
+            candidates = intersect(candidates, other)
+
+    hits = []
+    for doc in candidates:
+        offset = index["texts"][doc].find(query)
+        if offset < 0:
+            continue
+        source, node_id, chapter, article, clause = index["docs"][doc]
+        hits.append({
+            "source": source,
+            "id": node_id,
+            "chapter": chapter,
+            "article": article,
+            "clause": clause,
+            "offset": offset,
+        })
+        if limit and len(hits) == limit:
+            break
+    return hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the constitution trigram index")
+    parser.add_argument('input_json', nargs='*', help="Parsed constitution JSON files")
+    parser.add_argument('-o', '--output', help="Output index file")
+    parser.add_argument('-i', '--index', help="Query this prebuilt index instead of indexing input_json")
+    parser.add_argument('-q', '--query', help="Search the index instead of writing it")
+    parser.add_argument('-n', '--limit', type=int, default=20, help="Number of hits to show")
+    args = parser.parse_args()
+
+    files_dir = Path(__file__).parent.parent / "composeApp" / "src" / "commonMain" / "composeResources" / "files"
+    input_paths = [Path(p) for p in args.input_json] or [files_dir / "constitution_of_kenya.json"]
+    output_path = Path(args.output) if args.output else input_paths[0].with_name(input_paths[0].stem + "_trigrams.json")
+
+    if args.index and args.query:
+        index = load_trigram_index(Path(args.index))
+    else:
+        sources = {}
+        for input_path in input_paths:
+            if not input_path.exists():
+                print(f"ERROR: Input file not found at {input_path}")
+                return 1
+            # Hits name their source by file stem, so two inputs may not share one
+            if input_path.stem in sources:
+                print(f"ERROR: Two inputs are named {input_path.stem}; rename one of them")
+                return 1
+            with open(input_path, 'r', encoding='utf-8') as f:
+                sources[input_path.stem] = json.load(f)
+        index = build_trigram_index(sources)
+
+    if args.query:
+        for hit in find_substring(index, args.query, args.limit):
+            print(f"  {hit['source']}: Chapter {hit['chapter']}, Article {hit['id']}")
+        return 0
+
+    write_trigram_index(index, output_path)
+    print(f"Indexed {len(index['docs'])} articles and clauses, {len(index['trigrams'])} trigrams")
+    print(f"Index saved to: {output_path}")
+    print(f"Index size: {output_path.stat().st_size:,} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
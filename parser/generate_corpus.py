@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Synthetic constitution-shaped corpus generator.
+
+Writes text in the layout both parsers expect from
+The_Constitution_of_Kenya_2010.txt: an arrangement of chapters,
+"PREAMBLE", "CHAPTER ONE—TITLE" headings, "PART 1—TITLE" headings, article
+title lines ending in a period, "12. (1) ..." clauses with "(a)" sub-clauses
+and "(iv)" mini-clauses, "Constitution of Kenya, 2010 12" page footers, and
+a SCHEDULES block with all six schedules. The words are made up from a
+small legal vocabulary.
+
+Output depends only on the options: the same seed and sizes always give
+the same text, so benchmark and regression runs can be reproduced.
+
+Usage:
+    python generate_corpus.py [-o OUTPUT] [--seed N] [--chapters N] [--articles N]
+                              [--parts N] [--depth 1-3] [--noise 0.0-1.0]
+"""
+
+import random
+import argparse
+from pathlib import Path
+
+
+# Both parsers only know chapters ONE to EIGHTEEN
+CHAPTER_WORDS = [
+    'ONE', 'TWO', 'THREE', 'FOUR', 'FIVE', 'SIX', 'SEVEN', 'EIGHT', 'NINE',
+    'TEN', 'ELEVEN', 'TWELVE', 'THIRTEEN', 'FOURTEEN', 'FIFTEEN', 'SIXTEEN',
+    'SEVENTEEN', 'EIGHTEEN'
+]
+SCHEDULE_WORDS = ['FIRST', 'SECOND', 'THIRD', 'FOURTH', 'FIFTH', 'SIXTH']
+
+NOUNS = """
+    assembly authority board commission committee council county court
+    election function office officer parliament person power procedure
+    republic right senate service state tribunal member law land revenue
+    citizen account budget audit appeal petition judge speaker president
+    governor fund policy treaty emergency boundary
+""".split()
+
+ADJECTIVES = """
+    national public independent general special financial judicial
+    electoral executive legislative transitional constitutional
+""".split()
+
+VERBS = """
+    shall may establish appoint ensure enact exercise perform determine
+    provide remove approve publish review report consult
+""".split()
+
+CONNECTORS = "of the and for in to by under with any".split()
+
+ROMAN_NUMERALS = [
+    'i', 'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x',
+    'xi', 'xii', 'xiii', 'xiv', 'xv', 'xvi', 'xvii', 'xviii', 'xix', 'xx'
+]
+
+DASHES = ['—', '—', '—', '-', '–']
+LINES_PER_PAGE = 45
+
+
+# ============================================================================
+# Words
+# ============================================================================
+
+def phrase(rng: random.Random, words: int) -> str:
+    """A lowercase run of nouns, adjectives and connectors."""
+    out = []
+    for i in range(words):
+        roll = rng.random()
+        if i and roll < 0.3:
+            out.append(rng.choice(CONNECTORS))
+        elif roll < 0.5:
+            out.append(rng.choice(ADJECTIVES))
+        else:
+            out.append(rng.choice(NOUNS))
+    return ' '.join(out)
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    """A clause sentence without its final punctuation."""
+    subject = phrase(rng, rng.randint(2, 4))
+    rest = phrase(rng, max(1, words - 4))
+    return f"{subject} {rng.choice(VERBS)} {rng.choice(VERBS)} {rest}"
+
+
+def heading(rng: random.Random, words: int) -> str:
+    """An upper-case chapter or part title (letters, spaces and commas only)."""
+    return ' '.join(w for w in phrase(rng, words).upper().split())
+
+
+def title(rng: random.Random) -> str:
+    """An article title: capitalised, no inner period, short enough to be seen as a title."""
+    text = phrase(rng, rng.randint(2, 6))
+    return text[0].upper() + text[1:]
+
+
+# ============================================================================
+# Layout
+# ============================================================================
+
+class Page:
+    """Collects output lines, adding page footers and noise as it goes."""
+
+    def __init__(self, rng: random.Random, noise: float):
+        self.rng = rng
+        self.noise = noise
+        self.lines = []
+        self.page = 1
+        self.on_page = 0
+
+    def emit(self, line: str, wrap: bool = False):
+        """Add a line. With noise, body lines may wrap, gain trailing spaces or blank lines."""
+        if wrap and self.noise and len(line) > 60 and self.rng.random() < self.noise:
+            # Wrap before a lower-case word, as the PDF conversion does
+            words = line.split(' ')
+            cut = self.rng.randint(len(words) // 2, len(words) - 1)
+            if words[cut][:1].islower():
+                self.add(' '.join(words[:cut]))
+                line = ' '.join(words[cut:])
+        if self.noise and self.rng.random() < self.noise / 4:
+            line += ' ' * self.rng.randint(1, 3)
+        self.add(line)
+        if self.noise and self.rng.random() < self.noise / 4:
+            self.add('')
+
+    def add(self, line: str):
+        self.lines.append(line)
+        self.on_page += 1
+        if self.on_page >= LINES_PER_PAGE:
+            self.page += 1
+            self.on_page = 0
+            self.lines.append(f"Constitution of Kenya, 2010 {self.page}")
+
+    def dash(self) -> str:
+        """The dash in a heading: an em dash, or with noise a hyphen or en dash."""
+        return self.rng.choice(DASHES) if self.noise and self.rng.random() < self.noise else '—'
+
+
+def emit_article(out: Page, rng: random.Random, number: int, depth: int):
+    """One article: title line, then numbered clauses with nested sub- and mini-clauses."""
+    out.emit(title(rng) + '.')
+    clause_count = 1 if rng.random() < 0.25 else rng.randint(2, 6)
+    for c in range(1, clause_count + 1):
+        prefix = f"{number}. " if c == 1 else ""
+        marker = f"({c}) " if clause_count > 1 else ""
+        subs = rng.randint(2, 5) if depth >= 2 and rng.random() < 0.4 else 0
+        ending = '—' if subs else '.'
+        out.emit(f"{prefix}{marker}{sentence(rng, rng.randint(8, 30))}{ending}", wrap=True)
+        for s in range(subs):
+            minis = rng.randint(2, 4) if depth >= 3 and rng.random() < 0.25 else 0
+            ending = '—' if minis else (';' if s < subs - 1 else '.')
+            out.emit(f"({chr(ord('a') + s)}) {sentence(rng, rng.randint(5, 16))}{ending}", wrap=True)
+            for m in range(minis):
+                ending = ';' if m < minis - 1 else '.'
+                out.emit(f"({ROMAN_NUMERALS[m]}) {sentence(rng, rng.randint(4, 10))}{ending}")
+
+
+def emit_schedules(out: Page, rng: random.Random, first_article: int, last_article: int):
+    """The SCHEDULES block, with the six schedules in the shapes the parsers know."""
+    def cite() -> int:
+        return rng.randint(first_article, last_article)
+
+    out.emit("SCHEDULES")
+
+    out.emit(f"FIRST SCHEDULE\t(Article {cite()} (1))")
+    out.emit("COUNTIES")
+    for n in range(1, 48):
+        out.emit(f"{n}. {rng.choice(NOUNS).capitalize()}{rng.choice(NOUNS)}")
+
+    out.emit(f"SECOND SCHEDULE\t(Article {cite()} (2))")
+    out.emit("NATIONAL SYMBOLS")
+    for n, symbol in enumerate(['FLAG', 'ANTHEM', 'COAT OF ARMS', 'SEAL']):
+        out.emit(f"({chr(ord('a') + n)}) THE NATIONAL {symbol}")
+
+    out.emit(f"THIRD SCHEDULE\t(Articles {cite()}, {cite()}(3) and {cite()}(4))")
+    out.emit("NATIONAL OATHS AND AFFIRMATIONS")
+    for _ in range(rng.randint(4, 9)):
+        out.emit(f"OATH OR AFFIRMATION OF THE {heading(rng, 2)}")
+        out.emit(f"I, ____, do swear that I will {sentence(rng, 12)}.", wrap=True)
+
+    out.emit(f"FOURTH SCHEDULE\t(Articles {cite()}(2), {cite()}(1) and {cite()}(2))")
+    out.emit("DISTRIBUTION OF FUNCTIONS")
+    for part, name in enumerate(['NATIONAL GOVERNMENT', 'COUNTY GOVERNMENTS'], 1):
+        out.emit(f"PART {part}{out.dash()}{name}")
+        for n in range(1, rng.randint(10, 30)):
+            out.emit(f"{n}. {title(rng)}.")
+            for s in range(rng.randint(0, 4)):
+                out.emit(f"({chr(ord('a') + s)}) {phrase(rng, rng.randint(2, 6))};")
+
+    out.emit(f"FIFTH SCHEDULE\t(Article {cite()} (1))")
+    out.emit("LEGISLATION TO BE ENACTED BY PARLIAMENT")
+    for chapter in range(rng.randint(3, 8)):
+        out.emit(f"Chapter {CHAPTER_WORDS[chapter].capitalize()}—{title(rng)}")
+        for _ in range(rng.randint(1, 4)):
+            out.emit(f"{title(rng)} (Article {cite()})")
+            out.emit(f"{rng.randint(1, 5)} years")
+
+    out.emit(f"SIXTH SCHEDULE\t(Article {cite()})")
+    out.emit("TRANSITIONAL AND CONSEQUENTIAL PROVISIONS")
+    section = 1
+    for part in range(1, rng.randint(2, 5)):
+        out.emit(f"PART {part}{out.dash()}{heading(rng, 3)}")
+        for _ in range(rng.randint(2, 8)):
+            out.emit(f"{title(rng)}.")
+            out.emit(f"{section}. {sentence(rng, rng.randint(10, 30))}.", wrap=True)
+            section += 1
+    out.emit("SUBSIDIARY LEGISLATION")
+
+
+def generate_corpus(seed: int = 0, chapters: int = 18, articles: int = 15, parts: int = 2,
+                    depth: int = 3, noise: float = 0.1) -> str:
+    """
+    Generate a synthetic constitution.
+
+    chapters: 1 to 18. articles: per chapter. parts: per chapter, spread
+    over its articles (0 for none; chapters alternate with and without
+    parts, as in the real text). depth: 1 for clauses only, 2 to add
+    "(a)" sub-clauses, 3 to add "(i)" mini-clauses. noise: 0 to 1, how
+    often lines wrap, trail spaces or are followed by blank lines, and how
+    often headings use a hyphen or en dash instead of an em dash.
+    """
+    if not 1 <= chapters <= len(CHAPTER_WORDS):
+        raise ValueError(f"chapters must be between 1 and {len(CHAPTER_WORDS)}")
+    if not 1 <= depth <= 3:
+        raise ValueError("depth must be 1, 2 or 3")
+
+    rng = random.Random(seed)
+    out = Page(rng, noise)
+    titles = [heading(rng, rng.randint(1, 5)) for _ in range(chapters)]
+
+    out.emit("THE CONSTITUTION OF KENYA, 2010")
+    out.emit("ARRANGEMENT OF ARTICLES")
+    for word, chapter_title in zip(CHAPTER_WORDS, titles):
+        out.emit(f"CHAPTER {word}—{chapter_title}")
+
+    out.emit("PREAMBLE")
+    out.emit("We, the people of Kenya—")
+    for _ in range(rng.randint(3, 8)):
+        out.emit(f"{phrase(rng, 3).upper()} {sentence(rng, 10)};", wrap=True)
+    out.emit("GOD BLESS KENYA")
+    out.emit("")
+
+    number = 1
+    for index, (word, chapter_title) in enumerate(zip(CHAPTER_WORDS, titles)):
+        out.emit(f"CHAPTER {word}{out.dash()}{chapter_title}")
+        part_count = parts if index % 2 else 0
+        per_part = max(1, articles // part_count) if part_count else 0
+        for a in range(articles):
+            if part_count and a % per_part == 0 and a // per_part < part_count:
+                out.emit(f"PART {a // per_part + 1}{out.dash()}{heading(rng, rng.randint(1, 5))}")
+            emit_article(out, rng, number, depth)
+            number += 1
+
+    emit_schedules(out, rng, 1, number - 1)
+    return '\n'.join(out.lines) + '\n'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic constitution-shaped text")
+    parser.add_argument('-o', '--output', help="Output text file (default: synthetic_SEED.txt)")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed")
+    parser.add_argument('--chapters', type=int, default=18, help="Number of chapters, 1 to 18")
+    parser.add_argument('--articles', type=int, default=15, help="Articles per chapter")
+    parser.add_argument('--parts', type=int, default=2, help="Parts in every other chapter (0 for none)")
+    parser.add_argument('--depth', type=int, default=3, help="Clause nesting: 1 clauses, 2 sub-clauses, 3 mini-clauses")
+    parser.add_argument('--noise', type=float, default=0.1, help="Layout noise, 0.0 to 1.0")
+    args = parser.parse_args()
+
+    output_path = Path(args.output) if args.output else Path(f"synthetic_{args.seed}.txt")
+    try:
+        text = generate_corpus(args.seed, args.chapters, args.articles, args.parts, args.depth, args.noise)
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        return 1
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(text, encoding='utf-8')
+    print(f"Corpus saved to: {output_path}")
+    print(f"Size: {output_path.stat().st_size:,} bytes, {args.chapters} chapters, "
+          f"{args.chapters * args.articles} articles")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Batch mode shared by both constitution parsers.
+
+parser/parse_constitution.py and the app's composeResources
+parse_constitution.py hand main_batch their own parse and validate
+functions; everything else (collecting the inputs, naming the outputs,
+running the process pool and reporting) lives here.
+
+Usage:
+    from parse_batch import main_batch
+    main_batch(args, parse_file, validate_result, suffixes=('.txt', '.txt.gz', '.txt.xz'))
+"""
+
+import os
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Callable, Optional
+
+
+BATCH_SUFFIXES = ('.txt', '.txt.gz', '.txt.xz')
+REPORT_NAME = "report.json"
+
+
+def collect_batch_inputs(source: Path, suffixes: tuple = BATCH_SUFFIXES) -> list:
+    """
+    List the input files for a batch run. source is either a directory,
+    whose files ending in one of suffixes are taken in name order, or a
+    manifest with one path per line (blank lines and # comments are
+    skipped, relative paths are relative to the manifest).
+    """
+    source = Path(source)
+    if source.is_dir():
+        return sorted(p for p in source.iterdir() if p.name.lower().endswith(suffixes))
+
+    inputs = []
+    with open(source, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            path = Path(line)
+            inputs.append(path if path.is_absolute() else source.parent / path)
+    return inputs
+
+
+def batch_output_names(inputs: list) -> list:
+    """
+    One output file name per input, numbered where two inputs share a stem
+    or an input would take the report's name.
+    """
+    names = []
+    used = {REPORT_NAME}
+    for path in inputs:
+        stem = Path(path).name
+        for suffix in ('.gz', '.xz', '.txt', '.pdf'):
+            if stem.lower().endswith(suffix):
+                stem = stem[:-len(suffix)]
+        name = f"{stem}.json"
+        count = 1
+        while name in used:
+            count += 1
+            name = f"{stem}-{count}.json"
+        used.add(name)
+        names.append(name)
+    return names
+
+
+def parse_batch_file(parse: Callable, validate: Callable, input_path: Path, output_path: Path) -> dict:
+    """
+    Parse one batch input with parse(path), path being the input as a
+    string, write its JSON and return its report entry. Runs in a worker
+    process.
+    """
+    entry = {"input": str(input_path), "output": str(output_path)}
+    start = time.perf_counter()
+    try:
+        constitution = parse(entry["input"])
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(constitution, f, indent=2, ensure_ascii=False)
+        entry["warnings"] = validate(constitution)
+    except Exception as e:
+        entry["error"] = f"{type(e).__name__}: {e}"
+    entry["seconds"] = round(time.perf_counter() - start, 4)
+    return entry
+
+
+def run_batch(inputs: list, output_dir: Path, parse: Callable, validate: Callable,
+              workers: Optional[int] = None) -> dict:
+    """
+    Parse every input across a process pool, writing one JSON file per input
+    into output_dir. parse and validate must be module-level functions, so
+    the pool can send them to its workers. Returns the report, in input order.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    outputs = [output_dir / name for name in batch_output_names(inputs)]
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        files = list(pool.map(partial(parse_batch_file, parse, validate), inputs, outputs))
+
+    return {
+        "workers": workers or os.cpu_count(),
+        "seconds": round(time.perf_counter() - start, 4),
+        "files": files,
+    }
+
+
+def print_batch_report(report: dict):
+    """Print per-file timings and warnings for a batch run."""
+    print("=" * 60)
+    print("Batch Summary")
+    print("=" * 60)
+
+    failed = 0
+    for entry in report['files']:
+        name = Path(entry['input']).name
+        if 'error' in entry:
+            failed += 1
+            print(f"  {name}: FAILED after {entry['seconds']:.3f}s - {entry['error']}")
+            continue
+        print(f"  {name}: {entry['seconds']:.3f}s")
+        for warning in entry['warnings']:
+            print(f"    - {warning}")
+
+    print(f"\nFiles: {len(report['files'])} ({failed} failed)")
+    print(f"Workers: {report['workers']}")
+    print(f"Wall time: {report['seconds']:.3f}s")
+    print("=" * 60)
+
+
+def main_batch(args, parse: Callable, validate: Callable, suffixes: tuple = BATCH_SUFFIXES) -> int:
+    """Run --batch: parse many inputs and write a JSON file and report entry for each."""
+    source = Path(args.batch)
+    if not source.exists():
+        print(f"ERROR: Batch source not found at {source}")
+        return 1
+
+    inputs = collect_batch_inputs(source, suffixes)
+    base_dir = source if source.is_dir() else source.parent
+    output_dir = Path(args.output) if args.output else base_dir / "json"
+
+    print("=" * 60)
+    print("Constitution of Kenya Parser (batch)")
+    print("=" * 60)
+    print(f"Source: {source} ({len(inputs)} files)")
+    print(f"Output: {output_dir}")
+    print()
+
+    report = run_batch(inputs, output_dir, parse, validate, args.workers)
+    print_batch_report(report)
+
+    report_path = output_dir / REPORT_NAME
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"Report saved to: {report_path}")
+
+    return 1 if any('error' in entry for entry in report['files']) else 0
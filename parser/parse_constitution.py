@@ -7,32 +7,53 @@ Parses The_Constitution_of_Kenya_2010.txt into structured JSON for the Katiba ap
 Hierarchy: Chapters -> Parts -> Articles -> Clauses -> SubClauses -> MiniClauses
 
 Usage:
-    python parse_constitution.py
+    python parse_constitution.py [input_file] [-o OUTPUT] [--stream | --mmap | --parallel] [-j WORKERS] [--pipeline] [--watch] [--cache PATH] [--bundle PATH] [--index PATH] [--trigrams PATH] [--references PATH] [--shards DIR] [--compress FORMATS] [--profile]
+    python parse_constitution.py --batch SOURCE [-o OUTPUT_DIR] [-j WORKERS] [--stream]
+
+Inputs ending in .gz or .xz are decompressed on the fly. .pdf inputs are
+extracted page by page across -j worker processes (see constitution_pdf.py).
 """
 
 import re
+import gzip
+import hashlib
 import json
+import lzma
+import mmap
+import codecs
+import argparse
+import os
+import queue
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+from multiprocessing import shared_memory
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
+from parse_profile import profile_stage, start_profile, stop_profile, print_profile
 
-def read_constitution_text(file_path: Path) -> str:
-    """Read the constitution text file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return f.read()
 
+def open_constitution_text(file_path: Path):
+    """Open the constitution text file for reading, decompressing .gz/.xz inputs."""
+    suffix = Path(file_path).suffix.lower()
+    if suffix == '.gz':
+        return gzip.open(file_path, 'rt', encoding='utf-8')
+    if suffix == '.xz':
+        return lzma.open(file_path, 'rt', encoding='utf-8')
+    return open(file_path, 'r', encoding='utf-8')
 
-def clean_text(text: str) -> str:
-    """Clean and normalize text."""
-    if not text:
-        return ""
-    # Replace multiple whitespace with single space
-    text = re.sub(r'\s+', ' ', text)
-    # Remove page headers/footers
-    text = re.sub(r'Constitution of Kenya, 2010\s*\d*', '', text)
-    # Remove leading/trailing whitespace
-    text = text.strip()
-    return text
+
+def read_constitution_text(file_path: Path, workers: Optional[int] = None) -> str:
+    """Read the constitution text file, or extract it from a PDF on workers processes."""
+    if Path(file_path).suffix.lower() == '.pdf':
+        from constitution_pdf import read_pdf_text
+        return read_pdf_text(file_path, workers)[0]
+    with open_constitution_text(file_path) as f:
+        return f.read()
 
 
 def parse_roman_numeral(s: str) -> int:
@@ -61,181 +82,463 @@ def word_to_num(word: str) -> int:
     return word_map.get(word.upper(), 0)
 
 
-def parse_mini_clauses(text: str) -> tuple[str, list]:
+# Token kinds emitted by tokenize(). Each token is a (kind, value, text) tuple
+# where `value` is the parsed payload (article number, clause label, title)
+# and `text` is the raw source lexeme, so joining the `text` of a run of
+# tokens reproduces the source exactly.
+TOKEN_ARTICLE = "article"
+TOKEN_TITLE = "title"
+TOKEN_CLAUSE = "clause"
+TOKEN_SUB_CLAUSE = "sub_clause"
+TOKEN_MINI_CLAUSE = "mini_clause"
+TOKEN_TEXT = "text"
+TOKEN_PAGE = "page"
+
+PAGE_MARKER = 'Constitution of Kenya, 2010'
+
+# Regex for article number at start: "    1. (1)" or "1. (1)" or just "1. "
+ARTICLE_START_PATTERN = re.compile(r'^\s*(\d+)\.\s+(?:\(1\)\s*)?(.*)$')
+# Title line pattern: ends with period, no article number
+TITLE_PATTERN = re.compile(r'^([A-Z][^.]*\.)\s*$')
+# Clause (1), sub-clause (a) and mini-clause (ii) markers in a single pattern.
+# Single letters such as (i), (v) or (c) are always sub-clause labels.
+MARKER_PATTERN = re.compile(
+    r'\((?:(?P<clause>\d+)|(?P<sub>[a-z])|(?P<mini>[ivxlc]+))\)\s*'
+)
+PAGE_MARKER_PATTERN = re.compile(r'Constitution of Kenya, 2010\s*\d*')
+
+# Pattern for chapter headers
+CHAPTER_PATTERN = re.compile(
+    r'CHAPTER\s+(ONE|TWO|THREE|FOUR|FIVE|SIX|SEVEN|EIGHT|NINE|TEN|ELEVEN|TWELVE|THIRTEEN|FOURTEEN|FIFTEEN|SIXTEEN|SEVENTEEN|EIGHTEEN)\s*[-–—]\s*([A-Z][A-Z\s,]+?)(?=\r?\n)',
+    re.IGNORECASE
+)
+SCHEDULES_START_PATTERN = re.compile(r'SCHEDULES\s+FIRST\s+SCHEDULE', re.IGNORECASE)
+PREAMBLE_START_PATTERN = re.compile(r'PREAMBLE\s*', re.IGNORECASE)
+PREAMBLE_END_PATTERN = re.compile(r'CHAPTER\s+ONE', re.IGNORECASE)
+SCHEDULE_ORDINALS = ['FIRST', 'SECOND', 'THIRD', 'FOURTH', 'FIFTH', 'SIXTH']
+SCHEDULE_HEADING_PATTERN = re.compile(
+    r'(' + '|'.join(SCHEDULE_ORDINALS) + r')\s+SCHEDULE', re.IGNORECASE
+)
+CHAPTER_WORDS = [
+    'ONE', 'TWO', 'THREE', 'FOUR', 'FIVE', 'SIX', 'SEVEN', 'EIGHT', 'NINE',
+    'TEN', 'ELEVEN', 'TWELVE', 'THIRTEEN', 'FOURTEEN', 'FIFTEEN', 'SIXTEEN',
+    'SEVENTEEN', 'EIGHTEEN'
+]
+# Pattern for parts: "PART 1-TITLE" or "PART 1 - TITLE"
+PART_PATTERN = re.compile(r'PART\s+(\d+)\s*[-–—]\s*([A-Z][A-Z\s,]+)', re.IGNORECASE)
+
+
+def keyword_trie_pattern(words: list) -> str:
     """
-    Parse mini-clauses (i), (ii), (iii) from text.
-    Returns the main text and a list of mini-clauses.
+    Compile keywords into a regex that walks a trie of their characters.
+    Matching at any position costs at most one keyword length, however
+    many keywords there are. Spaces match any run of whitespace.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def emit(node: dict) -> str:
+        branches = [
+            (r'\s+' if char == ' ' else re.escape(char)) + emit(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Prefer the longest keyword, falling back to the shorter one
+        return '(?:' + body + ')?' if '' in node else body
+
+    return emit(trie)
+
+
+# Heading detection works in two steps: one scan of the lowercased text for
+# the anchor words every heading contains, then a trie-compiled pattern at
+# each anchor to read the chapter word, part number or schedule ordinal.
+HEADING_ANCHOR_PATTERN = re.compile(r'chapter|part|schedule')
+HEADING_ANCHOR_PATTERN_IGNORECASE = re.compile(r'chapter|part|schedule', re.IGNORECASE)
+CHAPTER_HEADING_PATTERN = re.compile(
+    r'CHAPTER\s+(' + keyword_trie_pattern(CHAPTER_WORDS) + r')', re.IGNORECASE
+)
+PART_HEADING_PATTERN = re.compile(r'PART\s+(\d+)', re.IGNORECASE)
+
+
+def word_before(text: str, pos: int, words: list) -> Optional[tuple[int, str]]:
+    """
+    Return (start, word) if one of the words ends right before the
+    whitespace run that precedes pos. The words must not be suffixes of
+    one another.
+    """
+    end = pos
+    while end > 0 and text[end - 1].isspace():
+        end -= 1
+    if end == pos:
+        return None
+    for word in words:
+        start = end - len(word)
+        if start >= 0 and text[start:end].upper() == word:
+            return start, word
+    return None
+
+
+def find_headings(text: str) -> list:
+    """
+    Find every chapter, part and schedule heading candidate in one pass.
+    Returns (start, end, kind, key) tuples in document order, where kind is
+    "chapter", "part", "schedules" or "schedule" and key is the chapter word,
+    part number or schedule ordinal. Candidates only mark where a heading
+    may start; callers confirm them with the full heading pattern.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        anchors = HEADING_ANCHOR_PATTERN.finditer(lowered)
+    else:
+        # Lowercasing changed the length, so offsets would not line up
+        anchors = HEADING_ANCHOR_PATTERN_IGNORECASE.finditer(text)
+
+    headings = []
+    for anchor in anchors:
+        start = anchor.start()
+        word = anchor.group(0).lower()
+        if word == 'chapter':
+            match = CHAPTER_HEADING_PATTERN.match(text, start)
+            if match:
+                headings.append((start, match.end(), "chapter", match.group(1).upper()))
+        elif word == 'part':
+            match = PART_HEADING_PATTERN.match(text, start)
+            if match:
+                headings.append((start, match.end(), "part", match.group(1)))
+        else:
+            found = word_before(text, start, SCHEDULE_ORDINALS)
+            if not found:
+                continue
+            ordinal_start, ordinal = found
+            if ordinal == 'FIRST':
+                # "SCHEDULES FIRST SCHEDULE" opens the schedules
+                opening = word_before(text, ordinal_start, ['SCHEDULES'])
+                if opening:
+                    headings.append((opening[0], anchor.end(), "schedules", ""))
+            headings.append((ordinal_start, anchor.end(), "schedule", ordinal))
+    return headings
+
+
+def confirm_headings(pattern: re.Pattern, text: str, offsets: Iterable[int],
+                     endpos: Optional[int] = None) -> list:
+    """
+    Confirm heading candidates with the full heading pattern.
+    Returns the same non-overlapping matches pattern.finditer would find,
+    given that every match starts at one of the candidate offsets.
+    """
+    endpos = len(text) if endpos is None else endpos
+    matches = []
+    last_end = 0
+    for offset in offsets:
+        if offset < last_end or offset >= endpos:
+            continue
+        match = pattern.match(text, offset, endpos)
+        if match:
+            matches.append(match)
+            last_end = match.end()
+    return matches
+
+
+def clean_text(text: str) -> str:
+    """Clean and normalize text."""
+    if not text:
+        return ""
+    # Replace multiple whitespace with single space
+    text = ' '.join(text.split())
+    # Remove page headers/footers
+    if PAGE_MARKER in text:
+        text = PAGE_MARKER_PATTERN.sub('', text).strip()
+    return text
+
+
+def normalize_document(text: str) -> tuple[str, tuple]:
+    """
+    Strip page footers from text in one pass: every line containing
+    PAGE_MARKER is dropped together with its line break, and everything
+    else is kept as is, so the line-based tokenizer sees the same lines it
+    would in the source minus the footers it skips anyway. Whitespace is
+    not collapsed here; clean_text does that as each run of text is built.
+
+    Returns (normalized, offsets). offsets maps between positions in the
+    two texts (see source_offset and normalized_offset): two parallel
+    arrays holding the start of every segment the footers split the text
+    into, so a document needs one entry per page.
+    """
+    pieces = []
+    norm_starts = array('I', [0])
+    raw_starts = array('I', [0])
+    norm_pos = 0
+    raw_pos = 0
+
+    found = text.find(PAGE_MARKER)
+    while found >= 0:
+        start = text.rfind('\n', 0, found) + 1
+        end = text.find('\n', found)
+        end = len(text) if end < 0 else end + 1
+        pieces.append(text[raw_pos:start])
+        norm_pos += start - raw_pos
+        raw_pos = end
+        if norm_starts[-1] == norm_pos:
+            # Consecutive footer lines make a single gap
+            raw_starts[-1] = raw_pos
+        else:
+            norm_starts.append(norm_pos)
+            raw_starts.append(raw_pos)
+        found = text.find(PAGE_MARKER, end)
+
+    pieces.append(text[raw_pos:])
+    return ''.join(pieces), (norm_starts, raw_starts)
+
+
+def source_offset(offsets: tuple, pos: int) -> int:
+    """Map a position in normalized text back to the text it came from."""
+    norm_starts, raw_starts = offsets
+    i = bisect_right(norm_starts, pos) - 1
+    return raw_starts[i] + pos - norm_starts[i]
+
+
+def normalized_offset(offsets: tuple, pos: int) -> int:
+    """
+    Map a position in the source text to normalized text. Positions inside
+    a dropped footer map to the first character after it.
+    """
+    norm_starts, raw_starts = offsets
+    i = bisect_right(raw_starts, pos) - 1
+    if i < 0:
+        return 0
+    offset = norm_starts[i] + pos - raw_starts[i]
+    if i + 1 < len(norm_starts):
+        offset = min(offset, norm_starts[i + 1])
+    return offset
+
+
+def tokenize_markers(text: str):
+    """
+    Split a run of article text into clause, sub-clause, mini-clause and
+    text tokens in a single scan.
+    """
+    pos = 0
+    for match in MARKER_PATTERN.finditer(text):
+        if match.start() > pos:
+            yield (TOKEN_TEXT, "", text[pos:match.start()])
+        if match.group('clause') is not None:
+            yield (TOKEN_CLAUSE, match.group('clause'), match.group(0))
+        elif match.group('sub') is not None:
+            yield (TOKEN_SUB_CLAUSE, match.group('sub'), match.group(0))
+        else:
+            yield (TOKEN_MINI_CLAUSE, match.group('mini'), match.group(0))
+        pos = match.end()
+    if pos < len(text):
+        yield (TOKEN_TEXT, "", text[pos:])
+
+
+def tokenize(text: str):
+    """
+    Walk a chapter or part of the constitution once, line by line, and
+    yield a typed token stream: article starts, article titles, page
+    markers, clause markers and the text runs between them.
+
+    Lines that belong to an article body are joined with newlines exactly
+    as they appear in the source, so the builders see the same text the
+    line-based parser used to accumulate.
+    """
+    in_article = False
+    first_line = True
+
+    for line in text.split('\n'):
+        # Page markers are dropped from the article body
+        if PAGE_MARKER in line:
+            yield (TOKEN_PAGE, "", line)
+            continue
+
+        match = ARTICLE_START_PATTERN.match(line)
+        if match:
+            yield (TOKEN_ARTICLE, match.group(1), line)
+            in_article = True
+            remainder = match.group(2)
+            first_line = not remainder
+            if remainder:
+                yield from tokenize_markers(remainder)
+            continue
+
+        stripped = line.strip()
+        title_match = TITLE_PATTERN.match(stripped)
+        if title_match and not stripped.startswith('('):
+            # This could be a title for the next article
+            yield (TOKEN_TITLE, title_match.group(1).rstrip('.'), line)
+            continue
+
+        if in_article:
+            if not first_line:
+                yield (TOKEN_TEXT, "", '\n')
+            first_line = False
+            yield from tokenize_markers(line)
+
+
+def join_tokens(tokens: list) -> str:
+    """Reassemble the source text of a token run."""
+    return ''.join(token[2] for token in tokens)
+
+
+def split_tokens(tokens: list, kind: str) -> tuple[list, list]:
+    """
+    Split a token run at every token of the given kind.
+    Returns the tokens before the first marker and a list of
+    (marker value, following tokens) pairs.
+    """
+    head = []
+    groups = []
+    current = head
+    for token in tokens:
+        if token[0] == kind:
+            current = []
+            groups.append((token[1], current))
+        else:
+            current.append(token)
+    return head, groups
+
+
+def build_mini_clauses(tokens: list) -> tuple[str, list]:
     """
+    Build mini-clauses (ii), (iii), (iv) from a sub-clause token run.
+    Returns the cleaned main text and a list of mini-clauses.
+    """
+    head, groups = split_tokens(tokens, TOKEN_MINI_CLAUSE)
+    if not groups:
+        return clean_text(join_tokens(tokens)), []
+
     mini_clauses = []
-    
-    # Pattern for roman numeral mini-clauses: (i), (ii), (iii), (iv), etc.
-    mini_pattern = r'\(([ivxlc]+)\)\s*'
-    parts = re.split(mini_pattern, text)
-    
-    if len(parts) > 1:
-        main_text = parts[0].strip()
-        for i in range(1, len(parts), 2):
-            if i + 1 < len(parts):
-                numeral = parts[i]
-                content = clean_text(parts[i + 1])
-                if content and re.match(r'^[ivxlc]+$', numeral):
-                    mini_clauses.append({
-                        "numeral": numeral,
-                        "number": parse_roman_numeral(numeral),
-                        "text": content
-                    })
-        return main_text, mini_clauses
-    
-    return text, []
+    for numeral, body in groups:
+        content = clean_text(join_tokens(body))
+        if content:
+            mini_clauses.append({
+                "numeral": numeral,
+                "number": parse_roman_numeral(numeral),
+                "text": content
+            })
+    return clean_text(join_tokens(head)), mini_clauses
 
 
-def parse_sub_clauses(text: str) -> tuple[str, list]:
+def build_sub_clauses(tokens: list) -> tuple[str, list]:
     """
-    Parse sub-clauses (a), (b), (c) from text.
-    Returns the main text and a list of sub-clauses with potential mini-clauses.
+    Build sub-clauses (a), (b), (c) from a clause token run.
+    Returns the cleaned main text and a list of sub-clauses with potential
+    mini-clauses.
     """
+    head, groups = split_tokens(tokens, TOKEN_SUB_CLAUSE)
+    if not groups:
+        return clean_text(join_tokens(tokens)), []
+
     sub_clauses = []
-    
-    # Pattern for lettered sub-clauses: (a), (b), (c), etc.
-    sub_pattern = r'\(([a-z])\)\s*'
-    parts = re.split(sub_pattern, text)
-    
-    if len(parts) > 1:
-        main_text = parts[0].strip()
-        for i in range(1, len(parts), 2):
-            if i + 1 < len(parts):
-                label = parts[i]
-                content = parts[i + 1].strip()
-                
-                # Check for mini-clauses within this sub-clause
-                sub_text, mini_clauses = parse_mini_clauses(content)
-                
-                sub_clause = {
-                    "label": label,
-                    "text": clean_text(sub_text)
-                }
-                
-                if mini_clauses:
-                    sub_clause["miniClauses"] = mini_clauses
-                
-                sub_clauses.append(sub_clause)
-        
-        return main_text, sub_clauses
-    
-    return text, []
+    for label, body in groups:
+        sub_text, mini_clauses = build_mini_clauses(body)
+        sub_clause = {
+            "label": label,
+            "text": sub_text
+        }
+        if mini_clauses:
+            sub_clause["miniClauses"] = mini_clauses
+        sub_clauses.append(sub_clause)
+    return clean_text(join_tokens(head)), sub_clauses
 
 
-def parse_clauses(article_text: str) -> list:
+def build_clauses(tokens: list) -> list:
     """
-    Parse clauses (1), (2), (3) from article text.
+    Build clauses (1), (2), (3) from the token run of an article body.
     Returns a list of clauses with potential sub-clauses.
     """
-    clauses = []
-    
-    # Pattern for numbered clauses: (1), (2), (3), etc.
-    clause_pattern = r'\((\d+)\)\s*'
-    parts = re.split(clause_pattern, article_text)
-    
-    if len(parts) > 1:
-        for i in range(1, len(parts), 2):
-            if i + 1 < len(parts):
-                clause_num = parts[i]
-                content = parts[i + 1].strip()
-                
-                # Parse sub-clauses
-                clause_text, sub_clauses = parse_sub_clauses(content)
-                
-                clause = {
-                    "number": int(clause_num),
-                    "text": clean_text(clause_text)
-                }
-                
-                if sub_clauses:
-                    clause["subClauses"] = sub_clauses
-                
-                clauses.append(clause)
-    else:
+    _, groups = split_tokens(tokens, TOKEN_CLAUSE)
+    if not groups:
         # No numbered clauses - article has only text
-        cleaned = clean_text(article_text)
+        cleaned = clean_text(join_tokens(tokens))
         if cleaned:
-            clauses.append({
+            return [{
                 "number": 0,
                 "text": cleaned,
                 "isTextOnly": True
-            })
-    
+            }]
+        return []
+
+    clauses = []
+    for clause_num, body in groups:
+        clause_text, sub_clauses = build_sub_clauses(body)
+        clause = {
+            "number": int(clause_num),
+            "text": clause_text
+        }
+        if sub_clauses:
+            clause["subClauses"] = sub_clauses
+        clauses.append(clause)
     return clauses
 
 
+def parse_mini_clauses(text: str) -> tuple[str, list]:
+    """
+    Parse mini-clauses (ii), (iii), (iv) from text.
+    Returns the main text and a list of mini-clauses.
+    """
+    return build_mini_clauses(list(tokenize_markers(text)))
+
+
+def parse_sub_clauses(text: str) -> tuple[str, list]:
+    """
+    Parse sub-clauses (a), (b), (c) from text.
+    Returns the main text and a list of sub-clauses with potential mini-clauses.
+    """
+    return build_sub_clauses(list(tokenize_markers(text)))
+
+
+def parse_clauses(article_text: str) -> list:
+    """
+    Parse clauses (1), (2), (3) from article text.
+    Returns a list of clauses with potential sub-clauses.
+    """
+    return build_clauses(list(tokenize_markers(article_text)))
+
+
 def parse_articles(text: str, start_article: int = 1) -> list:
     """
     Parse articles from a section of text.
     Articles are identified by a number followed by a period and title.
     """
     articles = []
-    
-    # Pattern: Article number, title on line before, then content
-    # Article headers appear as: "Title.\n    N. (1) content" or "Title.\n N. content"
-    
-    # Find article patterns: number at start of line or after whitespace
-    # Format: "Title.\n     N. (1) text" or "N. (1) text"
-    
-    lines = text.split('\n')
     current_article = None
     current_title = ""
-    current_content = []
-    
-    # Regex for article number at start: "    1. (1)" or "1. (1)" or just "1. "
-    article_start_pattern = re.compile(r'^\s*(\d+)\.\s+(?:\(1\)\s*)?(.*)$')
-    # Title line pattern: ends with period, no article number
-    title_pattern = re.compile(r'^([A-Z][^.]*\.)\s*$')
-    
-    for line in lines:
-        # Skip page markers
-        if re.search(r'Constitution of Kenya, 2010', line):
-            continue
-        
-        # Check if this is a new article start
-        match = article_start_pattern.match(line)
-        if match:
+    current_tokens = []
+
+    for token in tokenize(text):
+        kind = token[0]
+        if kind == TOKEN_ARTICLE:
             # Save previous article
             if current_article is not None:
-                article_content = '\n'.join(current_content)
-                clauses = parse_clauses(article_content)
-                articles.append({
-                    "number": current_article,
-                    "title": clean_text(current_title),
-                    "clauses": clauses
-                })
-            
-            current_article = int(match.group(1))
-            remainder = match.group(2)
-            current_content = [remainder] if remainder else []
-            
-            # Title was captured from previous lines
-            continue
-        
-        # Check if this might be a title line (for next article)
-        title_match = title_pattern.match(line.strip())
-        if title_match and not line.strip().startswith('('):
-            # This could be a title for the next article
-            current_title = title_match.group(1).rstrip('.')
-            continue
-        
-        # Otherwise, accumulate content
-        if current_article is not None:
-            current_content.append(line)
-    
+                with profile_stage(f"Article {current_article}", "article"):
+                    articles.append({
+                        "number": current_article,
+                        "title": clean_text(current_title),
+                        "clauses": build_clauses(current_tokens)
+                    })
+            current_article = int(token[1])
+            current_tokens = []
+        elif kind == TOKEN_TITLE:
+            current_title = token[1]
+        elif kind != TOKEN_PAGE:
+            current_tokens.append(token)
+
     # Save last article
     if current_article is not None:
-        article_content = '\n'.join(current_content)
-        clauses = parse_clauses(article_content)
-        articles.append({
-            "number": current_article,
-            "title": clean_text(current_title),
-            "clauses": clauses
-        })
-    
+        with profile_stage(f"Article {current_article}", "article"):
+            articles.append({
+                "number": current_article,
+                "title": clean_text(current_title),
+                "clauses": build_clauses(current_tokens)
+            })
+
     return articles
 
 
@@ -249,24 +552,31 @@ def parse_part(text: str, part_num: int, part_title: str) -> dict:
     }
 
 
-def extract_parts_from_chapter(chapter_text: str) -> tuple[list, list]:
+def extract_parts_from_chapter(chapter_text: str, part_offsets: Optional[list] = None) -> tuple[list, list]:
     """
     Extract Parts from chapter text.
+    part_offsets are the "PART n" heading candidates within chapter_text,
+    as found by find_headings; they are looked up when not given.
     Returns (parts_list, articles_outside_parts)
+
+    Part headings are matched in the source text, where page footers still
+    end a part title the way they always have; the articles are parsed
+    from the chapter normalized once with normalize_document.
     """
     parts = []
     
-    # Pattern for parts: "PART 1-TITLE" or "PART 1 - TITLE"
-    part_pattern = re.compile(r'PART\s+(\d+)\s*[-–—]\s*([A-Z][A-Z\s,]+)', re.IGNORECASE)
-    part_matches = list(part_pattern.finditer(chapter_text))
+    if part_offsets is None:
+        part_offsets = [h[0] for h in find_headings(chapter_text) if h[2] == "part"]
+    part_matches = confirm_headings(PART_PATTERN, chapter_text, part_offsets)
+    normalized, offsets = normalize_document(chapter_text)
     
     if not part_matches:
         # No parts found, articles are directly in chapter
-        articles = parse_articles(chapter_text)
+        articles = parse_articles(normalized)
         return [], articles
     
     # Articles before first part
-    pre_part_text = chapter_text[:part_matches[0].start()]
+    pre_part_text = normalized[:normalized_offset(offsets, part_matches[0].start())]
     articles_before = parse_articles(pre_part_text) if pre_part_text.strip() else []
     
     # Parse each part
@@ -276,7 +586,7 @@ def extract_parts_from_chapter(chapter_text: str) -> tuple[list, list]:
         
         start = match.end()
         end = part_matches[i + 1].start() if i + 1 < len(part_matches) else len(chapter_text)
-        part_text = chapter_text[start:end]
+        part_text = normalized[normalized_offset(offsets, start):normalized_offset(offsets, end)]
         
         part = parse_part(part_text, part_num, part_title)
         parts.append(part)
@@ -284,61 +594,88 @@ def extract_parts_from_chapter(chapter_text: str) -> tuple[list, list]:
     return parts, articles_before
 
 
-def parse_chapters(text: str) -> list:
-    """Parse all chapters from the constitution text."""
-    chapters = []
-    
-    # Find where schedules start and truncate text to only parse chapters
-    schedule_start = re.search(r'SCHEDULES\s+FIRST\s+SCHEDULE', text, re.IGNORECASE)
-    chapters_text = text[:schedule_start.start()] if schedule_start else text
-    
-    # Pattern for chapter headers
-    chapter_pattern = re.compile(
-        r'CHAPTER\s+(ONE|TWO|THREE|FOUR|FIVE|SIX|SEVEN|EIGHT|NINE|TEN|ELEVEN|TWELVE|THIRTEEN|FOURTEEN|FIFTEEN|SIXTEEN|SEVENTEEN|EIGHTEEN)\s*[-–—]\s*([A-Z][A-Z\s,]+?)(?=\r?\n)',
-        re.IGNORECASE
-    )
-    
-    chapter_matches = list(chapter_pattern.finditer(chapters_text))
+def parse_chapters(text: str, outline: Optional[dict] = None, cache: Optional[dict] = None) -> list:
+    """
+    Parse all chapters from the constitution text.
+    outline is the result of build_outline(text), computed when not given.
+    With a cache (see cached_node), chapters whose source is unchanged are
+    reused instead of re-parsed.
+    """
+    return list(iter_chapters(text, outline, cache))
+
+
+def iter_chapters(text: str, outline: Optional[dict] = None, cache: Optional[dict] = None) -> Iterator[dict]:
+    """Yield the chapters parse_chapters returns, one at a time."""
+    if outline is None:
+        outline = build_outline(text)
     
-    for i, match in enumerate(chapter_matches):
-        chapter_word = match.group(1).upper()
-        chapter_num = word_to_num(chapter_word)
-        chapter_title = match.group(2).strip()
+    for span in outline["chapters"]:
+        match = CHAPTER_PATTERN.match(text, span["start"], span["end"])
         
         # Get chapter content
         start = match.end()
-        end = chapter_matches[i + 1].start() if i + 1 < len(chapter_matches) else len(chapters_text)
-        
-        chapter_text = chapters_text[start:end]
-        
-        # Parse parts and articles
-        parts, articles_outside = extract_parts_from_chapter(chapter_text)
-        
-        chapter = {
-            "number": chapter_num,
-            "title": clean_text(chapter_title)
-        }
-        
-        if parts:
-            chapter["parts"] = parts
-        if articles_outside:
-            chapter["articles"] = articles_outside
-        
-        chapters.append(chapter)
+        chapter_text = text[start:span["end"]]
+        chapter_parts = [offset - start for offset in span["parts"]]
+        with profile_stage(f"Chapter {match.group(1).upper()}", "chapter"):
+            chapter = cached_node(
+                cache, "chapter", match.group(0) + chapter_text,
+                lambda: build_chapter(match, chapter_text, chapter_parts)
+            )
+        yield chapter
+
+
+def build_chapter(match: re.Match, chapter_text: str, part_offsets: Optional[list] = None) -> dict:
+    """Build a chapter from its CHAPTER_PATTERN header match and body text."""
+    chapter_word = match.group(1).upper()
+    chapter_num = word_to_num(chapter_word)
+    chapter_title = match.group(2).strip()
+    
+    # Parse parts and articles
+    parts, articles_outside = extract_parts_from_chapter(chapter_text, part_offsets)
+    
+    chapter = {
+        "number": chapter_num,
+        "title": clean_text(chapter_title)
+    }
     
-    return chapters
+    if parts:
+        chapter["parts"] = parts
+    if articles_outside:
+        chapter["articles"] = articles_outside
+    
+    return chapter
 
 
-def parse_preamble(text: str) -> dict:
-    """Parse the preamble section."""
-    # Find preamble - from start until first CHAPTER
-    preamble_match = re.search(r'PREAMBLE\s*(.*?)(?=CHAPTER\s+ONE)', text, re.DOTALL | re.IGNORECASE)
+def parse_preamble(text: str, outline: Optional[dict] = None) -> dict:
+    """
+    Parse the preamble section.
+    outline is the result of build_outline(text); without it the preamble
+    is looked up directly.
+    """
+    bounds = outline["preamble"] if outline is not None else preamble_bounds(text)
     
-    if not preamble_match:
+    if not bounds:
         return {"paragraphs": []}
     
-    preamble_text = preamble_match.group(1)
-    
+    return build_preamble(text[bounds[0]:bounds[1]])
+
+
+def preamble_bounds(text: str) -> Optional[tuple[int, int]]:
+    """
+    Start and end of the preamble body: from after the first PREAMBLE
+    heading up to the next CHAPTER ONE. None when either is missing.
+    """
+    start = PREAMBLE_START_PATTERN.search(text)
+    if not start:
+        return None
+    end = PREAMBLE_END_PATTERN.search(text, start.end())
+    if not end:
+        return None
+    return start.end(), end.start()
+
+
+def build_preamble(preamble_text: str) -> dict:
+    """Build the preamble from the text between PREAMBLE and CHAPTER ONE."""
     # Split into paragraphs, clean each
     lines = preamble_text.split('\n')
     paragraphs = []
@@ -346,7 +683,7 @@ def parse_preamble(text: str) -> dict:
     
     for line in lines:
         # Skip page markers
-        if re.search(r'Constitution of Kenya, 2010', line):
+        if PAGE_MARKER in line:
             continue
         
         stripped = line.strip()
@@ -500,7 +837,7 @@ def parse_fifth_schedule(text: str) -> dict:
         line = line.strip()
         
         # Skip page markers and empty lines
-        if not line or re.search(r'Constitution of Kenya, 2010', line):
+        if not line or PAGE_MARKER in line:
             continue
         
         # Check for chapter header
@@ -586,28 +923,9 @@ def parse_sixth_schedule(text: str) -> dict:
     }
 
 
-def parse_schedules(text: str) -> list:
-    """Parse all six schedules."""
-    schedules = []
-    
-    # Find where schedules start
-    schedules_start = re.search(r'SCHEDULES\s+FIRST\s+SCHEDULE', text, re.IGNORECASE)
-    if not schedules_start:
-        return schedules
-    
-    schedules_text = text[schedules_start.start():]
-    
-    # Define schedule boundaries
-    schedule_markers = [
-        (r'FIRST\s+SCHEDULE', r'SECOND\s+SCHEDULE'),
-        (r'SECOND\s+SCHEDULE', r'THIRD\s+SCHEDULE'),
-        (r'THIRD\s+SCHEDULE', r'FOURTH\s+SCHEDULE'),
-        (r'FOURTH\s+SCHEDULE', r'FIFTH\s+SCHEDULE'),
-        (r'FIFTH\s+SCHEDULE', r'SIXTH\s+SCHEDULE'),
-        (r'SIXTH\s+SCHEDULE', None)
-    ]
-    
-    parsers = [
+def schedule_parsers() -> list:
+    """Schedule parsers in SCHEDULE_ORDINALS order."""
+    return [
         parse_first_schedule,
         parse_second_schedule,
         parse_third_schedule,
@@ -615,42 +933,725 @@ def parse_schedules(text: str) -> list:
         parse_fifth_schedule,
         parse_sixth_schedule
     ]
+
+
+def parse_schedules(text: str, outline: Optional[dict] = None, cache: Optional[dict] = None) -> list:
+    """
+    Parse all six schedules.
+    outline is the result of build_outline(text), computed when not given.
+    With a cache (see cached_node), unchanged schedules are reused.
+    """
+    return list(iter_schedules(text, outline, cache))
+
+
+def iter_schedules(text: str, outline: Optional[dict] = None, cache: Optional[dict] = None) -> Iterator[dict]:
+    """Yield the schedules parse_schedules returns, one at a time."""
+    if outline is None:
+        outline = build_outline(text)
+    
+    parsers = schedule_parsers()
+    
+    for span in outline["schedules"]:
+        i = SCHEDULE_ORDINALS.index(span["ordinal"])
+        schedule_text = text[span["start"]:span["end"]]
+        with profile_stage(f"{span['ordinal'].title()} Schedule", "schedule"):
+            schedule = cached_node(cache, span["ordinal"], schedule_text, lambda: parsers[i](schedule_text))
+        yield schedule
+
+
+METADATA = {
+    "title": "The Constitution of Kenya, 2010",
+    "country": "Kenya",
+    "year": 2010
+}
+
+
+# ============================================================================
+# Document Outline
+# ============================================================================
+
+# A line that opens an article, as ARTICLE_START_PATTERN reads it
+FIRST_ARTICLE_PATTERN = re.compile(r'^[^\S\n]*\d+\.[^\S\n]', re.MULTILINE)
+
+
+def build_outline(text: str) -> dict:
+    """
+    Find every landmark the parse stages need in one pass over the
+    document, so no stage has to scan the whole text again:
+
+        lineStarts      offset of every line, for line_number
+        preamble        [start, end] of the preamble body, or None
+        chaptersEnd     where the chapters stop (the schedules heading)
+        chapters        {"start", "end", "parts"} per chapter heading;
+                        parts are the PART heading candidates inside it
+        schedules       {"ordinal", "start", "end"} per schedule found
+        firstArticle    offset of the first article line, or None
+
+    All offsets index into text. The outline is plain JSON, so it can be
+    kept in the parse cache next to the chapters (see parse_constitution).
+    """
+    headings = find_headings(text)
     
-    for i, (start_pattern, end_pattern) in enumerate(schedule_markers):
-        start_match = re.search(start_pattern, schedules_text, re.IGNORECASE)
-        if not start_match:
-            continue
-        
-        start = start_match.start()
-        if end_pattern:
-            end_match = re.search(end_pattern, schedules_text, re.IGNORECASE)
-            end = end_match.start() if end_match else len(schedules_text)
-        else:
-            end = len(schedules_text)
-        
-        schedule_text = schedules_text[start:end]
-        schedule = parsers[i](schedule_text)
-        schedules.append(schedule)
+    # Chapters end where the schedules start
+    schedules_start = next((h[0] for h in headings if h[2] == "schedules"), None)
+    chapters_end = len(text) if schedules_start is None else schedules_start
+    
+    chapter_matches = confirm_headings(
+        CHAPTER_PATTERN, text, (h[0] for h in headings if h[2] == "chapter"), chapters_end
+    )
+    part_offsets = [h[0] for h in headings if h[2] == "part" and h[0] < chapters_end]
     
-    return schedules
+    chapters = []
+    for i, match in enumerate(chapter_matches):
+        end = chapter_matches[i + 1].start() if i + 1 < len(chapter_matches) else chapters_end
+        chapters.append({
+            "start": match.start(),
+            "end": end,
+            "parts": [offset for offset in part_offsets if match.end() <= offset < end]
+        })
+    
+    schedules = []
+    if schedules_start is not None:
+        # First occurrence of each schedule heading after the start
+        positions = {}
+        for start, _, kind, ordinal in headings:
+            if kind == "schedule" and start >= schedules_start:
+                positions.setdefault(ordinal, start)
+        for i, ordinal in enumerate(SCHEDULE_ORDINALS):
+            if ordinal not in positions:
+                continue
+            if i + 1 < len(SCHEDULE_ORDINALS):
+                end = positions.get(SCHEDULE_ORDINALS[i + 1], len(text))
+            else:
+                end = len(text)
+            schedules.append({"ordinal": ordinal, "start": positions[ordinal], "end": end})
+    
+    line_starts = [0]
+    line_starts.extend(accumulate(len(line) + 1 for line in text.split('\n')[:-1]))
+    
+    first_article = None
+    if chapters:
+        match = FIRST_ARTICLE_PATTERN.search(text, chapters[0]["start"], chapters_end)
+        first_article = match.start() if match else None
+    
+    return {
+        "lineStarts": line_starts,
+        "preamble": preamble_bounds(text),
+        "chaptersEnd": chapters_end,
+        "chapters": chapters,
+        "schedules": schedules,
+        "firstArticle": first_article
+    }
+
+
+def line_number(outline: dict, offset: int) -> int:
+    """The 1-based line of the document that offset falls on."""
+    return bisect_right(outline["lineStarts"], offset)
+
+
+# ============================================================================
+# Incremental Parsing
+# ============================================================================
+
+# Parsed chapters and schedules are cached under a hash of their source text
+# and of this file, so editing either one invalidates the entry
+PARSER_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+PARSE_CACHE_LIMIT = 512
+
 
+def cached_node(cache: Optional[dict], kind: str, source: str, build) -> dict:
+    """
+    Return the node parsed from source, reusing the cached copy when this
+    parser version has already parsed the same source. Entries are stored
+    as JSON so each hit returns a fresh copy. The cache dict is kept in
+    least-recently-used order.
+    """
+    if cache is None:
+        return build()
+
+    key = hashlib.sha256(f"{PARSER_VERSION}\0{kind}\0{source}".encode('utf-8')).hexdigest()
+    entry = cache.pop(key, None)
+    if entry is None:
+        entry = json.dumps(build(), ensure_ascii=False)
+    cache[key] = entry
+    return json.loads(entry)
+
+
+def load_parse_cache(cache_path: Path) -> dict:
+    """Load a cache saved by save_parse_cache, or start an empty one."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != PARSER_VERSION:
+        return {}
+    return data.get("entries", {})
+
+
+def save_parse_cache(cache: dict, cache_path: Path):
+    """Save the most recently used PARSE_CACHE_LIMIT cache entries."""
+    entries = dict(list(cache.items())[-PARSE_CACHE_LIMIT:])
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump({"version": PARSER_VERSION, "entries": entries}, f, ensure_ascii=False)
 
-def parse_constitution(text: str) -> dict:
-    """Main parser function that orchestrates all parsing."""
+
+def parse_constitution(text: str, cache: Optional[dict] = None) -> dict:
+    """
+    Main parser function that orchestrates all parsing.
+    Pass a cache dict (e.g. from load_parse_cache) to re-parse only the
+    chapters and schedules whose source changed since it was filled.
+    """
+    with profile_stage("Outline", "outline"):
+        outline = cached_node(cache, "outline", text, lambda: build_outline(text))
+    with profile_stage("Preamble", "preamble"):
+        preamble = parse_preamble(text, outline)
     result = {
-        "metadata": {
-            "title": "The Constitution of Kenya, 2010",
-            "country": "Kenya",
-            "year": 2010
-        },
-        "preamble": parse_preamble(text),
-        "chapters": parse_chapters(text),
-        "schedules": parse_schedules(text)
+        "metadata": dict(METADATA),
+        "preamble": preamble,
+        "chapters": parse_chapters(text, outline, cache),
+        "schedules": parse_schedules(text, outline, cache)
     }
     
     return result
 
 
+def iter_parsed_constitution(text: str, cache: Optional[dict] = None) -> Iterator[tuple[str, dict]]:
+    """
+    Parse the constitution text like parse_constitution, yielding
+    ("preamble", node), ("chapter", node) and ("schedule", node) pairs as
+    each one is finished, in the same shape as iter_constitution.
+    """
+    outline = cached_node(cache, "outline", text, lambda: build_outline(text))
+    yield "preamble", parse_preamble(text, outline)
+    for chapter in iter_chapters(text, outline, cache):
+        yield "chapter", chapter
+    for schedule in iter_schedules(text, outline, cache):
+        yield "schedule", schedule
+
+
+def assemble_constitution(nodes: Iterable[tuple[str, dict]]) -> dict:
+    """Collect (kind, node) pairs into the parse_constitution structure."""
+    result = {
+        "metadata": dict(METADATA),
+        "preamble": {"paragraphs": []},
+        "chapters": [],
+        "schedules": []
+    }
+    for kind, node in nodes:
+        if kind == "preamble":
+            result["preamble"] = node
+        else:
+            result[kind + "s"].append(node)
+    return result
+
+
+def iter_constitution(lines: Iterable[str]) -> Iterator[tuple[str, dict]]:
+    """
+    Stream the constitution line by line and yield ("preamble", node),
+    ("chapter", node) and ("schedule", node) pairs as soon as each section
+    is complete.
+
+    Only the section currently being read is held in memory, so peak memory
+    is bounded by the largest chapter or schedule rather than the document.
+    Each line is searched together with the next line that has text in it
+    (blank lines in between stay with the first), so headings split over
+    two lines (e.g. "SCHEDULES" / "FIRST SCHEDULE") are still found.
+    """
+    parsers = schedule_parsers()
+    state = {
+        "carry": 0,              # chars of the next line already consumed
+        "preamble": None,        # preamble chunks while collecting
+        "preamble_done": False,
+        "chapter": None,         # header match of the chapter being read
+        "chapter_buffer": [],
+        "in_schedules": False,
+        "schedule": None,        # index into SCHEDULE_ORDINALS
+        "schedule_buffer": [],
+    }
+    finished = []
+
+    def feed_preamble(window: str, limit: int):
+        if state["preamble_done"]:
+            return
+        start = 0
+        if state["preamble"] is None:
+            match = PREAMBLE_START_PATTERN.search(window)
+            if not match or match.start() >= limit:
+                return
+            state["preamble"] = []
+            start = match.end()
+        end = PREAMBLE_END_PATTERN.search(window, start)
+        if end and end.start() < limit:
+            state["preamble"].append(window[start:end.start()])
+            finished.append(("preamble", build_preamble(''.join(state["preamble"]))))
+            state["preamble"] = None
+            state["preamble_done"] = True
+        else:
+            state["preamble"].append(window[start:limit])
+
+    def flush_chapter():
+        if state["chapter"] is not None:
+            chapter_text = ''.join(state["chapter_buffer"])
+            finished.append(("chapter", build_chapter(state["chapter"], chapter_text)))
+        state["chapter"] = None
+        state["chapter_buffer"] = []
+
+    def feed_chapters(window: str, start: int, limit: int) -> int:
+        pos = start
+        for match in CHAPTER_PATTERN.finditer(window, start):
+            if match.start() >= limit:
+                break
+            if state["chapter"] is not None:
+                state["chapter_buffer"].append(window[pos:match.start()])
+            flush_chapter()
+            state["chapter"] = match
+            pos = match.end()
+        if state["chapter"] is not None and pos < limit:
+            state["chapter_buffer"].append(window[pos:limit])
+        return pos
+
+    def flush_schedule():
+        if state["schedule"] is not None:
+            schedule_text = ''.join(state["schedule_buffer"])
+            finished.append(("schedule", parsers[state["schedule"]](schedule_text)))
+        state["schedule"] = None
+        state["schedule_buffer"] = []
+
+    def feed_schedules(window: str, start: int, limit: int):
+        pos = start
+        for match in SCHEDULE_HEADING_PATTERN.finditer(window, start):
+            if match.start() >= limit:
+                break
+            index = SCHEDULE_ORDINALS.index(match.group(1).upper())
+            current = state["schedule"]
+            if current is not None and index <= current:
+                continue
+            if current is not None:
+                state["schedule_buffer"].append(window[pos:match.start()])
+            flush_schedule()
+            state["schedule"] = index
+            pos = match.start()
+        if state["schedule"] is not None:
+            state["schedule_buffer"].append(window[pos:limit])
+
+    def feed(window: str, limit: int):
+        feed_preamble(window, limit)
+        start = state["carry"]
+        state["carry"] = 0
+        if not state["in_schedules"]:
+            schedules_start = SCHEDULES_START_PATTERN.search(window, start)
+            if not schedules_start or schedules_start.start() >= limit:
+                # A heading that runs into the next line consumes part of it
+                pos = feed_chapters(window, start, limit)
+                state["carry"] = max(0, pos - limit)
+                return
+            # The chapters end where the schedules begin
+            feed_chapters(window, start, schedules_start.start())
+            flush_chapter()
+            state["in_schedules"] = True
+            start = schedules_start.start()
+        feed_schedules(window, start, limit)
+
+    held = None
+    for line in lines:
+        if held is not None and not line.strip():
+            held += line
+            continue
+        if held is not None:
+            feed(held + line, len(held))
+            yield from finished
+            finished.clear()
+        held = line
+    if held is not None:
+        feed(held, len(held))
+
+    flush_chapter()
+    flush_schedule()
+    if not state["preamble_done"]:
+        finished.append(("preamble", {"paragraphs": []}))
+    yield from finished
+
+
+def stream_constitution(file_path: Path, workers: Optional[int] = None) -> Iterator[tuple[str, dict]]:
+    """
+    Stream a constitution text file (plain, .gz or .xz) through
+    iter_constitution. A PDF is streamed as its pages are extracted.
+    """
+    if Path(file_path).suffix.lower() == '.pdf':
+        from constitution_pdf import iter_pdf_lines
+        yield from iter_constitution(iter_pdf_lines(file_path, workers))
+        return
+    with open_constitution_text(file_path) as f:
+        yield from iter_constitution(f)
+
+
+def parse_constitution_stream(file_path: Path, workers: Optional[int] = None) -> dict:
+    """
+    Parse a constitution text file in streaming mode.
+    Returns the same structure as parse_constitution without ever holding
+    the full source text in memory.
+    """
+    return assemble_constitution(stream_constitution(file_path, workers))
+
+
+# ============================================================================
+# Memory-Mapped Parsing
+# ============================================================================
+
+# Byte-level anchors for the headings that split the document. Each hit is
+# confirmed by decoding a few lines there and applying the usual pattern.
+MAPPED_PREAMBLE_ANCHOR = re.compile(rb'preamble', re.IGNORECASE)
+MAPPED_CHAPTER_ANCHOR = re.compile(rb'chapter', re.IGNORECASE)
+MAPPED_SCHEDULES_ANCHOR = re.compile(rb'schedules', re.IGNORECASE)
+MAPPED_ORDINAL_ANCHOR = re.compile(
+    rb'(?=' + '|'.join(SCHEDULE_ORDINALS).encode('ascii') + rb')', re.IGNORECASE
+)
+MAPPED_CHUNK = 256
+# Every character a heading pattern can consume, case-insensitively
+HEADING_CHARS_PATTERN = re.compile(r'[A-Za-z\s,\-–—\u017f\u212a\u0130\u0131]*')
+
+
+def open_mapped_text(file_path: Path):
+    """
+    Memory-map an uncompressed constitution text file for reading.
+    Compressed inputs have no byte layout to map and are rejected.
+    """
+    if Path(file_path).suffix.lower() in ('.gz', '.xz'):
+        raise ValueError(f"Cannot memory-map compressed input {file_path}")
+    with open(file_path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            # Empty files cannot be mapped
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def translate_newlines(text: str) -> str:
+    """Translate \\r\\n and \\r line endings to \\n, as text-mode reads do."""
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def decode_span(buffer, start: int, end: int) -> str:
+    """Decode buffer[start:end] exactly as read_constitution_text would."""
+    return translate_newlines(str(buffer[start:end], 'utf-8'))
+
+
+def mapped_match(pattern: re.Pattern, buffer, pos: int, endpos: int):
+    """
+    Match a heading pattern at byte offset pos, decoding only as far as
+    the pattern could possibly read: heading patterns consume nothing but
+    letters, whitespace, commas and dashes, so decoding stops at the first
+    other character. Returns the match and the byte offset where it ends,
+    or (None, pos).
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    raw = ''
+    stop = pos
+    while stop < endpos:
+        start, stop = stop, min(stop + MAPPED_CHUNK, endpos)
+        raw += decoder.decode(buffer[start:stop], stop == endpos)
+        if HEADING_CHARS_PATTERN.match(raw).end() < len(raw):
+            break
+
+    window = translate_newlines(raw)
+    match = pattern.match(window)
+    if not match:
+        return None, pos
+
+    # Map the end back past any \r\n pairs that translation collapsed
+    end = match.end()
+    if len(window) != len(raw):
+        for collapsed, pair in enumerate(re.finditer('\r\n', raw)):
+            if pair.start() - collapsed >= end:
+                break
+            end += 1
+    return match, pos + len(raw[:end].encode('utf-8'))
+
+
+def outline_mapped(buffer) -> list:
+    """
+    Find the byte span of the preamble, every chapter and every schedule,
+    as {"kind", "start", "end"} dicts in document order, without decoding
+    the text between headings. The spans are exactly the regions that
+    parse_constitution hands to build_preamble, build_chapter and the
+    schedule parsers, so they double as source provenance for each node.
+    """
+    size = len(buffer)
+    outline = []
+
+    # Preamble: after the first PREAMBLE, up to the next CHAPTER ONE
+    anchor = MAPPED_PREAMBLE_ANCHOR.search(buffer)
+    if anchor:
+        match, _ = mapped_match(PREAMBLE_START_PATTERN, buffer, anchor.start(), size)
+        body_start = anchor.start() + len(match.group(0).encode('utf-8'))
+        for chapter in MAPPED_CHAPTER_ANCHOR.finditer(buffer, body_start):
+            if mapped_match(PREAMBLE_END_PATTERN, buffer, chapter.start(), size)[0]:
+                outline.append({"kind": "preamble", "start": body_start, "end": chapter.start()})
+                break
+
+    # Chapters end where the schedules begin
+    schedules_start = None
+    for anchor in MAPPED_SCHEDULES_ANCHOR.finditer(buffer):
+        if mapped_match(SCHEDULES_START_PATTERN, buffer, anchor.start(), size)[0]:
+            schedules_start = anchor.start()
+            break
+    chapters_end = size if schedules_start is None else schedules_start
+
+    starts = []
+    last_end = 0
+    for anchor in MAPPED_CHAPTER_ANCHOR.finditer(buffer, 0, chapters_end):
+        if anchor.start() < last_end:
+            continue
+        match, end = mapped_match(CHAPTER_PATTERN, buffer, anchor.start(), chapters_end)
+        if match:
+            starts.append(anchor.start())
+            last_end = end
+    for i, start in enumerate(starts):
+        end = starts[i + 1] if i + 1 < len(starts) else chapters_end
+        outline.append({"kind": "chapter", "start": start, "end": end})
+
+    if schedules_start is None:
+        return outline
+
+    # First heading of each schedule after the start
+    positions = {}
+    for anchor in MAPPED_ORDINAL_ANCHOR.finditer(buffer, schedules_start):
+        match, _ = mapped_match(SCHEDULE_HEADING_PATTERN, buffer, anchor.start(), size)
+        if match:
+            positions.setdefault(match.group(1).upper(), anchor.start())
+            if len(positions) == len(SCHEDULE_ORDINALS):
+                break
+    for i, ordinal in enumerate(SCHEDULE_ORDINALS):
+        if ordinal not in positions:
+            continue
+        if i + 1 < len(SCHEDULE_ORDINALS):
+            end = positions.get(SCHEDULE_ORDINALS[i + 1], size)
+        else:
+            end = size
+        outline.append({"kind": "schedule", "start": positions[ordinal], "end": end, "ordinal": ordinal})
+
+    return outline
+
+
+def materialize_node(buffer, span: dict) -> dict:
+    """Decode and parse one outline span into its preamble, chapter or schedule dict."""
+    text = decode_span(buffer, span["start"], span["end"])
+    if span["kind"] == "preamble":
+        return build_preamble(text)
+    if span["kind"] == "chapter":
+        match = CHAPTER_PATTERN.match(text)
+        return build_chapter(match, text[match.end():])
+    return schedule_parsers()[SCHEDULE_ORDINALS.index(span["ordinal"])](text)
+
+
+def iter_constitution_mapped(file_path: Path) -> Iterator[tuple[str, dict]]:
+    """Memory-map a text file and yield its (kind, node) pairs in document order."""
+    buffer = open_mapped_text(file_path)
+    try:
+        for span in outline_mapped(buffer):
+            yield span["kind"], materialize_node(buffer, span)
+    finally:
+        if isinstance(buffer, mmap.mmap):
+            buffer.close()
+
+
+def parse_constitution_mapped(file_path: Path) -> dict:
+    """
+    Parse a constitution text file through a memory map.
+    Returns the same structure as parse_constitution. Only the heading
+    windows and one chapter or schedule at a time are ever decoded.
+    """
+    return assemble_constitution(iter_constitution_mapped(file_path))
+
+
+# ============================================================================
+# Parallel Parsing
+# ============================================================================
+
+def parse_shared_span(name: str, size: int, span: dict) -> dict:
+    """
+    Parse one outline span of a document held in shared memory (see
+    iter_constitution_parallel). Runs in a worker process, which reads
+    only the bytes of its own span.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    buffer = shm.buf[:size]
+    try:
+        return materialize_node(buffer, span)
+    finally:
+        buffer.release()
+        shm.close()
+
+
+def iter_constitution_parallel(text: str, workers: Optional[int] = None) -> Iterator[tuple[str, dict]]:
+    """
+    Parse the constitution on a process pool and yield its (kind, node)
+    pairs in document order.
+
+    text is the document as read_constitution_text returns it. The text
+    is encoded once into a shared memory block and outlined with
+    outline_mapped; each worker then gets the block's name and the byte
+    span of one preamble, chapter or schedule, never a copy of the text.
+    The largest spans are handed out first so one long chapter does not
+    hold up the end of the run.
+    """
+    data = text.encode('utf-8')
+    # Shared memory blocks cannot be empty
+    shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+    try:
+        shm.buf[:len(data)] = data
+        buffer = shm.buf[:len(data)]
+        try:
+            outline = outline_mapped(buffer)
+        finally:
+            buffer.release()
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {}
+            for i in sorted(range(len(outline)), key=lambda i: outline[i]["start"] - outline[i]["end"]):
+                futures[i] = pool.submit(parse_shared_span, shm.name, len(data), outline[i])
+            for i, span in enumerate(outline):
+                yield span["kind"], futures[i].result()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def parse_constitution_parallel(text: str, workers: Optional[int] = None) -> dict:
+    """
+    Parse the constitution text on a process pool, one chapter or
+    schedule per task. Returns the same structure as parse_constitution.
+    """
+    return assemble_constitution(iter_constitution_parallel(text, workers))
+
+
+# ============================================================================
+# Pipeline Output
+# ============================================================================
+
+PIPELINE_QUEUE_SIZE = 4
+
+
+def dump_json_value(value, level: int) -> str:
+    """Serialize value as json.dump(..., indent=2) would at the given nesting level."""
+    return json.dumps(value, indent=2, ensure_ascii=False).replace('\n', '\n' + '  ' * level)
+
+
+def write_constitution_json(nodes: Iterable[tuple[str, dict]], f, dump=dump_json_value) -> dict:
+    """
+    Write (kind, node) pairs to f as they arrive, byte for byte as
+    json.dump(assemble_constitution(nodes), f, indent=2, ensure_ascii=False)
+    would. Each node is flushed as soon as it is written, so an interrupted
+    run leaves every finished chapter on disk. Nodes that arrive before the
+    preamble are held back until it does. dump serializes each value, as
+    dump_json_value does. Returns the node counts.
+    """
+    state = {"preamble": False, "section": None, "count": 0}
+    counts = {"chapters": 0, "schedules": 0}
+    held = []
+
+    def open_section(section: str):
+        if state["section"] == section:
+            return
+        if state["section"] == "schedules":
+            raise ValueError(f"{section} node after the schedules")
+        close_section()
+        if state["section"] is None and section == "schedules":
+            f.write(',\n  "chapters": []')
+        f.write(f',\n  "{section}": [')
+        state["section"] = section
+        state["count"] = 0
+
+    def close_section():
+        if state["section"] is not None:
+            f.write('\n  ]' if state["count"] else ']')
+
+    def write_node(kind: str, node: dict):
+        section = kind + "s"
+        open_section(section)
+        f.write(',\n    ' if state["count"] else '\n    ')
+        f.write(dump(node, 2))
+        state["count"] += 1
+        counts[section] += 1
+        f.flush()
+
+    def write_preamble(node: dict):
+        f.write(',\n  "preamble": ' + dump(node, 1))
+        state["preamble"] = True
+        for kind, held_node in held:
+            write_node(kind, held_node)
+        held.clear()
+
+    f.write('{\n  "metadata": ' + dump(METADATA, 1))
+    for kind, node in nodes:
+        if kind == "preamble":
+            write_preamble(node)
+        elif state["preamble"]:
+            write_node(kind, node)
+        else:
+            held.append((kind, node))
+
+    if not state["preamble"]:
+        write_preamble({"paragraphs": []})
+    if state["section"] is None:
+        f.write(',\n  "chapters": []')
+    if state["section"] != "schedules":
+        close_section()
+        f.write(',\n  "schedules": []')
+    else:
+        close_section()
+    f.write('\n}')
+    f.flush()
+    return counts
+
+
+def write_constitution_pipeline(nodes: Iterable[tuple[str, dict]], output_path: Path,
+                                queue_size: int = PIPELINE_QUEUE_SIZE) -> dict:
+    """
+    Parse on a background thread and write the JSON on this one.
+
+    The producer thread pulls (kind, node) pairs from nodes (any of
+    iter_parsed_constitution, stream_constitution or
+    iter_constitution_mapped) into a bounded queue, so parsing runs ahead of
+    the writer by at most queue_size nodes. Output goes to a .partial file
+    that replaces output_path once complete; after a crash the .partial file
+    keeps every node written so far. Returns the node counts.
+    """
+    items = queue.Queue(maxsize=queue_size)
+    done = object()
+
+    def produce():
+        try:
+            for item in nodes:
+                items.put(item)
+        except BaseException as e:
+            items.put(e)
+        items.put(done)
+
+    def consume() -> Iterator[tuple[str, dict]]:
+        while True:
+            item = items.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    producer = threading.Thread(target=produce, name="constitution-parser", daemon=True)
+    producer.start()
+
+    partial_path = output_path.with_name(output_path.name + '.partial')
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(partial_path, 'w', encoding='utf-8') as f:
+        counts = write_constitution_json(consume(), f)
+    producer.join()
+    os.replace(partial_path, output_path)
+    return counts
+
+
 def print_summary(data: dict):
     """Print parsing summary."""
     print("=" * 60)
@@ -694,12 +1695,201 @@ def print_summary(data: dict):
         print(f"  Schedule {schedule['number']}: {schedule['title'][:40]}... ({schedule['type']})")
 
 
+def validate_result(data: dict) -> list:
+    """Return warnings for a parse that looks incomplete."""
+    issues = []
+
+    # The app's constitution_of_kenya.json keeps the preamble as one string
+    preamble = data.get('preamble')
+    if not (preamble.get('paragraphs') if isinstance(preamble, dict) else preamble):
+        issues.append("Preamble is missing")
+
+    chapters = data.get('chapters', [])
+    chapter_sizes = [
+        len(chapter.get('articles', [])) + sum(len(part.get('articles', [])) for part in chapter.get('parts', []))
+        for chapter in chapters
+    ]
+    # The table of contents is also reported as chapters, all of them empty
+    found = len({chapter.get('number') for chapter, size in zip(chapters, chapter_sizes) if size})
+    if found != 18:
+        issues.append(f"Expected 18 chapters, found {found}")
+
+    total_articles = sum(chapter_sizes)
+    if total_articles < 200:
+        issues.append(f"Found only {total_articles} articles (expected ~264)")
+
+    schedules = data.get('schedules', [])
+    if len(schedules) != 6:
+        issues.append(f"Expected 6 schedules, found {len(schedules)}")
+
+    return issues
+
+
+# ============================================================================
+# Watch Mode
+# ============================================================================
+
+# Seconds between checks of the input file
+WATCH_INTERVAL = 0.025
+
+
+def file_signature(path: Path) -> Optional[tuple]:
+    """Inode, size and modification time of path, which saving it changes. None while it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def memoized_dump(memo: dict):
+    """
+    A dump_json_value for write_constitution_json that reuses the indented
+    JSON of values unchanged since the previous build. Compact JSON, which
+    the C encoder writes quickly, is the key. memo carries the entries
+    from one build to the next and keeps only those used by this one.
+    """
+    previous = dict(memo)
+    memo.clear()
+
+    def dump(value, level: int) -> str:
+        key = (json.dumps(value, ensure_ascii=False), level)
+        text = memo.get(key) or previous.get(key)
+        if text is None:
+            text = dump_json_value(value, level)
+        memo[key] = text
+        return text
+
+    return dump
+
+
+def rebuild_constitution(input_path: Path, output_path: Path, cache: dict, memo: dict,
+                         workers: Optional[int] = None) -> dict:
+    """
+    Parse input_path again, re-parsing only the chapters and schedules
+    whose text changed since they went into cache, and replace output_path
+    with the new JSON in one rename. Returns the node counts, the number of
+    nodes parsed afresh and the seconds taken.
+    """
+    start = time.perf_counter()
+    text = read_constitution_text(input_path, workers)
+    cached = len(cache)
+
+    partial_path = output_path.with_name(output_path.name + '.partial')
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(partial_path, 'w', encoding='utf-8') as f:
+        counts = write_constitution_json(iter_parsed_constitution(text, cache), f, memoized_dump(memo))
+    os.replace(partial_path, output_path)
+
+    reparsed = len(cache) - cached
+    # Keep only the most recently used entries, as save_parse_cache does
+    for key in list(cache)[:-PARSE_CACHE_LIMIT]:
+        del cache[key]
+    return {**counts, "reparsed": reparsed, "seconds": time.perf_counter() - start}
+
+
+def main_watch(args, input_path: Path, output_path: Path) -> int:
+    """
+    Run --watch: rebuild the output every time the input changes, keeping
+    the parse cache and serialized nodes in memory between rebuilds.
+    """
+    cache = load_parse_cache(Path(args.cache)) if args.cache else {}
+    memo = {}
+    signature = None
+    print(f"Watching {input_path} (Ctrl+C to stop)...")
+    try:
+        while True:
+            current = file_signature(input_path)
+            if current is not None and current != signature:
+                signature = current
+                stamp = time.strftime('%H:%M:%S')
+                try:
+                    stats = rebuild_constitution(input_path, output_path, cache, memo, args.workers)
+                except Exception as e:
+                    # Keep watching: the next save may fix the input
+                    print(f"[{stamp}] ERROR: {type(e).__name__}: {e}")
+                else:
+                    print(f"[{stamp}] {output_path.name}: {stats['chapters']} chapters, "
+                          f"{stats['schedules']} schedules, {stats['reparsed']} re-parsed "
+                          f"in {stats['seconds'] * 1000:.0f} ms")
+                    if args.bundle or args.index or args.trigrams or args.references or args.shards or args.compress:
+                        with open(output_path, 'r', encoding='utf-8') as f:
+                            write_artifacts(json.load(f), args, input_path.stem, output_path)
+            time.sleep(WATCH_INTERVAL)
+    except KeyboardInterrupt:
+        print()
+        print("Stopped watching.")
+    finally:
+        if args.cache:
+            save_parse_cache(cache, Path(args.cache))
+    return 0
+
+
+# ============================================================================
+# Batch Mode
+# ============================================================================
+
+BATCH_SUFFIXES = ('.txt', '.txt.gz', '.txt.xz', '.pdf')
+
+
+def parse_batch_input(input_path: str) -> dict:
+    """
+    Parse one --batch input. Runs in a worker process, so a PDF is
+    extracted in that process rather than on a pool of its own.
+    """
+    return parse_constitution(read_constitution_text(input_path, workers=1))
+
+
+def parse_batch_input_stream(input_path: str) -> dict:
+    """Parse one --batch --stream input line by line."""
+    return parse_constitution_stream(input_path, workers=1)
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Parse Constitution of Kenya 2010")
+    parser.add_argument('input_file', nargs='?', help="Input text file (.txt, .gz or .xz) or PDF")
+    parser.add_argument('-o', '--output', help="Output JSON file")
+    parser.add_argument('--stream', action='store_true',
+                        help="Read the input line by line instead of loading it into memory")
+    parser.add_argument('--mmap', action='store_true',
+                        help="Memory-map the input and decode one chapter or schedule at a time")
+    parser.add_argument('--parallel', action='store_true',
+                        help="Parse chapters and schedules concurrently on a process pool (see -j)")
+    parser.add_argument('--pipeline', action='store_true',
+                        help="Write each chapter to the output while the rest is still being parsed")
+    parser.add_argument('--bundle', metavar='PATH',
+                        help="Also write a binary bundle (see constitution_bundle.py)")
+    parser.add_argument('--index', metavar='PATH',
+                        help="Also write a ranked search index (see constitution_search.py)")
+    parser.add_argument('--trigrams', metavar='PATH',
+                        help="Also write a substring search index (see constitution_trigrams.py)")
+    parser.add_argument('--references', metavar='PATH',
+                        help="Also write a cross-reference graph (see constitution_references.py)")
+    parser.add_argument('--shards', metavar='DIR',
+                        help="Also write a manifest and one file per chapter and schedule (see constitution_shards.py)")
+    parser.add_argument('--compress', metavar='FORMATS',
+                        help="Also write the output compressed, e.g. gzip,xz,zstd (see constitution_compress.py)")
+    parser.add_argument('--profile', action='store_true',
+                        help="Time each stage and write a Chrome trace and a text summary next to the output")
+    parser.add_argument('--cache', metavar='PATH',
+                        help="Reuse chapters and schedules parsed into this cache file by earlier runs")
+    parser.add_argument('--watch', action='store_true',
+                        help="Keep running and rebuild the output whenever the input file changes")
+    parser.add_argument('--batch', metavar='SOURCE',
+                        help="Parse every text file in a directory or listed in a manifest")
+    parser.add_argument('-j', '--workers', type=int,
+                        help="Worker processes for --batch, --parallel and PDF extraction (default: one per CPU)")
+    args = parser.parse_args()
+
+    if args.batch:
+        return main_batch(args)
+    
     # Paths
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
-    input_path = project_root / "composeApp" / "src" / "commonMain" / "composeResources" / "files" / "The_Constitution_of_Kenya_2010.txt"
-    output_path = project_root / "composeApp" / "src" / "commonMain" / "composeResources" / "files" / "constitution.json"
+    files_dir = project_root / "composeApp" / "src" / "commonMain" / "composeResources" / "files"
+    input_path = Path(args.input_file) if args.input_file else files_dir / "The_Constitution_of_Kenya_2010.txt"
+    output_path = Path(args.output) if args.output else files_dir / "constitution.json"
     
     print("=" * 60)
     print("Constitution of Kenya Parser")
@@ -711,19 +1901,79 @@ def main():
     if not input_path.exists():
         print(f"ERROR: Input file not found at {input_path}")
         return 1
-    
-    # Read text
-    print("Reading constitution text...")
-    text = read_constitution_text(input_path)
-    print(f"Text length: {len(text)} characters")
-    print()
-    
-    # Parse
-    print("Parsing constitution...")
-    constitution = parse_constitution(text)
+
+    if args.mmap and input_path.suffix.lower() in ('.gz', '.xz', '.pdf'):
+        print("ERROR: --mmap needs an uncompressed text input file")
+        return 1
+
+    if input_path.suffix.lower() == '.pdf':
+        from constitution_pdf import pypdf
+        if pypdf is None:
+            print("ERROR: PDF input needs the pypdf package (pip install pypdf)")
+            return 1
+
+    if args.compress:
+        from constitution_compress import available_formats
+        unknown = [f for f in args.compress.split(',') if f.strip() and f.strip() not in available_formats()]
+        if unknown:
+            print(f"ERROR: --compress format not available: {', '.join(unknown)} "
+                  f"(available: {', '.join(available_formats())})")
+            return 1
+
+    if args.parallel and (args.stream or args.mmap or args.cache):
+        print("ERROR: --parallel cannot be combined with --stream, --mmap or --cache")
+        return 1
+
+    if args.profile and (args.stream or args.mmap or args.parallel or args.pipeline):
+        print("ERROR: --profile works with the default in-memory parse only")
+        return 1
+
+    if args.watch and (args.stream or args.mmap or args.parallel or args.pipeline or args.profile):
+        print("ERROR: --watch works with the default in-memory parse only")
+        return 1
+
+    if args.watch:
+        return main_watch(args, input_path, output_path)
+
+    if args.pipeline:
+        return main_pipeline(args, input_path, output_path)
+    
+    if args.stream:
+        print("Parsing constitution (streaming)...")
+        constitution = parse_constitution_stream(input_path, args.workers)
+    elif args.mmap:
+        print("Parsing constitution (memory-mapped)...")
+        constitution = parse_constitution_mapped(input_path)
+    elif args.parallel:
+        print(f"Parsing constitution (parallel, {args.workers or os.cpu_count()} workers)...")
+        constitution = parse_constitution_parallel(read_constitution_text(input_path, args.workers), args.workers)
+    else:
+        # Read text
+        print("Reading constitution text...")
+        text = read_constitution_text(input_path, args.workers)
+        print(f"Text length: {len(text)} characters")
+        print()
+        
+        # Parse
+        print("Parsing constitution...")
+        cache = load_parse_cache(Path(args.cache)) if args.cache else None
+        if args.profile:
+            start_profile()
+            with profile_stage("parse_constitution", "parse"):
+                constitution = parse_constitution(text, cache)
+            profile_events = stop_profile()
+        else:
+            constitution = parse_constitution(text, cache)
+        if cache is not None:
+            save_parse_cache(cache, Path(args.cache))
     
     # Print summary
     print_summary(constitution)
+    issues = validate_result(constitution)
+    if issues:
+        print("\nWarnings:")
+        for issue in issues:
+            print(f"  - {issue}")
     print()
     
     # Save JSON
@@ -735,6 +1985,9 @@ def main():
     
     print(f"JSON saved to: {output_path}")
     print(f"JSON size: {output_path.stat().st_size:,} bytes")
+    write_artifacts(constitution, args, input_path.stem, output_path)
+    if args.profile:
+        print_profile(profile_events, output_path)
     print()
     print("=" * 60)
     print("SUCCESS!")
@@ -743,5 +1996,80 @@ def main():
     return 0
 
 
+def write_artifacts(constitution: dict, args, source: str, output_path: Path):
+    """Write the optional --bundle, --index, --trigrams, --references, --shards and --compress artifacts."""
+    if args.bundle:
+        from constitution_bundle import write_bundle
+        write_bundle(constitution, Path(args.bundle))
+        print(f"Bundle saved to: {args.bundle} ({Path(args.bundle).stat().st_size:,} bytes)")
+    if args.index:
+        from constitution_search import build_search_index, write_search_index
+        write_search_index(build_search_index(constitution), Path(args.index))
+        print(f"Search index saved to: {args.index}")
+    if args.trigrams:
+        from constitution_trigrams import build_trigram_index, write_trigram_index
+        write_trigram_index(build_trigram_index({source: constitution}), Path(args.trigrams))
+        print(f"Trigram index saved to: {args.trigrams}")
+    if args.references:
+        from constitution_references import build_reference_graph, write_reference_graph
+        write_reference_graph(build_reference_graph(constitution), Path(args.references))
+        print(f"Reference graph saved to: {args.references}")
+    if args.shards:
+        from constitution_shards import write_shards
+        manifest = write_shards(constitution, Path(args.shards))
+        print(f"Shards saved to: {args.shards} ({len(manifest['chapters'])} chapters, "
+              f"{len(manifest['schedules'])} schedules)")
+    if args.compress:
+        from constitution_compress import write_compressed_variants
+        formats = [f.strip() for f in args.compress.split(',') if f.strip()]
+        for path in write_compressed_variants(output_path, formats):
+            print(f"Compressed output saved to: {path} ({path.stat().st_size:,} bytes)")
+
+
+def main_pipeline(args, input_path: Path, output_path: Path) -> int:
+    """Run --pipeline: parse on a background thread while writing the JSON."""
+    cache = None
+    if args.stream:
+        print("Parsing constitution (streaming, pipelined)...")
+        nodes = stream_constitution(input_path, args.workers)
+    elif args.mmap:
+        print("Parsing constitution (memory-mapped, pipelined)...")
+        nodes = iter_constitution_mapped(input_path)
+    elif args.parallel:
+        print(f"Parsing constitution (parallel, {args.workers or os.cpu_count()} workers, pipelined)...")
+        nodes = iter_constitution_parallel(read_constitution_text(input_path, args.workers), args.workers)
+    else:
+        print("Parsing constitution (pipelined)...")
+        cache = load_parse_cache(Path(args.cache)) if args.cache else None
+        nodes = iter_parsed_constitution(read_constitution_text(input_path, args.workers), cache)
+
+    counts = write_constitution_pipeline(nodes, output_path)
+    if cache is not None:
+        save_parse_cache(cache, Path(args.cache))
+
+    print(f"Chapters: {counts['chapters']}")
+    print(f"Schedules: {counts['schedules']}")
+    print()
+    print(f"JSON saved to: {output_path}")
+    print(f"JSON size: {output_path.stat().st_size:,} bytes")
+    if args.bundle or args.index or args.trigrams or args.references or args.shards or args.compress:
+        # The pipeline kept no tree in memory, so read back what it wrote
+        with open(output_path, 'r', encoding='utf-8') as f:
+            write_artifacts(json.load(f), args, input_path.stem, output_path)
+    print()
+    print("=" * 60)
+    print("SUCCESS!")
+    print("=" * 60)
+
+    return 0
+
+
+def main_batch(args) -> int:
+    """Run --batch through parse_batch.py with this parser's parse and validate functions."""
+    from parse_batch import main_batch as run_batch_mode
+    parse = parse_batch_input_stream if args.stream else parse_batch_input
+    return run_batch_mode(args, parse, validate_result, BATCH_SUFFIXES)
+
+
 if __name__ == "__main__":
     exit(main())
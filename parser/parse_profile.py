@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Per-stage profiler shared by both constitution parsers.
+
+parser/parse_constitution.py and the app's composeResources
+parse_constitution.py wrap their stages (outline, preamble, every chapter,
+article and schedule) in profile_stage. Outside --profile that costs one
+check per stage; between start_profile and stop_profile each stage records
+its wall time, the compiled regex calls made inside it and its tracemalloc
+peak, as Chrome trace events.
+
+Usage:
+    from parse_profile import profile_stage, start_profile, stop_profile, print_profile
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+
+# The active profile while --profile runs, None otherwise
+PROFILER: Optional[dict] = None
+PROFILE_SUMMARY_LINES = 15
+
+
+def start_profile():
+    """
+    Start recording stages: wall time, calls to compiled regex methods (via
+    sys.setprofile) and tracemalloc peak memory. Both hooks slow the parse,
+    so profiled times are for comparing stages, not runs.
+    """
+    global PROFILER
+    tracemalloc.start()
+    PROFILER = {"origin": time.perf_counter(), "stack": [], "events": []}
+    sys.setprofile(count_regex_call)
+
+
+def stop_profile() -> list:
+    """Stop recording and return the finished stages as trace events."""
+    global PROFILER
+    sys.setprofile(None)
+    tracemalloc.stop()
+    events = PROFILER["events"]
+    PROFILER = None
+    return events
+
+
+def count_regex_call(frame, event, arg):
+    """sys.setprofile hook: count a regex call against every open stage."""
+    if event == 'c_call' and type(getattr(arg, '__self__', None)) is re.Pattern:
+        for stage in PROFILER["stack"]:
+            stage["regexCalls"] += 1
+
+
+@contextmanager
+def profile_stage(name: str, category: str):
+    """Record the enclosed work as one stage when profiling; do nothing otherwise."""
+    if PROFILER is None:
+        yield
+        return
+
+    stack = PROFILER["stack"]
+    current, peak = tracemalloc.get_traced_memory()
+    if stack:
+        stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+    tracemalloc.reset_peak()
+    stage = {"base": current, "peak": current, "regexCalls": 0, "start": time.perf_counter()}
+    stack.append(stage)
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        stack.pop()
+        stage["peak"] = max(stage["peak"], tracemalloc.get_traced_memory()[1])
+        if stack:
+            stack[-1]["peak"] = max(stack[-1]["peak"], stage["peak"])
+        PROFILER["events"].append({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((stage["start"] - PROFILER["origin"]) * 1e6, 1),
+            "dur": round((end - stage["start"]) * 1e6, 1),
+            "pid": os.getpid(),
+            "tid": 1,
+            "args": {"regexCalls": stage["regexCalls"], "peakBytes": stage["peak"] - stage["base"]},
+        })
+
+
+def profile_summary(events: list) -> list:
+    """Text summary lines: totals per category, then every stage by time, slowest first."""
+    lines = [f"{'category':<12}{'stages':>8}{'total ms':>12}{'regex calls':>14}"]
+    totals = {}
+    for event in events:
+        total = totals.setdefault(event["cat"], [0, 0.0, 0])
+        total[0] += 1
+        total[1] += event["dur"] / 1000
+        total[2] += event["args"]["regexCalls"]
+    for category, (count, ms, calls) in totals.items():
+        lines.append(f"{category:<12}{count:>8}{ms:>12.1f}{calls:>14,}")
+    lines.append("")
+    lines.append(f"{'stage':<32}{'ms':>10}{'regex calls':>14}{'peak KiB':>12}")
+    for event in sorted(events, key=lambda e: e["dur"], reverse=True):
+        lines.append(f"{event['name']:<32}{event['dur'] / 1000:>10.2f}"
+                     f"{event['args']['regexCalls']:>14,}{event['args']['peakBytes'] / 1024:>12.1f}")
+    return lines
+
+
+def write_profile(events: list, output_path: Path) -> tuple[Path, Path]:
+    """
+    Write the Chrome trace (load it in chrome://tracing or Perfetto) and the
+    text summary next to output_path. Returns both paths.
+    """
+    output_path = Path(output_path)
+    trace_path = output_path.with_suffix('.trace.json')
+    summary_path = output_path.with_suffix('.profile.txt')
+    with open(trace_path, 'w', encoding='utf-8') as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    summary_path.write_text('\n'.join(profile_summary(events)) + '\n', encoding='utf-8')
+    return trace_path, summary_path
+
+
+def print_profile(events: list, output_path: Path):
+    """Write the profile files and print the top of the summary."""
+    trace_path, summary_path = write_profile(events, output_path)
+    print()
+    print("Profile (slowest stages):")
+    lines = profile_summary(events)
+    for line in lines[:lines.index("") + 2 + PROFILE_SUMMARY_LINES]:
+        print(f"  {line}")
+    print(f"Trace saved to: {trace_path}")
+    print(f"Summary saved to: {summary_path}")
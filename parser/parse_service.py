@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Local parse service for the constitution parser.
+
+Serves parse_constitution and validate_result over HTTP on localhost (or
+on a Unix socket), so a caller parses documents without starting a new
+interpreter for each one. Requests that arrive together are gathered
+into batches of up to --batch-size and each batch runs as one task on a
+pool of worker processes, which are started and warmed up before the
+first request.
+
+Load is bounded: at most --queue requests wait for a batch, and one more
+is answered 503 at once. A request not answered within --timeout seconds
+gets 504.
+
+Endpoints:
+    POST /parse       body: constitution text (UTF-8); returns the parsed JSON
+    POST /validate    body: parsed constitution JSON; returns {"warnings": [...]}
+    GET  /health      returns queue and batch counters
+
+Usage:
+    python parse_service.py [--host HOST] [--port PORT | --unix PATH] [-j WORKERS]
+                            [--batch-size N] [--batch-window MS] [--queue N] [--timeout SECONDS]
+
+Try it with:
+    curl --data-binary @The_Constitution_of_Kenya_2010.txt http://127.0.0.1:8754/parse
+"""
+
+import os
+import json
+import time
+import signal
+import asyncio
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from parse_constitution import parse_constitution, validate_result
+
+
+DEFAULT_PORT = 8754
+# Largest request body accepted, in bytes
+MAX_BODY_BYTES = 64 * 1024 * 1024
+MAX_HEADER_LINES = 100
+
+HTTP_REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+ENDPOINTS = {"/parse": "parse", "/validate": "validate"}
+
+
+class RequestError(Exception):
+    """A malformed or oversized request, answered with the HTTP status it carries."""
+
+    def __init__(self, status: int):
+        super().__init__(status)
+        self.status = status
+
+
+# ============================================================================
+# Worker Side
+# ============================================================================
+
+def run_job(kind: str, body: bytes) -> tuple[int, bytes]:
+    """Run one request in a worker process. Returns the HTTP status and JSON body."""
+    try:
+        text = body.decode('utf-8')
+        if kind == "parse":
+            result = parse_constitution(text)
+        else:
+            data = json.loads(text)
+            if not isinstance(data, dict):
+                return 400, error_body("Expected a parsed constitution JSON object")
+            result = {"warnings": validate_result(data)}
+    except (UnicodeDecodeError, ValueError) as e:
+        return 400, error_body(f"{type(e).__name__}: {e}")
+    except Exception as e:
+        return 500, error_body(f"{type(e).__name__}: {e}")
+    return 200, json.dumps(result, ensure_ascii=False).encode('utf-8')
+
+
+def run_batch(jobs: list) -> list:
+    """
+    Run a batch of (kind, body) requests in one worker process, in order.
+    Identical requests in the batch are run once.
+    """
+    results = {}
+    for job in jobs:
+        if job not in results:
+            results[job] = run_job(*job)
+    return [results[job] for job in jobs]
+
+
+def warm_worker() -> int:
+    """Parse an empty document, so the first real request finds a warm worker."""
+    parse_constitution("")
+    return os.getpid()
+
+
+def error_body(message: str) -> bytes:
+    """A JSON error response body."""
+    return json.dumps({"error": message}, ensure_ascii=False).encode('utf-8')
+
+
+# ============================================================================
+# Batching
+# ============================================================================
+
+class ParseService:
+    """
+    Queues requests and feeds them to the process pool in batches. At most
+    one batch per worker is in flight; while all are busy, requests wait
+    in a queue of queue_limit and the ones that do not fit are refused.
+    """
+
+    def __init__(self, workers: Optional[int] = None, batch_size: int = 8, batch_window: float = 0.005,
+                 queue_limit: int = 64, timeout: float = 30.0):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.timeout = timeout
+        self.queue = asyncio.Queue(maxsize=queue_limit)
+        self.slots = asyncio.Semaphore(self.workers)
+        self.pool = None
+        self.batcher = None
+        self.running = set()
+        self.stats = {"requests": 0, "batches": 0, "rejected": 0, "timeouts": 0}
+
+    async def start(self):
+        """Start the worker processes, wait until each has warmed up, and start batching."""
+        loop = asyncio.get_running_loop()
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        await asyncio.gather(*(loop.run_in_executor(self.pool, warm_worker) for _ in range(self.workers)))
+        self.batcher = asyncio.create_task(self.run_batches())
+
+    async def stop(self):
+        """Stop batching and shut the pool down, dropping queued work."""
+        if self.batcher:
+            self.batcher.cancel()
+        if self.pool:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+
+    async def submit(self, kind: str, body: bytes) -> tuple[int, bytes]:
+        """Queue one request and wait for its status and JSON body."""
+        self.stats["requests"] += 1
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((kind, body, future))
+        except asyncio.QueueFull:
+            self.stats["rejected"] += 1
+            return 503, error_body("Too many requests queued, retry later")
+        try:
+            return await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            return 504, error_body(f"No result within {self.timeout:g} seconds")
+
+    async def next_batch(self) -> list:
+        """The next request, plus whatever else arrives within batch_window, up to batch_size."""
+        batch = [await self.queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.batch_window
+        while len(batch) < self.batch_size:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        # Requests that timed out while queued need no work
+        return [item for item in batch if not item[2].done()]
+
+    async def run_batches(self):
+        """Take batches off the queue while a worker is free."""
+        while True:
+            await self.slots.acquire()
+            batch = await self.next_batch()
+            if not batch:
+                self.slots.release()
+                continue
+            self.stats["batches"] += 1
+            task = asyncio.create_task(self.run_on_pool(batch))
+            self.running.add(task)
+            task.add_done_callback(self.running.discard)
+
+    async def run_on_pool(self, batch: list):
+        """Run one batch on a worker and hand each request its result."""
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(self.pool, run_batch, [(kind, body) for kind, body, _ in batch])
+        except Exception as e:
+            results = [(500, error_body(f"{type(e).__name__}: {e}"))] * len(batch)
+        finally:
+            self.slots.release()
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+# ============================================================================
+# HTTP
+# ============================================================================
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[tuple]:
+    """
+    Read one HTTP/1.1 request. Returns (method, path, headers, body), or
+    None when the client closed the connection. Raises RequestError on a
+    malformed or oversized request.
+    """
+    line = await reader.readline()
+    if not line:
+        return None
+    parts = line.decode('latin-1').split()
+    if len(parts) != 3:
+        raise RequestError(400)
+    method, target, _ = parts
+
+    headers = {}
+    for _ in range(MAX_HEADER_LINES):
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    else:
+        raise RequestError(400)
+
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        raise RequestError(400)
+    if length < 0:
+        raise RequestError(400)
+    if length > MAX_BODY_BYTES:
+        raise RequestError(413)
+    body = await reader.readexactly(length) if length else b''
+    return method, target.split('?', 1)[0], headers, body
+
+
+def write_response(writer: asyncio.StreamWriter, status: int, body: bytes, keep_alive: bool):
+    """Write an HTTP/1.1 response with a JSON body."""
+    head = (f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    writer.write(head.encode('latin-1') + body)
+
+
+async def handle_connection(service: ParseService, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Answer requests on one connection until the client closes it or asks to."""
+    try:
+        while True:
+            try:
+                request = await read_request(reader)
+            except RequestError as e:
+                write_response(writer, e.status, error_body(HTTP_REASONS[e.status]), False)
+                break
+            except asyncio.IncompleteReadError:
+                break
+            if request is None:
+                break
+            method, path, headers, body = request
+            keep_alive = headers.get('connection', '').lower() != 'close'
+
+            if path == "/health" and method == "GET":
+                status, payload = 200, json.dumps({
+                    **service.stats, "queued": service.queue.qsize(), "workers": service.workers
+                }).encode('utf-8')
+            elif path in ENDPOINTS and method == "POST":
+                status, payload = await service.submit(ENDPOINTS[path], body)
+            elif path in ENDPOINTS or path == "/health":
+                status, payload = 405, error_body(f"{method} not allowed on {path}")
+            else:
+                status, payload = 404, error_body(f"No endpoint {path}")
+
+            write_response(writer, status, payload, keep_alive)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(args):
+    """Warm up the pool, then serve until cancelled."""
+    service = ParseService(args.workers, args.batch_size, args.batch_window / 1000, args.queue, args.timeout)
+    start = time.perf_counter()
+    await service.start()
+    print(f"Workers: {service.workers} (warm in {time.perf_counter() - start:.2f}s)")
+
+    handler = lambda reader, writer: handle_connection(service, reader, writer)
+    if args.unix:
+        server = await asyncio.start_unix_server(handler, path=args.unix)
+        print(f"Listening on unix:{args.unix}")
+    else:
+        server = await asyncio.start_server(handler, args.host, args.port)
+        print(f"Listening on http://{args.host}:{args.port}")
+    print("Press Ctrl+C to stop.")
+    # Shut down cleanly when a process manager stops the service
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+        if args.unix and os.path.exists(args.unix):
+            os.unlink(args.unix)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the constitution parser over local HTTP")
+    parser.add_argument('--host', default='127.0.0.1', help="Address to listen on (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"TCP port (default: {DEFAULT_PORT})")
+    parser.add_argument('--unix', metavar='PATH', help="Listen on a Unix socket instead of TCP")
+    parser.add_argument('-j', '--workers', type=int, help="Worker processes (default: one per CPU)")
+    parser.add_argument('--batch-size', type=int, default=8, help="Most requests run as one batch")
+    parser.add_argument('--batch-window', type=float, default=5.0,
+                        help="Milliseconds to wait for more requests to join a batch")
+    parser.add_argument('--queue', type=int, default=64, help="Requests that may wait; more get 503")
+    parser.add_argument('--timeout', type=float, default=30.0, help="Seconds before a request gets 504")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Constitution Parse Service")
+    print("=" * 60)
+    try:
+        asyncio.run(serve(args))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print()
+        print("Stopped.")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())